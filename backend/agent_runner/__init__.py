@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Optional, Type
 from uuid import UUID
 
@@ -36,8 +37,11 @@ _registry: Dict[str, Type[AgentRunner]] = {}
 
 def register_runner(name: str, runner_cls: Type[AgentRunner]):
     _registry[name] = runner_cls
+    get_runner.cache_clear()
 
 
+# Runners hold no per-job state, so one shared instance per name is reused across requests.
+@lru_cache(maxsize=16)
 def get_runner(name: str) -> AgentRunner:
     runner_cls = _registry.get(name)
     if not runner_cls:
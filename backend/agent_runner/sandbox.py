@@ -854,7 +854,7 @@ class SandboxKilocodeRunner(AgentRunner):
                             asyncio.create_task(asyncio.to_thread(update_job, job.id, pr_url=pr_url, updated_at=datetime.now(UTC)))
                             asyncio.create_task(asyncio.to_thread(
                                 update_cluster,
-                                str(job.project_id),
+                                job.project_id,
                                 job.cluster_id,
                                 github_pr_url=pr_url,
                                 updated_at=datetime.now(UTC),
@@ -909,7 +909,7 @@ class SandboxKilocodeRunner(AgentRunner):
                     }
                     await asyncio.to_thread(
                         update_cluster,
-                        str(job.project_id),
+                        job.project_id,
                         job.cluster_id,
                         **cluster_updates,
                     )
@@ -1000,7 +1000,7 @@ class SandboxKilocodeRunner(AgentRunner):
                 # update_cluster needs project_id first
                 await asyncio.to_thread(
                     update_cluster,
-                    str(job.project_id),
+                    job.project_id,
                     job.cluster_id,
                     status="failed",
                     error_message=error,
@@ -7,6 +7,7 @@ from Vercel Blob storage.
 
 import os
 import logging
+from functools import lru_cache
 from uuid import UUID
 from typing import Optional
 
@@ -77,6 +78,20 @@ def fetch_job_logs_from_blob(blob_url: str) -> str:
         raise
 
 
+@lru_cache(maxsize=256)
+def fetch_job_logs_cached(blob_url: str) -> str:
+    """
+    Retrieve job logs from a Vercel Blob URL, reusing previously downloaded content.
+
+    Logs are only archived once a job has finished, so the blob behind a URL never
+    changes and can be cached by URL. Failed fetches raise and are not cached.
+
+    Returns:
+        str: The blob's content decoded as text.
+    """
+    return fetch_job_logs_from_blob(blob_url)
+
+
 def delete_job_logs_from_blob(blob_url: str) -> bool:
     """
     Delete job logs stored in Vercel Blob at the specified blob URL.
@@ -382,8 +382,7 @@ def _run_vector_clustering(
                 add_feedback_to_cluster(cluster_id, str(item.id), project_id)
         else:
             # Create new cluster
-            cluster = _build_cluster(cluster_items)
-            cluster.id = cluster_id
+            cluster = _build_cluster(cluster_items).model_copy(update={"id": cluster_id})
             new_clusters.append(cluster)
             add_cluster(cluster)
             # Add all items to the cluster
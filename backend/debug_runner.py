@@ -50,7 +50,7 @@ async def run_test():
         # Ideally user has a repo in env? 
     )
     
-    cluster.github_repo_url = "https://github.com/octocat/Hello-World"
+    cluster = cluster.model_copy(update={"github_repo_url": "https://github.com/octocat/Hello-World"})
 
     # Add job to store first so update_job doesn't fail on "not found"
     from store import add_job
@@ -5,7 +5,7 @@ Stores logs in memory while jobs are running, then archives to Blob on completio
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 from threading import Lock
 
@@ -45,6 +45,25 @@ def get_logs(job_id: UUID) -> List[str]:
         return _job_logs.get(job_id, []).copy()
 
 
+def get_logs_since(job_id: UUID, offset: int = 0) -> Tuple[List[str], int]:
+    """
+    Retrieve log lines appended after `offset` for incremental polling.
+
+    Buffers are append-only, so a client can pass back the returned offset on its
+    next poll and receive only the lines it has not seen yet.
+
+    Parameters:
+        job_id (UUID): Identifier of the job whose logs to retrieve.
+        offset (int): Number of lines the caller has already consumed.
+
+    Returns:
+        Tuple[List[str], int]: The new log lines and the offset to pass on the next call.
+    """
+    with _logs_lock:
+        lines = _job_logs.get(job_id, [])
+        return lines[offset:], len(lines)
+
+
 def clear_logs(job_id: UUID) -> Optional[List[str]]:
     """
     Remove and return logs for a job from memory.
@@ -21,13 +21,14 @@ load_dotenv(env_path)
 
 from datetime import datetime, timezone
 import time
+from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Literal, Tuple, Union
 from uuid import UUID, uuid4
 
-from fastapi import FastAPI, Header, HTTPException, Path, Query, Request, BackgroundTasks
+from fastapi import FastAPI, Header, HTTPException, Path, Query, Request, Response, BackgroundTasks
 from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 # Configure logging
 log_level = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -36,7 +37,14 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
+# Fire-and-forget work (clustering, agent runners) is owned by a TaskGroup opened in the
+# app lifespan so shutdown cancels it instead of leaking runners across redeploys.
+_TASK_GROUP: Optional[asyncio.TaskGroup] = None
 _BACKGROUND_TASKS: set[asyncio.Task] = set()
+# Coding agent runner used by start_fix; resolved once at import rather than per request.
+_DEFAULT_RUNNER_NAME = os.getenv("CODING_AGENT_RUNNER", "sandbox_kilo")
+# start_fix requests currently running, keyed by (project_id, cluster_id)
+_INFLIGHT_FIXES: Dict[Tuple[str, str], asyncio.Future] = {}
 
 from models import FeedbackItem, IssueCluster, AgentJob, User, Project, ClusterJob, CodingPlan
 from store import (
@@ -62,11 +70,11 @@ from store import (
     set_datadog_monitors_for_project,
     update_cluster,
     add_job,
-    get_job,
+    get_job_for_project,
     update_job,
-    get_jobs_by_cluster,
     get_all_jobs,
-    get_all_jobs_for_project,
+    get_jobs_page_for_project,
+    get_jobs_page_by_cluster,
     get_job_logs,
     get_github_sync_state,
     set_github_sync_state,
@@ -76,7 +84,6 @@ from store import (
     get_project,
     get_cluster_job,
     list_cluster_jobs,
-    get_unclustered_feedback,
     add_coding_plan,
     get_coding_plan,
     get_sentry_config as get_sentry_config_value,
@@ -89,6 +96,7 @@ from store import (
     set_posthog_config as set_posthog_config_value,
     ping,
     count_feedback_items_for_user,
+    count_unclustered_feedback,
     count_successful_jobs_for_user,
     get_user_id_for_project,
 )
@@ -119,16 +127,72 @@ from sentry_client import (
     extract_issue_short_id,
     extract_event_id,
     extract_sentry_metadata,
+    get_exception_values,
     should_ingest_event,
+    unpack_sentry_payload,
 )
 from datadog_client import datadog_event_to_feedback_item, verify_signature
 # Ensure runners are registered
 import agent_runner.sandbox
 
+class _TaskGroupShutdownError(Exception):
+    """Raised inside the background TaskGroup to cancel its remaining tasks on shutdown."""
+
+
+async def _shutdown_task_group() -> None:
+    raise _TaskGroupShutdownError()
+
+
+async def _guarded(coro, label: str) -> None:
+    """Run a background coroutine, logging failures so they don't cancel sibling tasks."""
+    try:
+        await coro
+    except Exception:
+        logger.exception("Background task %s failed", label)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own background work in a TaskGroup for the lifetime of the app and cancel it on shutdown."""
+    global _TASK_GROUP
+    try:
+        async with asyncio.TaskGroup() as tg:
+            _TASK_GROUP = tg
+            try:
+                yield
+            finally:
+                _TASK_GROUP = None
+                tg.create_task(_shutdown_task_group())
+    except* _TaskGroupShutdownError:
+        logger.info("Cancelled outstanding background tasks on shutdown")
+
+
+def _spawn_background(coro, label: str) -> None:
+    """
+    Schedule `coro` as fire-and-forget work on the running event loop.
+
+    Uses the lifespan TaskGroup when it is active; otherwise (e.g. the app is driven
+    without its lifespan) falls back to a plain task kept alive in `_BACKGROUND_TASKS`.
+    Raises RuntimeError when called without a running loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        coro.close()
+        raise
+    if _TASK_GROUP is not None:
+        _TASK_GROUP.create_task(_guarded(coro, label))
+        return
+    task = loop.create_task(_guarded(coro, label))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
 app = FastAPI(
     title="Soulcaster Ingestion API",
     description="API for ingesting user feedback from multiple sources",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -303,10 +367,7 @@ def _kickoff_clustering(project_id: str):
         project_id (str): Identifier of the project whose unclustered feedback should be clustered.
     """
     try:
-        loop = asyncio.get_running_loop()
-        task = loop.create_task(maybe_start_clustering(project_id))
-        _BACKGROUND_TASKS.add(task)
-        task.add_done_callback(_BACKGROUND_TASKS.discard)
+        _spawn_background(maybe_start_clustering(project_id), f"clustering:{project_id}")
     except RuntimeError:
         # No running loop (e.g., during pytest/TestClient); run clustering inline so tests see clusters.
         logger.warning("No running event loop; clustering not started for project %s", project_id)
@@ -402,7 +463,7 @@ async def ingest_sentry(
 
         # Read raw body and parse JSON
         body = await request.body()
-        payload = json.loads(body.decode('utf-8'))
+        payload = json.loads(body)
 
         # Verify signature if configured
         webhook_secret = get_sentry_config_value(pid, "webhook_secret")
@@ -423,13 +484,15 @@ async def ingest_sentry(
         allowed_environments = get_sentry_config_value(pid, "environments")
         allowed_levels = get_sentry_config_value(pid, "levels")
 
-        if not should_ingest_event(payload, allowed_environments, allowed_levels):
+        # Resolve data.event / data.issue once and share it across the extractors
+        sentry = unpack_sentry_payload(payload)
+        if not should_ingest_event(sentry, allowed_environments, allowed_levels):
             # Event filtered out - return success but don't create item
             return {"status": "filtered", "project_id": str(pid)}
 
         # Extract issue short_id for deduplication (prefer over event_id)
-        issue_short_id = extract_issue_short_id(payload)
-        event_id = extract_event_id(payload)
+        issue_short_id = extract_issue_short_id(sentry)
+        event_id = extract_event_id(sentry)
         external_id = issue_short_id or event_id
 
         # Check for existing item with same external_id
@@ -439,19 +502,12 @@ async def ingest_sentry(
                 return {"status": "duplicate", "id": str(existing.id), "project_id": str(pid)}
 
         # Extract data from payload
-        title = payload.get("message") or payload.get("data", {}).get("event", {}).get("message") or "Sentry Issue"
-        stacktrace = extract_sentry_stacktrace(payload)
-        metadata = extract_sentry_metadata(payload)
+        title = payload.get("message") or sentry.event.get("message") or "Sentry Issue"
+        stacktrace = extract_sentry_stacktrace(sentry)
+        metadata = extract_sentry_metadata(sentry)
 
         # Construct body with exception details and stack trace
-        exception_values = payload.get("exception", {}).get("values", [])
-        if not exception_values:
-            exception_values = (
-                payload.get("data", {})
-                .get("event", {})
-                .get("exception", {})
-                .get("values", [])
-            )
+        exception_values = get_exception_values(sentry)
 
         body = ""
         if exception_values:
@@ -1764,7 +1820,7 @@ def _auto_cluster_feedback(item: FeedbackItem) -> IssueCluster:
         cluster_summary = "User-submitted manual feedback"
 
     # Try to find an existing cluster with the same title
-    project_id = str(item.project_id)
+    project_id = item.project_id
     existing = None
     for cluster in get_all_clusters(project_id):
         if cluster.title == cluster_title:
@@ -2094,7 +2150,8 @@ def clustering_status(project_id: Optional[str] = Query(None)):
     
     Returns:
         dict: A mapping with the following keys:
-            - "pending_unclustered" (int): Number of feedback items awaiting clustering.
+            - "pending_unclustered" (int): Number of feedback items awaiting clustering (an upper
+              bound: ids of since-expired feedback count until the next clustering run prunes them).
             - "is_clustering" (bool): `true` if a clustering job is currently running, `false` otherwise.
             - "last_job" (ClusterJob|None): The most recent cluster job record, or `None` if none exist.
             - "project_id" (str): Normalized project id used for the query.
@@ -2103,7 +2160,7 @@ def clustering_status(project_id: Optional[str] = Query(None)):
         HTTPException: If `project_id` is missing or invalid.
     """
     pid = _require_project_id(project_id)
-    pending = len(get_unclustered_feedback(pid))
+    pending = count_unclustered_feedback(pid)
     recent = list_cluster_jobs(pid, limit=10)
     last_job = recent[0] if recent else None
     is_clustering = any(job.status == "running" for job in recent)
@@ -2416,12 +2473,12 @@ def generate_cluster_plan(cluster_id: str, project_id: Optional[str] = Query(Non
         # Ideally we have a batch get, but loop is fine for prototype
         # We need to find the item. Ideally store.get_feedback_item logic handles lookup.
         # But get_feedback_item requires project_id. IssueCluster has project_id.
-        item = get_feedback_item(str(cluster.project_id), UUID(fid))
+        item = get_feedback_item(cluster.project_id, UUID(fid))
         if item:
             items.append(item)
 
-    # 3. Call planner
-    plan = generate_plan(cluster, items)
+    # 3. Call planner; an explicit request always regenerates rather than reusing the cache
+    plan = generate_plan(cluster, items, use_cache=False)
 
     # 4. Save plan
     add_coding_plan(plan)
@@ -2440,10 +2497,66 @@ async def start_cluster_fix(
     Trigger the coding agent to fix the issues in the cluster.
     Accepts optional X-GitHub-Token header for per-user GitHub authentication.
     Falls back to GITHUB_TOKEN environment variable if header is not provided.
+
+    Concurrent requests for the same project/cluster share a single run: later callers
+    wait for the in-flight request and receive its response instead of generating a
+    second plan and job. If that request is cancelled (e.g. its client disconnected),
+    waiters retry rather than inheriting the cancellation.
     """
     pid = _require_project_id(project_id)
+    key = (pid, cluster_id)
+    while True:
+        inflight = _INFLIGHT_FIXES.get(key)
+        if inflight is None:
+            break
+        # asyncio.wait neither raises the in-flight outcome nor cancels it if we are cancelled.
+        await asyncio.wait({inflight})
+        if not inflight.cancelled():
+            return inflight.result()
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    _INFLIGHT_FIXES[key] = future
+    try:
+        result = await _start_cluster_fix(pid, cluster_id, background_tasks, x_github_token)
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark the exception as retrieved so it is not reported when nobody was waiting.
+        future.exception()
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _INFLIGHT_FIXES.pop(key, None)
+
+
+async def _start_cluster_fix(
+    pid: str,
+    cluster_id: str,
+    background_tasks: Optional[BackgroundTasks],
+    x_github_token: Optional[str],
+) -> dict:
+    """Generate (or reuse) the cluster's plan, create the AgentJob and dispatch the runner."""
     pid_str = str(pid)
-    cluster = get_cluster(pid_str, cluster_id)
+    # One timestamp for every row written by this request keeps them consistent.
+    now = datetime.now(timezone.utc)
+
+    def _lookup_user_id() -> Optional[str]:
+        try:
+            return get_user_id_for_project(pid_str)
+        except ValueError:
+            return None
+
+    # The cluster, the project owner and any stored plan are independent store
+    # lookups; fetch them together instead of paying three round-trips in sequence.
+    cluster, user_id, plan = await asyncio.gather(
+        run_in_threadpool(get_cluster, pid_str, cluster_id),
+        run_in_threadpool(_lookup_user_id),
+        run_in_threadpool(get_coding_plan, pid_str, cluster_id),
+    )
     if not cluster:
         raise HTTPException(status_code=404, detail="Cluster not found")
 
@@ -2469,7 +2582,7 @@ async def start_cluster_fix(
             pid_str,
             cluster_id,
             github_repo_url=repo_url,
-            updated_at=datetime.now(timezone.utc),
+            updated_at=now,
         )
     else:
         # If we previously set a fallback repo URL but feedback now contains a real GitHub repo,
@@ -2480,18 +2593,18 @@ async def start_cluster_fix(
                 pid_str,
                 cluster_id,
                 github_repo_url=inferred_repo_url,
-                updated_at=datetime.now(timezone.utc),
+                updated_at=now,
             )
 
     # 1. Get or generate plan (project-scoped)
-    plan = get_coding_plan(pid_str, cluster_id)
     if not plan:
-        # Auto-generate if missing
-        plan = generate_plan(cluster, items_for_context)
+        # Auto-generate if missing. The Gemini call blocks for seconds, so run it in the
+        # threadpool instead of stalling the event loop for every other request.
+        plan = await run_in_threadpool(generate_plan, cluster, items_for_context)
         add_coding_plan(plan)
 
     # 2. Determine runner
-    runner_name = os.getenv("CODING_AGENT_RUNNER", "sandbox_kilo")
+    runner_name = _DEFAULT_RUNNER_NAME
     try:
         runner = get_runner(runner_name)
     except ValueError:
@@ -2500,9 +2613,7 @@ async def start_cluster_fix(
         raise HTTPException(status_code=500, detail=f"Runner '{runner_name}' not configured")
 
     # 2.5. Check quota before creating job
-    try:
-        user_id = get_user_id_for_project(pid_str)
-    except ValueError:
+    if user_id is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
     can_create, current_count = check_coding_job_limit(user_id)
@@ -2525,8 +2636,8 @@ async def start_cluster_fix(
         plan_id=plan.id,
         runner=runner_name,
         status="pending",
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=now,
+        updated_at=now,
     )
     add_job(job)
 
@@ -2536,7 +2647,7 @@ async def start_cluster_fix(
         cluster_id,
         status="fixing",
         error_message=None,
-        updated_at=datetime.now(timezone.utc),
+        updated_at=now,
     )
 
     async def _run_agent():
@@ -2553,10 +2664,7 @@ async def start_cluster_fix(
         else:
             # Fallback for sync contexts
             try:
-                loop = asyncio.get_running_loop()
-                task = loop.create_task(_run_agent())
-                _BACKGROUND_TASKS.add(task)
-                task.add_done_callback(_BACKGROUND_TASKS.discard)
+                _spawn_background(_run_agent(), f"agent:{job.id}")
             except RuntimeError:
                 # No loop (e.g. sync test client), run inline?
                 # Running inline might deadlock if it uses async.
@@ -2623,8 +2731,7 @@ def seed_mock_data():
         created_at=now,
     )
 
-    for item in (feedback_one, feedback_two, feedback_three):
-        add_feedback_item(item)
+    add_feedback_items_batch([feedback_one, feedback_two, feedback_three])
 
     cluster = IssueCluster(
         id=str(uuid4()),
@@ -2653,19 +2760,43 @@ class UpdateJobRequest(BaseModel):
     logs: Optional[str] = None
 
 
+_JOB_LIST_ADAPTER = TypeAdapter(List[AgentJob])
+
+
+def _job_list_view(jobs: List[AgentJob], next_cursor: int, has_more: bool) -> Response:
+    """
+    Serialize jobs for list endpoints, dropping the potentially large `logs` field.
+
+    The list is encoded in a single pydantic-core pass straight to JSON bytes, skipping
+    FastAPI's per-field `jsonable_encoder` walk over UUIDs and datetimes. Logs are served
+    by `/jobs/{job_id}/logs`. When more jobs remain, the cursor for the next page is
+    exposed in the `X-Next-Cursor` response header.
+    """
+    headers = {"X-Next-Cursor": str(next_cursor)} if has_more else None
+    body = _JOB_LIST_ADAPTER.dump_json(jobs, exclude={"__all__": {"logs"}})
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/jobs")
-def list_jobs(project_id: Optional[str] = Query(None)):
+def list_jobs(
+    project_id: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: int = Query(0, ge=0),
+):
     """
-    List AgentJob records for the specified project.
+    List AgentJob records for the specified project, newest first.
 
     Parameters:
         project_id (UUID): Project identifier used to scope the returned jobs. If omitted or None, an HTTP 400 error is raised.
+        limit (Optional[int]): Page size; when omitted all jobs are returned.
+        cursor (int): Offset returned in `X-Next-Cursor` by the previous page.
 
     Returns:
-        jobs (List[AgentJob]): List of jobs that belong to the given project.
+        jobs (List[dict]): Jobs that belong to the given project, without `logs`.
     """
     pid = _require_project_id(project_id)
-    return get_all_jobs_for_project(pid)
+    jobs, next_cursor, has_more = get_jobs_page_for_project(pid, cursor=cursor, limit=limit)
+    return _job_list_view(jobs, next_cursor, has_more)
 
 
 @app.post("/jobs")
@@ -2739,8 +2870,8 @@ def update_job_status(job_id: Union[UUID, str], payload: UpdateJobRequest, proje
         HTTPException: If the job does not exist or does not belong to the specified project (404).
     """
     pid = _require_project_id(project_id)
-    job = get_job(job_id)
-    if not job or str(job.project_id) != pid:
+    job = get_job_for_project(pid, job_id)
+    if not job:
         raise HTTPException(status_code=404, detail="Job not found for project")
 
     updates = {}
@@ -2773,45 +2904,63 @@ def get_job_details(job_id: Union[UUID, str], project_id: Optional[str] = Query(
         HTTPException: Raised with status 404 if the job does not exist or does not belong to the project.
     """
     pid = _require_project_id(project_id)
-    job = get_job(job_id)
-    if not job or str(job.project_id) != pid:
+    job = get_job_for_project(pid, job_id)
+    if not job:
         raise HTTPException(status_code=404, detail="Job not found for project")
     return job
 
 
+def _tail_log_text(text: str, tail_bytes: Optional[int]) -> str:
+    """Return at most the last `tail_bytes` bytes of `text` (UTF-8), or `text` unchanged."""
+    if not tail_bytes:
+        return text
+    encoded = text.encode("utf-8")
+    if len(encoded) <= tail_bytes:
+        return text
+    return encoded[-tail_bytes:].decode("utf-8", errors="ignore")
+
+
 @app.get("/jobs/{job_id}/logs")
 def get_job_log_lines(
     job_id: Union[UUID, str],
     project_id: Optional[str] = Query(None),
+    tail_bytes: Optional[int] = Query(None, ge=1),
+    since: Optional[int] = Query(None, ge=0),
 ):
     """
     Retrieve logs for a job, preferring blob storage for completed jobs and falling back to in-memory logs.
     
+    Archived blob logs are cached by URL, so repeated polls of a finished job do not
+    re-download the blob. Pass `tail_bytes` to receive only the trailing portion of the logs.
+    While a job is running, pass the previous response's `next_offset` as `since` to receive
+    only the lines appended after it.
+    
     Returns:
         A dictionary containing:
         - `job_id` (str): The job UUID as a string.
         - `project_id` (str): The resolved project id.
         - `source` (str): `"blob"` if logs were fetched from blob storage, `"memory"` if from the in-memory buffer.
-        - `chunks` (List[str]): A list of log chunks; for blob this contains a single entry with the blob contents, for memory it contains either a single concatenated string or is empty.
+        - `chunks` (List[str]): A list of log chunks; for blob this contains a single entry with the blob contents, for memory it contains the buffered log lines (joined into one entry when `tail_bytes` is set).
+        - `next_offset` (int, memory only): Offset to pass as `since` on the next poll.
     
     Raises:
         HTTPException: 404 if the job does not exist or does not belong to the specified project.
     """
     pid = _require_project_id(project_id)
-    job = get_job(job_id)
-    if not job or str(job.project_id) != pid:
+    job = get_job_for_project(pid, job_id)
+    if not job:
         raise HTTPException(status_code=404, detail="Job not found for project")
 
     # For completed jobs with blob_url, fetch from Blob
     if job.blob_url and job.status in ("success", "failed"):
         try:
-            from blob_storage import fetch_job_logs_from_blob
-            logs = fetch_job_logs_from_blob(job.blob_url)
+            from blob_storage import fetch_job_logs_cached
+            logs = fetch_job_logs_cached(job.blob_url)
             return {
                 "job_id": str(job_id),
                 "project_id": str(pid),
                 "source": "blob",
-                "chunks": [logs],
+                "chunks": [_tail_log_text(logs, tail_bytes)],
             }
         except Exception:
             logger.exception(f"Failed to fetch logs from Blob for job {job_id}")
@@ -2819,27 +2968,35 @@ def get_job_log_lines(
 
     # For running jobs or fallback, fetch from memory
     import job_logs_manager
-    logs = job_logs_manager.get_logs(job_id)
-    full_logs = "".join(logs) if logs else ""
+    chunks, next_offset = job_logs_manager.get_logs_since(job.id, since or 0)
+    if tail_bytes and chunks:
+        chunks = [_tail_log_text("".join(chunks), tail_bytes)]
 
     return {
         "job_id": str(job_id),
         "project_id": str(pid),
         "source": "memory",
-        "chunks": [full_logs] if full_logs else [],
+        "chunks": chunks,
+        "next_offset": next_offset,
     }
 
 
 @app.get("/clusters/{cluster_id}/jobs")
-def get_cluster_jobs(cluster_id: str, project_id: Optional[str] = Query(None)):
+def get_cluster_jobs(
+    cluster_id: str,
+    project_id: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=200),
+    cursor: int = Query(0, ge=0),
+):
     """
     Return the AgentJob records for the given cluster that belong to the specified project.
     
     Filters jobs by `cluster_id` and the provided `project_id` (required); if `project_id` is missing an HTTP 400 is raised.
+    Supports the same `limit`/`cursor` paging as `GET /jobs`.
     
     Returns:
-        List[AgentJob]: Jobs belonging to the cluster and project.
+        List[dict]: Jobs belonging to the cluster and project, newest first, without `logs`.
     """
     pid = _require_project_id(project_id)
-    cluster_jobs = get_jobs_by_cluster(cluster_id)
-    return [job for job in cluster_jobs if str(job.project_id) == pid]
\ No newline at end of file
+    jobs, next_cursor, has_more = get_jobs_page_by_cluster(cluster_id, pid, cursor=cursor, limit=limit)
+    return _job_list_view(jobs, next_cursor, has_more)
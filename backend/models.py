@@ -1,5 +1,6 @@
 """Domain models for Soulcaster data ingestion layer."""
 
+import sys
 from datetime import datetime
 from typing import Dict, List, Literal, Optional, Union
 from uuid import UUID
@@ -8,10 +9,33 @@ from pydantic import BaseModel, Field
 
 try:
     # Pydantic v2
-    from pydantic import ConfigDict
+    from pydantic import ConfigDict, field_validator
 except ImportError:  # pragma: no cover
     # Pydantic v1 fallback
     ConfigDict = None  # type: ignore
+    from pydantic import validator as _v1_validator
+
+    def field_validator(*fields, mode="after"):  # type: ignore
+        return _v1_validator(*fields, pre=mode == "before", allow_reuse=True)
+
+
+def _id_to_str(value):
+    """
+    Normalize UUID/CUID identifiers to an interned str.
+
+    Every model for a project then shares one string object, so store dict lookups and
+    equality checks on project ids short-circuit on identity. Anything other than a str or
+    UUID is passed through unchanged so pydantic still rejects it.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, UUID):
+        return sys.intern(str(value))
+    return value
+
+
+# AgentJob, FeedbackItem and IssueCluster sit on the store hot paths and are frozen:
+# stores replace instances via model_copy(update=...) instead of mutating them in place.
 
 
 class AgentJob(BaseModel):
@@ -19,8 +43,15 @@ class AgentJob(BaseModel):
     Represents a background job for the coding agent.
     """
 
+    if ConfigDict:
+        model_config = ConfigDict(extra="ignore", frozen=True)
+    else:  # pragma: no cover
+        class Config:
+            extra = "ignore"
+            allow_mutation = False
+
     id: UUID
-    project_id: Union[str, UUID]  # Supports both UUID and CUID formats
+    project_id: str  # UUID or CUID, normalized to str
     cluster_id: str
     plan_id: Optional[str] = None
     runner: Optional[str] = None
@@ -31,6 +62,11 @@ class AgentJob(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    @field_validator("project_id", mode="before")
+    @classmethod
+    def _normalize_project_id(cls, value):
+        return _id_to_str(value)
+
 
 class CodingPlan(BaseModel):
     """
@@ -39,10 +75,11 @@ class CodingPlan(BaseModel):
 
     if ConfigDict:
         # Allow decoding older stored plans that may contain extra fields.
-        model_config = ConfigDict(extra="ignore")
+        model_config = ConfigDict(extra="ignore", frozen=True)
     else:  # pragma: no cover
         class Config:
             extra = "ignore"
+            allow_mutation = False
 
     id: str
     project_id: Optional[str] = None  # Added for multi-project isolation
@@ -86,8 +123,15 @@ class FeedbackItem(BaseModel):
         created_at: Timestamp when the feedback was created
     """
 
+    if ConfigDict:
+        model_config = ConfigDict(extra="ignore", frozen=True)
+    else:  # pragma: no cover
+        class Config:
+            extra = "ignore"
+            allow_mutation = False
+
     id: UUID
-    project_id: Union[str, UUID]  # Supports both UUID and CUID formats
+    project_id: str  # UUID or CUID, normalized to str
     source: Literal["reddit", "sentry", "manual", "github", "splunk", "posthog", "datadog"]
     external_id: Optional[str] = None
     title: str
@@ -101,6 +145,11 @@ class FeedbackItem(BaseModel):
     github_issue_url: Optional[str] = None
     status: Optional[Literal["open", "closed"]] = None
 
+    @field_validator("project_id", mode="before")
+    @classmethod
+    def _normalize_project_id(cls, value):
+        return _id_to_str(value)
+
     @property
     def text(self) -> str:
         """
@@ -115,8 +164,15 @@ class FeedbackItem(BaseModel):
 class IssueCluster(BaseModel):
     """Represents a cluster of related feedback items."""
 
+    if ConfigDict:
+        model_config = ConfigDict(extra="ignore", frozen=True)
+    else:  # pragma: no cover
+        class Config:
+            extra = "ignore"
+            allow_mutation = False
+
     id: str
-    project_id: Union[str, UUID]  # Supports both UUID and CUID formats
+    project_id: str  # UUID or CUID, normalized to str
     title: str
     summary: str
     feedback_ids: List[str]
@@ -134,20 +190,35 @@ class IssueCluster(BaseModel):
     # Cached list of distinct sources for feedback items in this cluster
     sources: Optional[List[str]] = None
 
+    @field_validator("project_id", mode="before")
+    @classmethod
+    def _normalize_project_id(cls, value):
+        return _id_to_str(value)
+
 
 class User(BaseModel):
     """Represents an authenticated user."""
 
-    id: Union[str, UUID]  # Supports both UUID and CUID formats
+    id: str  # UUID or CUID, normalized to str
     email: Optional[str] = None
     github_id: Optional[str] = None
     created_at: datetime
 
+    @field_validator("id", mode="before")
+    @classmethod
+    def _normalize_id(cls, value):
+        return _id_to_str(value)
+
 
 class Project(BaseModel):
     """Represents a project/workspace owned by a user."""
 
-    id: Union[str, UUID]  # Supports both UUID and CUID formats
+    id: str  # UUID or CUID, normalized to str
     user_id: Union[str, UUID]
     name: str
     created_at: datetime
+
+    @field_validator("id", mode="before")
+    @classmethod
+    def _normalize_id(cls, value):
+        return _id_to_str(value)
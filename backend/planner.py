@@ -1,21 +1,204 @@
 """Module for generating coding plans using Gemini."""
+import hashlib
+import io
 import logging
+import math
 import os
+import re
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import uuid4
 
-from google import genai
-from google.genai import types
-from pydantic import BaseModel
-
 from models import IssueCluster, CodingPlan, FeedbackItem
+from text_cleaning import strip_log_noise
 
 logger = logging.getLogger(__name__)
 
-# Use a schema for structured generation
-class PlanSchema(BaseModel):
-    title: str
-    description: str
+# Use a schema for structured generation. A plain dict schema makes the SDK hand back
+# `response.parsed` as a dict (one json.loads) instead of validating an intermediate
+# Pydantic model that we would only copy into CodingPlan.
+PLAN_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "title": {"type": "STRING"},
+        "description": {"type": "STRING"},
+    },
+    "required": ["title", "description"],
+}
+
+# Static instructions travel as the system instruction, kept terse to cut input tokens on
+# every call; only the cluster and feedback text in the prompt vary per request.
+PLAN_SYSTEM_INSTRUCTION = (
+    "You are a senior product manager writing a HIGH-LEVEL plan for a developer.\n"
+    "Use only the cluster title/summary and feedback reports. "
+    "Do NOT invent file paths, code symbols, APIs, libraries, or implementation steps. "
+    "Do NOT add \"Files to edit\" or \"Tasks\" sections.\n"
+    "title: short, product-facing.\n"
+    "description: one plain-text block covering the problem and user impact, "
+    "required/expected behavior, and optional acceptance criteria as observable outcomes."
+)
+
+
+# Rule-based trimming of feedback text before it is sent to Gemini: drop greetings,
+# politeness and hedging, and collapse runs of whitespace. Lines that look like errors or
+# stack traces are passed through verbatim since the exact text matters there.
+_FILLER_RE = re.compile(
+    r"\b(?:hi|hello|hey|please|kindly|thanks(?: in advance)?|thank you|could you|can you|"
+    r"would you|i think|i guess|i feel like|it seems(?: like| that)?|basically|actually)\b[,!]?",
+    re.IGNORECASE,
+)
+_PRESERVE_LINE_RE = re.compile(
+    r"Traceback|\bFile \"|\$exception|\b\w*(?:Error|Exception)\b|^\s+at\s"
+)
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+
+
+def _compress_feedback(text: str) -> str:
+    """Strip filler phrases and redundant whitespace from feedback text, keeping error lines intact."""
+    if not text:
+        return ""
+    lines = []
+    for line in text.splitlines():
+        if _PRESERVE_LINE_RE.search(line):
+            lines.append(line.rstrip())
+            continue
+        line = strip_log_noise(line)
+        line = _WHITESPACE_RE.sub(" ", _FILLER_RE.sub("", line)).strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+# Per-call user prompt; only these fields vary between calls. Bound `format_map` of a
+# constant template rather than an f-string rebuilt inside generate_plan.
+_PROMPT_TEMPLATE = (
+    "Cluster Title: {title}\n"
+    "Cluster Summary: {summary}\n"
+    "\n"
+    "User Feedback Reports:\n"
+    "{feedback}\n"
+).format_map
+_CHARS_PER_TOKEN = 4  # rough estimate, used for logging prompt size
+
+# Prompt budget for feedback: the newest items are sent in full, older ones as a short
+# title/body excerpt, and the oldest are dropped once the character budget is spent, so
+# prompt size stays bounded no matter how large the cluster grows.
+_SERIALIZATION_BUDGET = 80_000  # ~20K tokens
+_COMPACT_TITLE_MAX = 120
+_COMPACT_CONTENT_MAX = 300
+_RECENT_TIER_RATIO = 0.3
+
+
+def _serialize_full(index: int, item: FeedbackItem) -> str:
+    return (
+        f"--- Feedback {index} ---\n"
+        f"Title: {_compress_feedback(item.title)}\nBody: {_compress_feedback(item.body)}"
+    )
+
+
+def _serialize_compact(index: int, item: FeedbackItem) -> str:
+    title = _compress_feedback(item.title)[:_COMPACT_TITLE_MAX]
+    body = _compress_feedback(item.body)[:_COMPACT_CONTENT_MAX]
+    return f"--- Feedback {index} ---\nTitle: {title}\nBody: {body}"
+
+
+def _created_at_utc(item: FeedbackItem) -> datetime:
+    """Sort key for feedback age; naive timestamps (e.g. API-posted) are taken as UTC."""
+    created_at = item.created_at
+    if created_at.tzinfo is None:
+        return created_at.replace(tzinfo=timezone.utc)
+    return created_at
+
+
+def _serialize_feedback(feedback_items: list[FeedbackItem]) -> str:
+    """Render feedback for the prompt newest-first, tiered and capped at `_SERIALIZATION_BUDGET` chars."""
+    ordered = sorted(feedback_items, key=_created_at_utc, reverse=True)
+    recent_count = math.ceil(len(ordered) * _RECENT_TIER_RATIO)
+    # Write sections straight into one buffer rather than collecting them for a join.
+    buffer = io.StringIO()
+    used = 0
+    for i, item in enumerate(ordered):
+        serialize = _serialize_full if i < recent_count else _serialize_compact
+        part = serialize(i + 1, item)
+        separator = "\n\n" if i else ""
+        remaining = _SERIALIZATION_BUDGET - used - len(separator)
+        if len(part) > remaining:
+            if not i:
+                # Never send an empty context: keep the head of an oversized newest item.
+                buffer.write(part[:remaining])
+            break
+        buffer.write(separator)
+        buffer.write(part)
+        used += len(separator) + len(part)
+    return buffer.getvalue()
+
+
+# Plans generated for unchanged inputs (same cluster, title, summary and feedback set) are
+# reused instead of re-running Gemini on retry. Bounded LRU; successful plans only.
+_PLAN_CACHE_MAX = 256
+_PLAN_CACHE: "OrderedDict[str, CodingPlan]" = OrderedDict()
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def _plan_cache_key(cluster: IssueCluster, feedback_items: list[FeedbackItem]) -> str:
+    feedback_keys = sorted(item.external_id or str(item.id) for item in feedback_items)
+    raw = "\x1f".join(
+        [cluster.project_id, cluster.id, cluster.title, cluster.summary, *feedback_keys]
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _get_cached_plan(key: str) -> CodingPlan | None:
+    with _PLAN_CACHE_LOCK:
+        plan = _PLAN_CACHE.get(key)
+        if plan is not None:
+            _PLAN_CACHE.move_to_end(key)
+        return plan
+
+
+def _cache_plan(key: str, plan: CodingPlan) -> None:
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[key] = plan
+        _PLAN_CACHE.move_to_end(key)
+        while len(_PLAN_CACHE) > _PLAN_CACHE_MAX:
+            _PLAN_CACHE.popitem(last=False)
+
+
+def clear_plan_cache() -> None:
+    """Drop all cached plans (used by tests)."""
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE.clear()
+
+
+# google-genai pulls in protobuf/grpc; import it on first use so API workers that never
+# generate a plan don't pay for it at startup.
+_genai = None
+
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key: str):
+    """Build one Gemini client per API key so plan generation reuses its connection pool."""
+    global _genai
+    if _genai is None:
+        from google import genai
+
+        _genai = genai
+    return _genai.Client(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def _generation_config():
+    """Build the (immutable) plan generation config once, after genai is first imported."""
+    from google.genai import types
+
+    return types.GenerateContentConfig(
+        response_mime_type="application/json",
+        response_schema=PLAN_RESPONSE_SCHEMA,
+        system_instruction=PLAN_SYSTEM_INSTRUCTION,
+        temperature=0.2,
+    )
 
 
 def _get_client():
@@ -23,16 +206,34 @@ def _get_client():
     if not api_key:
         logger.warning("GEMINI_API_KEY not set. Plan generation will fail.")
         return None
-    return genai.Client(api_key=api_key)
+    return _client_for_key(api_key)
+
+
+def _make_plan(cluster: IssueCluster, title: str, description: str) -> CodingPlan:
+    """Build a new CodingPlan for `cluster`, reading the clock once for both timestamps."""
+    now = datetime.now(timezone.utc)
+    return CodingPlan(
+        id=str(uuid4()),
+        project_id=cluster.project_id,
+        cluster_id=cluster.id,
+        title=title,
+        description=description,
+        created_at=now,
+        updated_at=now,
+    )
 
 
-def generate_plan(cluster: IssueCluster, feedback_items: list[FeedbackItem]) -> CodingPlan:
+def generate_plan(
+    cluster: IssueCluster, feedback_items: list[FeedbackItem], use_cache: bool = True
+) -> CodingPlan:
     """
     Generate a high-level coding plan for an issue cluster from user feedback using Gemini.
     
     Parameters:
         cluster (IssueCluster): The issue cluster to generate a plan for.
         feedback_items (list[FeedbackItem]): Ordered user feedback entries relevant to the cluster.
+        use_cache (bool): Reuse a cached plan for unchanged inputs. Pass False to force a fresh
+            Gemini call (explicit regeneration); the new plan still replaces the cached one.
     
     Returns:
         CodingPlan: A plan containing a new UUID, the cluster ID, a short product-facing title,
@@ -40,6 +241,9 @@ def generate_plan(cluster: IssueCluster, feedback_items: list[FeedbackItem]) ->
         acceptance criteria, and created/updated UTC timestamps.
     
     Behavior:
+        - If `use_cache` is set and a plan was already generated for the same cluster, title,
+          summary and feedback set, returns a copy of that plan's title and description under a
+          new id and timestamps without calling Gemini.
         - If the Gemini API key is missing, returns a placeholder plan indicating automatic
           plan generation failed (title prefixed with "Fix:" and a description noting the failure).
         - If generation succeeds, returns a CodingPlan populated from the model's parsed
@@ -47,86 +251,51 @@ def generate_plan(cluster: IssueCluster, feedback_items: list[FeedbackItem]) ->
         - If generation raises an exception, logs the error and returns a fallback plan whose
           title indicates the error and whose description contains the exception message.
     """
+    cache_key = _plan_cache_key(cluster, feedback_items)
+    cached = _get_cached_plan(cache_key) if use_cache else None
+    if cached is not None:
+        return _make_plan(cluster, title=cached.title, description=cached.description)
+
     client = _get_client()
     if not client:
         # Fallback for when no API key is present (e.g. tests)
-        return CodingPlan(
-            id=str(uuid4()),
-            project_id=str(cluster.project_id),
-            cluster_id=cluster.id,
+        return _make_plan(
+            cluster,
             title=f"Fix: {cluster.title}",
             description=(
                 "Automatic plan generation failed (no API key). "
                 "This is a placeholder plan with high-level requirements only."
             ),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
 
     # Construct the prompt context
-    feedback_text = "\n\n".join(
-        [
-            f"--- Feedback {i+1} ---\nTitle: {item.title}\nBody: {item.body}"
-            for i, item in enumerate(feedback_items)
-        ]
-    )
-
-    prompt = f"""
-You are a senior product manager writing instructions for a developer.
-
-Cluster Title: {cluster.title}
-Cluster Summary: {cluster.summary}
-
-User Feedback Reports:
-{feedback_text}
-
-Write a HIGH-LEVEL plan only.
+    feedback_text = _serialize_feedback(feedback_items)
 
-Hard rules:
-- Do NOT invent file paths, code symbols, APIs, libraries, or specific implementation steps.
-- Do NOT include sections like "Files to edit" or "Tasks".
-- Only use information present in the cluster title/summary and the feedback reports.
-
-Output requirements:
-- title: a short product-facing title.
-- description: a single plain-text block that combines:
-    - problem statement and user impact
-    - explicit requirements / expected behavior
-    - (optional) acceptance criteria phrased as observable outcomes
-"""
+    prompt = _PROMPT_TEMPLATE(
+        {"title": cluster.title, "summary": cluster.summary, "feedback": feedback_text}
+    )
+    logger.debug(
+        "Plan prompt for cluster %s: ~%d tokens", cluster.id, len(prompt) // _CHARS_PER_TOKEN
+    )
 
     try:
         response = client.models.generate_content(
             model="gemini-3-flash-preview",
             contents=prompt,
-            config=types.GenerateContentConfig(
-                response_mime_type="application/json",
-                response_schema=PlanSchema,
-                temperature=0.2,
-            ),
+            config=_generation_config(),
         )
 
         parsed_plan = response.parsed
 
-        return CodingPlan(
-            id=str(uuid4()),
-            project_id=str(cluster.project_id),
-            cluster_id=cluster.id,
-            title=parsed_plan.title,
-            description=parsed_plan.description,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        plan = _make_plan(cluster, title=parsed_plan["title"], description=parsed_plan["description"])
+        _cache_plan(cache_key, plan)
+        return plan
 
     except Exception as e:
         logger.exception(f"Failed to generate plan for cluster {cluster.id}")
         # Return a fallback plan indicating failure
-        return CodingPlan(
-            id=str(uuid4()),
-            project_id=str(cluster.project_id),
-            cluster_id=cluster.id,
+        return _make_plan(
+            cluster,
             title=f"Error planning fix for: {cluster.title}",
             description=f"Plan generation failed: {str(e)}",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
\ No newline at end of file
+        )
@@ -1,12 +1,45 @@
 """PostHog integration client for normalizing events to FeedbackItems."""
 
 import json
+import re
+import threading
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from uuid import uuid4
 
 from models import FeedbackItem
 from store import _STORE
+from text_cleaning import LOG_NOISE_PATTERN
+
+# Strips ANSI color codes and leading ISO timestamps and squeezes runs of spaces in a
+# single regex pass per line. Stack frames ("  at fn (file:1:2)", 'File "x.py", line 3')
+# are kept verbatim so line numbers and indentation survive.
+_NOISE_RE = re.compile(LOG_NOISE_PATTERN + r"|[ \t]{2,}")
+_VERBATIM_LINE_RE = re.compile(r'^\s*at\s|File "')
+
+
+def _noise_replacement(match: re.Match) -> str:
+    return " " if match.group(0)[0] in " \t" else ""
+
+
+def _clean_body(text: str) -> str:
+    """Remove log noise from PostHog exception text while leaving stack frames intact."""
+    if not text:
+        return ""
+    lines = []
+    for line in text.splitlines():
+        if _VERBATIM_LINE_RE.search(line):
+            lines.append(line.rstrip())
+        else:
+            lines.append(_NOISE_RE.sub(_noise_replacement, line).strip())
+    return "\n".join(lines).strip("\n")
+
+
+# Event types are read on every sync but change rarely. Each write stamps a version token
+# next to the value; readers fetch only that small token and reuse their decoded list while
+# it is unchanged (like an ETag / If-None-Match), so every instance sees writes immediately.
+_event_types_cache: Dict[str, Tuple[str, Optional[List[str]]]] = {}
+_event_types_cache_lock = threading.Lock()
 
 
 def posthog_event_to_feedback_item(event: dict, project_id: str) -> FeedbackItem:
@@ -24,8 +57,8 @@ def posthog_event_to_feedback_item(event: dict, project_id: str) -> FeedbackItem
         FeedbackItem: Normalized feedback item ready for storage
     """
     props = event.get("properties", {})
-    exception_msg = props.get("$exception_message", "")
-    stack_trace = props.get("$exception_stack_trace_raw", "")
+    exception_msg = _clean_body(props.get("$exception_message", ""))
+    stack_trace = _clean_body(props.get("$exception_stack_trace_raw", ""))
 
     # Construct external_id from uuid and timestamp for deduplication
     event_uuid = event.get("uuid", event.get("distinct_id", ""))
@@ -43,10 +76,10 @@ def posthog_event_to_feedback_item(event: dict, project_id: str) -> FeedbackItem
         body_parts.append(stack_trace)
     body = "\n\n".join(body_parts) if body_parts else "No details available"
 
-    # Parse timestamp
+    # Parse timestamp (Python 3.11+ fromisoformat accepts the trailing "Z" directly)
     try:
-        created_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        created_at = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
         created_at = datetime.now(timezone.utc)
 
     return FeedbackItem(
@@ -96,6 +129,11 @@ def fetch_posthog_events(
     return []
 
 
+def _copy_event_types(event_types):
+    # Hand callers their own list so mutating it can't poison the cache.
+    return list(event_types) if isinstance(event_types, list) else event_types
+
+
 def get_posthog_event_types(project_id: str) -> Optional[List[str]]:
     """
     Retrieve the list of PostHog event types to track for a project.
@@ -107,14 +145,27 @@ def get_posthog_event_types(project_id: str) -> Optional[List[str]]:
         List[str] or None: List of event types, or None if not configured.
     """
     key = f"config:posthog:{project_id}:event_types"
+    version = _STORE.get(f"{key}:v")
+    if version is not None:
+        with _event_types_cache_lock:
+            cached = _event_types_cache.get(project_id)
+        if cached is not None and cached[0] == version:
+            return _copy_event_types(cached[1])
+
     value = _STORE.get(key)
-    if value is None:
-        return None
-    # Store as JSON array string
-    try:
-        return json.loads(value)
-    except (json.JSONDecodeError, TypeError):
-        return None
+    event_types: Optional[List[str]] = None
+    if value is not None:
+        # Store as JSON array string
+        try:
+            event_types = json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            event_types = None
+
+    # Values written before versioning have no token; those are simply decoded each time.
+    if version is not None:
+        with _event_types_cache_lock:
+            _event_types_cache[project_id] = (version, event_types)
+    return _copy_event_types(event_types)
 
 
 def set_posthog_event_types(project_id: str, event_types: List[str]) -> None:
@@ -127,3 +178,10 @@ def set_posthog_event_types(project_id: str, event_types: List[str]) -> None:
     """
     key = f"config:posthog:{project_id}:event_types"
     _STORE.set(key, json.dumps(event_types))
+    _STORE.set(f"{key}:v", uuid4().hex)
+
+
+def clear_posthog_event_types_cache() -> None:
+    """Drop cached event type lists (used by tests)."""
+    with _event_types_cache_lock:
+        _event_types_cache.clear()
@@ -12,9 +12,12 @@ the ingestion API while respecting rate limits and caching.
 # the current GitHub-only ingestion scope.
 
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional
 from uuid import uuid4
 
 import requests
@@ -31,11 +34,28 @@ DEFAULT_POLL_INTERVAL = 300  # seconds
 DEFAULT_THROTTLE_SECONDS = 1.0
 MAX_RETRIES = 4
 MAX_BACKOFF_SECONDS = 64
+INGEST_MAX_WORKERS = 8
+FETCH_MAX_WORKERS = 8
+MAX_SEEN_POST_IDS = 100_000  # oldest ids are evicted once the dedup window is full
 
 # Default API endpoint for posting feedback
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
 
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a connection pool sized for bursts of ingest POSTs."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=50)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by pollers created without an explicit session (including the module-level
+# helpers), so Reddit fetches and backend POSTs reuse pooled TLS connections.
+_SESSION = _build_session()
+
+
 def _parse_env_list(env_value: Optional[str], default: List[str]) -> List[str]:
     """Split a comma-delimited env var into a list, trimming whitespace."""
     if not env_value:
@@ -102,18 +122,34 @@ class RedditPoller:
         self.sorts = sorts or get_env_sorts()
         self.poll_interval = poll_interval or get_poll_interval_seconds()
         self.throttle_seconds = throttle_seconds
-        self.session = session or requests.Session()
+        self._throttle_ns = int(throttle_seconds * 1e9)
+        self.session = session or _SESSION
         self.sleep = sleep_fn
-        self.seen_post_ids: Set[str] = set()
+        self.seen_post_ids: "OrderedDict[str, None]" = OrderedDict()
+        self._seen_lock = threading.Lock()  # subreddits are fetched from worker threads
         self.etag_cache: Dict[tuple, str] = {}
-        self.last_request_at: Dict[str, float] = {}
+        self.last_request_at: Dict[str, int] = {}  # monotonic_ns of last request per subreddit
 
     def fetch_reddit_posts(self, subreddits: Iterable[str]) -> List[dict]:
-        """Fetch normalized posts for the provided subreddits."""
-        posts: List[dict] = []
-        for subreddit in subreddits:
+        """Fetch normalized posts for the provided subreddits.
+
+        Subreddits are fetched concurrently; each worker walks one subreddit's sorts in
+        order so the per-subreddit throttle still spaces its requests.
+        """
+        subreddits = list(subreddits)
+        if not subreddits:
+            return []
+
+        def fetch_subreddit(subreddit: str) -> List[dict]:
+            found: List[dict] = []
             for sort in self.sorts:
-                posts.extend(self._fetch_subreddit_listing(subreddit, sort))
+                found.extend(self._fetch_subreddit_listing(subreddit, sort))
+            return found
+
+        posts: List[dict] = []
+        with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(subreddits))) as executor:
+            for found in executor.map(fetch_subreddit, subreddits):
+                posts.extend(found)
         return posts
 
     def _fetch_subreddit_listing(self, subreddit: str, sort: str) -> List[dict]:
@@ -149,10 +185,15 @@ class RedditPoller:
         for child in children:
             post_data = child.get("data", {})
             post_id = post_data.get("id")
-            if not post_id or post_id in self.seen_post_ids:
+            if not post_id:
                 continue
+            with self._seen_lock:
+                if post_id in self.seen_post_ids:
+                    continue
+                self.seen_post_ids[post_id] = None
+                if len(self.seen_post_ids) > MAX_SEEN_POST_IDS:
+                    self.seen_post_ids.popitem(last=False)
 
-            self.seen_post_ids.add(post_id)
             created_utc = post_data.get("created_utc") or time.time()
             posts.append(
                 {
@@ -210,13 +251,15 @@ class RedditPoller:
 
     def _throttle(self, subreddit: str) -> None:
         """Ensure we don't exceed 1 req/sec per subreddit."""
-        last_seen = self.last_request_at.get(subreddit)
-        now = time.monotonic()
-        if last_seen is not None:
-            elapsed = now - last_seen
-            if elapsed < self.throttle_seconds:
-                self.sleep(self.throttle_seconds - elapsed)
-        self.last_request_at[subreddit] = time.monotonic()
+        now_ns = time.monotonic_ns()
+        last_ns = self.last_request_at.get(subreddit)
+        wait_ns = 0
+        if last_ns is not None:
+            wait_ns = max(0, self._throttle_ns - (now_ns - last_ns))
+            if wait_ns:
+                self.sleep(wait_ns / 1e9)
+        # The request goes out once the wait is over; record that instead of re-reading the clock.
+        self.last_request_at[subreddit] = now_ns + wait_ns
 
     def poll_once(
         self,
@@ -230,6 +273,7 @@ class RedditPoller:
             return
 
         ingest_url = f"{backend_url or BACKEND_URL}/ingest/reddit"
+        pending: List[tuple] = []
         for post in posts:
             payload = {
                 "id": str(uuid4()),
@@ -265,12 +309,24 @@ class RedditPoller:
                     print(f"Failed to ingest (direct) Reddit item {post['id']}: {exc}")
                 continue
 
-            try:
-                response = requests.post(ingest_url, json=payload, timeout=10)
-                response.raise_for_status()
-                print(f"Ingested r/{post['subreddit']} post {post['id']}: {post['title'][:80]}")
-            except requests.RequestException as exc:
-                print(f"Failed to post Reddit item {post['id']} to backend: {exc}")
+            pending.append((post, payload))
+
+        if not pending:
+            return
+
+        # Each POST is an independent network round-trip; overlap them instead of
+        # paying one RTT per post.
+        with ThreadPoolExecutor(max_workers=min(INGEST_MAX_WORKERS, len(pending))) as executor:
+            list(executor.map(lambda item: self._post_to_backend(ingest_url, *item), pending))
+
+    def _post_to_backend(self, ingest_url: str, post: dict, payload: dict) -> None:
+        """POST one normalized post to the ingestion API, logging failures."""
+        try:
+            response = self.session.post(ingest_url, json=payload, timeout=10)
+            response.raise_for_status()
+            print(f"Ingested r/{post['subreddit']} post {post['id']}: {post['title'][:80]}")
+        except requests.RequestException as exc:
+            print(f"Failed to post Reddit item {post['id']} to backend: {exc}")
 
     def run_forever(self, subreddits: Optional[Iterable[str]] = None) -> None:
         """Start continuous polling."""
@@ -10,11 +10,24 @@ import hashlib
 import hmac
 import json
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _keyed_sha256(secret: str) -> "hmac.HMAC":
+    """
+    Return an HMAC-SHA256 object with `secret` already absorbed.
+
+    Keying pads the secret and hashes the inner/outer key blocks; doing that once per
+    secret and `.copy()`-ing the keyed state per request skips that work on every webhook.
+    The cached object itself is never updated.
+    """
+    return hmac.new(secret.encode(), None, hashlib.sha256)
+
+
 def verify_sentry_signature(body: bytes, signature: str, secret: str) -> bool:
     """
     Verify Sentry webhook signature using HMAC-SHA256.
@@ -34,14 +47,48 @@ def verify_sentry_signature(body: bytes, signature: str, secret: str) -> bool:
         return False
 
     try:
-        expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
-        return hmac.compare_digest(signature, expected)
+        provided = bytes.fromhex(signature)
+    except ValueError:
+        return False
+
+    try:
+        mac = _keyed_sha256(secret).copy()
+        mac.update(body)
+        # Compare the 32-byte digests rather than their 64-char hex forms.
+        return hmac.compare_digest(provided, mac.digest())
     except Exception as e:
         logger.warning(f"Signature verification failed: {e}")
         return False
 
 
-def extract_sentry_stacktrace(payload: dict) -> str:
+class SentryPayload(NamedTuple):
+    """A Sentry webhook payload with its nested sections resolved once."""
+
+    top: dict
+    event: dict  # data.event, or {} when absent
+    issue: dict  # data.issue, or {} when absent
+
+
+def unpack_sentry_payload(payload: Union[dict, SentryPayload]) -> SentryPayload:
+    """
+    Resolve `data.event` and `data.issue` from a Sentry payload in a single walk.
+
+    The extractors below accept either a raw payload or the result of this function, so a
+    webhook handler can unpack once and pass the result to each of them.
+    """
+    if isinstance(payload, SentryPayload):
+        return payload
+    data = payload.get("data") or {}
+    return SentryPayload(top=payload, event=data.get("event") or {}, issue=data.get("issue") or {})
+
+
+def get_exception_values(payload: Union[dict, SentryPayload]) -> list:
+    """Return `exception.values` from the top level, falling back to `data.event.exception`."""
+    p = unpack_sentry_payload(payload)
+    return (p.top.get("exception") or {}).get("values") or (p.event.get("exception") or {}).get("values") or []
+
+
+def extract_sentry_stacktrace(payload: Union[dict, SentryPayload]) -> str:
     """
     Extract and format stack trace from Sentry webhook payload.
 
@@ -49,41 +96,28 @@ def extract_sentry_stacktrace(payload: dict) -> str:
     extracts those frames and formats them in a readable way.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         str: Formatted stack trace string, or empty string if none found.
     """
-    stacktrace_lines = []
-
-    # Extract from exception.values[].stacktrace.frames
-    exception_values = payload.get("exception", {}).get("values", [])
-    if not exception_values:
-        # Try data.event.exception path
-        exception_values = (
-            payload.get("data", {})
-            .get("event", {})
-            .get("exception", {})
-            .get("values", [])
-        )
-
-    if exception_values:
-        for exc in exception_values:
-            frames = exc.get("stacktrace", {}).get("frames", [])
-            for frame in frames:
-                filename = frame.get("filename", "unknown")
-                lineno = frame.get("lineno", "?")
-                function = frame.get("function", "")
-
-                if function:
-                    stacktrace_lines.append(f"  {filename}:{lineno} in {function}")
-                else:
-                    stacktrace_lines.append(f"  {filename}:{lineno}")
+    # Extract from exception.values[].stacktrace.frames (or data.event.exception)
+    frames = (
+        frame
+        for exc in get_exception_values(payload)
+        for frame in exc.get("stacktrace", {}).get("frames", ())
+    )
+    return "\n".join(
+        [
+            f"  {frame.get('filename', 'unknown')}:{frame.get('lineno', '?')} in {function}"
+            if (function := frame.get("function"))
+            else f"  {frame.get('filename', 'unknown')}:{frame.get('lineno', '?')}"
+            for frame in frames
+        ]
+    )
 
-    return "\n".join(stacktrace_lines)
 
-
-def extract_issue_short_id(payload: dict) -> Optional[str]:
+def extract_issue_short_id(payload: Union[dict, SentryPayload]) -> Optional[str]:
     """
     Extract the Sentry issue short_id from webhook payload.
 
@@ -91,108 +125,90 @@ def extract_issue_short_id(payload: dict) -> Optional[str]:
     so multiple events for the same issue create only one FeedbackItem.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         Optional[str]: Issue short_id if present, None otherwise.
     """
-    # Try data.issue.short_id first (newer webhook format)
-    short_id = payload.get("data", {}).get("issue", {}).get("short_id")
-    if short_id:
-        return short_id
-
-    # Fallback to top-level issue if present
-    short_id = payload.get("issue", {}).get("short_id")
-    return short_id
+    p = unpack_sentry_payload(payload)
+    # Try data.issue.short_id first (newer webhook format), then top-level issue
+    return p.issue.get("short_id") or (p.top.get("issue") or {}).get("short_id")
 
 
-def extract_event_id(payload: dict) -> Optional[str]:
+def extract_event_id(payload: Union[dict, SentryPayload]) -> Optional[str]:
     """
     Extract the Sentry event_id from webhook payload.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         Optional[str]: Event ID if present, None otherwise.
     """
-    # Try data.event.event_id first
-    event_id = payload.get("data", {}).get("event", {}).get("event_id")
-    if event_id:
-        return event_id
-
-    # Fallback to top-level event_id
-    return payload.get("event_id")
+    p = unpack_sentry_payload(payload)
+    # Try data.event.event_id first, then top-level event_id
+    return p.event.get("event_id") or p.top.get("event_id")
 
 
-def extract_sentry_metadata(payload: dict) -> Dict:
+def extract_sentry_metadata(payload: Union[dict, SentryPayload]) -> Dict:
     """
     Extract metadata fields from Sentry payload for storage.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         dict: Metadata dictionary with relevant Sentry fields.
     """
-    # Extract from data.event if available
-    event_data = payload.get("data", {}).get("event", {})
-    issue_data = payload.get("data", {}).get("issue", {})
+    p = unpack_sentry_payload(payload)
+    event, top = p.event, p.top
 
-    metadata = {
-        "issue_id": issue_data.get("id") or payload.get("issue", {}).get("id"),
-        "event_id": extract_event_id(payload),
-        "level": event_data.get("level") or payload.get("level"),
-        "platform": event_data.get("platform") or payload.get("platform"),
-        "release": event_data.get("release") or payload.get("release"),
-        "environment": event_data.get("environment") or payload.get("environment"),
-        "tags": event_data.get("tags") or payload.get("tags", {}),
-    }
+    # Insert only fields that are present, rather than building all keys and filtering Nones
+    metadata = {}
+    if (value := p.issue.get("id") or (top.get("issue") or {}).get("id")) is not None:
+        metadata["issue_id"] = value
+    if (value := extract_event_id(p)) is not None:
+        metadata["event_id"] = value
+    for field in ("level", "platform", "release", "environment"):
+        if (value := event.get(field) or top.get(field)) is not None:
+            metadata[field] = value
+    if (value := event.get("tags") or top.get("tags", {})) is not None:
+        metadata["tags"] = value
+    return metadata
 
-    # Clean up None values
-    return {k: v for k, v in metadata.items() if v is not None}
 
-
-def get_environment_from_payload(payload: dict) -> Optional[str]:
+def get_environment_from_payload(payload: Union[dict, SentryPayload]) -> Optional[str]:
     """
     Extract environment from Sentry payload.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         Optional[str]: Environment string (e.g., "production", "staging"), or None.
     """
-    # Try data.event.environment first
-    environment = payload.get("data", {}).get("event", {}).get("environment")
-    if environment:
-        return environment
-
-    # Fallback to top-level environment
-    return payload.get("environment")
+    p = unpack_sentry_payload(payload)
+    # Try data.event.environment first, then top-level environment
+    return p.event.get("environment") or p.top.get("environment")
 
 
-def get_level_from_payload(payload: dict) -> Optional[str]:
+def get_level_from_payload(payload: Union[dict, SentryPayload]) -> Optional[str]:
     """
     Extract error level from Sentry payload.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
 
     Returns:
         Optional[str]: Level string (e.g., "error", "fatal", "warning"), or None.
     """
-    # Try data.event.level first
-    level = payload.get("data", {}).get("event", {}).get("level")
-    if level:
-        return level
-
-    # Fallback to top-level level
-    return payload.get("level")
+    p = unpack_sentry_payload(payload)
+    # Try data.event.level first, then top-level level
+    return p.event.get("level") or p.top.get("level")
 
 
 def should_ingest_event(
-    payload: dict,
+    payload: Union[dict, SentryPayload],
     allowed_environments: Optional[List[str]] = None,
     allowed_levels: Optional[List[str]] = None,
 ) -> bool:
@@ -200,7 +216,7 @@ def should_ingest_event(
     Check if a Sentry event should be ingested based on filters.
 
     Parameters:
-        payload (dict): Sentry webhook payload dictionary.
+        payload (dict | SentryPayload): Sentry webhook payload, raw or unpacked.
         allowed_environments (Optional[List[str]]): If set, only ingest events from these environments.
         allowed_levels (Optional[List[str]]): If set, only ingest events with these levels.
 
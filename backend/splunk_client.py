@@ -6,13 +6,27 @@ converting them into FeedbackItems for clustering and analysis.
 
 import json
 import hmac
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, FrozenSet, Optional, List, Tuple
 from uuid import uuid4
 
 from models import FeedbackItem
 from store import get_splunk_config, set_splunk_config
 
+# Allowed-search sets keyed by project, tagged with the version token written alongside the
+# list. A matching token means the cached set is current, so the list isn't re-read.
+_allowed_searches_cache: Dict[str, Tuple[str, Optional[FrozenSet[str]]]] = {}
+_allowed_searches_cache_lock = threading.Lock()
+
+# Configured webhook tokens, memoized briefly so a burst of alerts doesn't hit the store once
+# per request. Entries are (expires_at, token); set_splunk_webhook_token drops the local entry.
+WEBHOOK_TOKEN_TTL_SECONDS = 30.0
+_WEBHOOK_TOKEN_CACHE_MAX = 1024
+_webhook_token_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+_webhook_token_cache_lock = threading.Lock()
+
 
 def splunk_alert_to_feedback_item(alert: dict, project_id: str) -> FeedbackItem:
     """
@@ -45,21 +59,22 @@ def splunk_alert_to_feedback_item(alert: dict, project_id: str) -> FeedbackItem:
     search_name = alert.get("search_name", "Splunk Alert")
     raw_log = result.get("_raw", "")
 
-    # Extract timestamp from _time field (Unix timestamp)
+    # Extract timestamp from _time field (Unix timestamp, possibly fractional: "1705315800.123")
+    created_at = None
     time_value = result.get("_time")
     if time_value:
         try:
-            created_at = datetime.fromtimestamp(int(time_value), tz=timezone.utc)
-        except (ValueError, TypeError):
-            created_at = datetime.now(timezone.utc)
-    else:
+            created_at = datetime.fromtimestamp(float(time_value), tz=timezone.utc)
+        except (ValueError, TypeError, OverflowError, OSError):
+            pass
+    if created_at is None:
         created_at = datetime.now(timezone.utc)
 
     return FeedbackItem(
         id=uuid4(),
         project_id=project_id,
         source="splunk",
-        external_id=alert.get("sid", str(uuid4())),
+        external_id=alert.get("sid") or str(uuid4()),
         title=f"[Splunk] {search_name}",
         body=raw_log,
         raw_text=f"{search_name} {raw_log}",
@@ -91,12 +106,29 @@ def verify_token(provided_token: Optional[str], project_id: str) -> bool:
     if not provided_token:
         return False
 
-    configured_token = get_splunk_webhook_token(project_id)
+    configured_token = _cached_webhook_token(project_id)
     if not configured_token:
         # If no token is configured, reject all requests for security
         return False
 
-    return hmac.compare_digest(provided_token, configured_token)
+    # Compare bytes: compare_digest rejects non-ASCII str arguments with a TypeError.
+    return hmac.compare_digest(provided_token.encode(), configured_token.encode())
+
+
+def _cached_webhook_token(project_id: str) -> Optional[str]:
+    """Return the configured webhook token, re-reading the store at most every TTL seconds."""
+    now = time.monotonic()
+    with _webhook_token_cache_lock:
+        cached = _webhook_token_cache.get(project_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    token = get_splunk_webhook_token(project_id)
+    with _webhook_token_cache_lock:
+        if len(_webhook_token_cache) >= _WEBHOOK_TOKEN_CACHE_MAX:
+            _webhook_token_cache.clear()
+        _webhook_token_cache[project_id] = (now + WEBHOOK_TOKEN_TTL_SECONDS, token)
+    return token
 
 
 def get_splunk_webhook_token(project_id: str) -> Optional[str]:
@@ -121,6 +153,8 @@ def set_splunk_webhook_token(project_id: str, token: str) -> None:
         token: Webhook token to store.
     """
     set_splunk_config(project_id, "webhook_token", token)
+    with _webhook_token_cache_lock:
+        _webhook_token_cache.pop(project_id, None)
 
 
 def get_splunk_allowed_searches(project_id: str) -> Optional[List[str]]:
@@ -141,7 +175,7 @@ def get_splunk_allowed_searches(project_id: str) -> Optional[List[str]]:
     if isinstance(value, str):
         try:
             parsed = json.loads(value)
-        except (json.JSONDecodeError, TypeError):
+        except (ValueError, TypeError):
             return None
         if isinstance(parsed, list):
             return [str(item) for item in parsed]
@@ -157,6 +191,33 @@ def set_splunk_allowed_searches(project_id: str, searches: List[str]) -> None:
         searches: List of saved search names to allow.
     """
     set_splunk_config(project_id, "searches", searches)
+    set_splunk_config(project_id, "searches:v", uuid4().hex)
+
+
+def _allowed_searches_set(project_id: str) -> Optional[FrozenSet[str]]:
+    """Return the allowed searches as a frozenset (None = allow all), cached per config version."""
+    version = get_splunk_config(project_id, "searches:v")
+    if version is not None:
+        with _allowed_searches_cache_lock:
+            cached = _allowed_searches_cache.get(project_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+    searches = get_splunk_allowed_searches(project_id)
+    allowed = frozenset(searches) if searches is not None else None
+    # Lists written before versioning have no token; those are simply re-read each time.
+    if version is not None:
+        with _allowed_searches_cache_lock:
+            _allowed_searches_cache[project_id] = (version, allowed)
+    return allowed
+
+
+def clear_splunk_config_caches() -> None:
+    """Drop cached allowed-search sets and webhook tokens (used by tests)."""
+    with _allowed_searches_cache_lock:
+        _allowed_searches_cache.clear()
+    with _webhook_token_cache_lock:
+        _webhook_token_cache.clear()
 
 
 def is_search_allowed(search_name: str, project_id: str) -> bool:
@@ -171,7 +232,7 @@ def is_search_allowed(search_name: str, project_id: str) -> bool:
         bool: True if the search is allowed, False otherwise.
               If no filter is configured, returns True (allow all).
     """
-    allowed_searches = get_splunk_allowed_searches(project_id)
+    allowed_searches = _allowed_searches_set(project_id)
     if allowed_searches is None:
         # No filter configured, allow all
         return True
@@ -6,15 +6,19 @@ Defaults to in-memory dicts, but will use Redis if configured (Upstash-friendly)
 import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 # Project ID can be UUID or CUID string from the dashboard
 ProjectId = Union[UUID, str]
 
 import requests
+from pydantic import TypeAdapter, ValidationError
 
 from models import FeedbackItem, IssueCluster, AgentJob, Project, User, ClusterJob, CodingPlan
 
@@ -34,6 +38,95 @@ def _iso_to_dt(value: str) -> datetime:
     return datetime.fromisoformat(value)
 
 
+def _decode_feedback_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode created_at and metadata of a stored feedback hash in place and return it."""
+    created_at = data.get("created_at")
+    if isinstance(created_at, str):
+        # Inlined _iso_to_dt: this runs once per row on every feedback read
+        data["created_at"] = datetime.fromisoformat(created_at)
+    metadata = data.get("metadata")
+    if isinstance(metadata, str):
+        try:
+            data["metadata"] = json.loads(metadata)
+        except json.JSONDecodeError:
+            data["metadata"] = {}
+    return data
+
+
+def _parse_feedback_row(data: Dict[str, Any]) -> FeedbackItem:
+    """
+    Build a FeedbackItem from a stored feedback hash, decoding created_at and metadata in place.
+
+    `data` must be a dict the caller owns (a fresh HGETALL reply). Raises ValueError or
+    TypeError when the row cannot be validated.
+    """
+    return FeedbackItem(**_decode_feedback_row(data))
+
+
+def _parse_job_row(data: Dict[str, Any]) -> AgentJob:
+    """
+    Build an AgentJob from a stored job hash, decoding its timestamps in place.
+
+    Raises ValueError or TypeError when the row cannot be decoded or validated.
+    """
+    for field in ("created_at", "updated_at"):
+        if isinstance(data.get(field), str):
+            data[field] = _iso_to_dt(data[field])
+    return AgentJob(**data)
+
+
+# How each FeedbackItem field is written into its Redis hash, resolved once from the model
+# schema instead of per call via model_dump() and isinstance checks. None fields are omitted.
+_FEEDBACK_FIELD_SERIALIZERS: Dict[str, Callable[[Any], str]] = {
+    name: str for name in FeedbackItem.model_fields
+}
+_FEEDBACK_FIELD_SERIALIZERS["created_at"] = datetime.isoformat  # _dt_to_iso without the extra frame
+_FEEDBACK_FIELD_SERIALIZERS["metadata"] = json.dumps
+
+
+def _feedback_hash_payload(item: FeedbackItem) -> Dict[str, str]:
+    """Return the string-valued HSET mapping for `item`."""
+    payload = {}
+    for name, serialize in _FEEDBACK_FIELD_SERIALIZERS.items():
+        value = getattr(item, name)
+        if value is not None:
+            payload[name] = serialize(value)
+    return payload
+
+
+# Validates a whole page of rows in one call into pydantic-core instead of one
+# constructor dispatch per row.
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(List[FeedbackItem])
+
+
+def _parse_feedback_rows(rows: Iterable[Optional[Dict[str, Any]]]) -> List[FeedbackItem]:
+    """
+    Parse fresh HGETALL replies into FeedbackItems, skipping empty or invalid rows.
+
+    All rows are validated in one batch; if any row is invalid, the batch is re-run row by
+    row so only the bad rows are dropped.
+    """
+    decoded = []
+    for data in rows:
+        if not data:
+            continue
+        try:
+            decoded.append(_decode_feedback_row(data))
+        except ValueError as e:
+            logger.debug("Failed to parse FeedbackItem: %s", e)
+    try:
+        return _FEEDBACK_LIST_ADAPTER.validate_python(decoded)
+    except ValidationError:
+        pass
+    items: List[FeedbackItem] = []
+    for data in decoded:
+        try:
+            items.append(FeedbackItem(**data))
+        except (ValueError, TypeError) as e:
+            logger.debug("Failed to parse FeedbackItem: %s", e)
+    return items
+
+
 def _strip_quotes(value: Optional[str]) -> Optional[str]:
     """Strip surrounding quotes from environment variable values."""
     if value is None:
@@ -42,6 +135,29 @@ def _strip_quotes(value: Optional[str]) -> Optional[str]:
     return value.strip('"').strip("'")
 
 
+def _mem_feedback_key(item_id: Union[UUID, str, int]) -> int:
+    """In-memory feedback dict key: the UUID's 128-bit int, which hashes natively in C."""
+    if isinstance(item_id, UUID):
+        return item_id.int
+    if isinstance(item_id, str):
+        return UUID(item_id).int
+    return item_id
+
+
+def _paginate(items: List[Any], cursor: int, limit: Optional[int]) -> Tuple[List[Any], int, bool]:
+    """
+    Slice an already-ordered list into a page.
+
+    Returns:
+        tuple: (page, next_cursor, has_more) using the same cursor semantics as get_job_logs.
+    """
+    if cursor < 0:
+        cursor = 0
+    end = len(items) if limit is None else min(len(items), cursor + limit)
+    page = items[cursor:end]
+    return (page, end, end < len(items))
+
+
 # ---------- Redis (standard) client helpers ----------
 
 
@@ -56,23 +172,177 @@ def _redis_client_from_env():
 # ---------- Upstash REST client (fallback when redis-py URL not provided) ----------
 
 
+def _hash_reply_to_dict(result: Any) -> Dict[str, str]:
+    # Upstash REST HGETALL returns ["field1", "value1", ...]
+    if not result:
+        return {}
+    # Pair fields with values off one iterator rather than two slice copies
+    pairs = iter(result)
+    try:
+        return dict(zip(pairs, pairs, strict=True))
+    except ValueError:
+        # Invalid response: odd number of elements, skip this entry
+        logger.warning("HGETALL returned odd number of elements, skipping")
+        return {}
+
+
+class _RESTPipeline:
+    """
+    Queue of Upstash REST commands sent as one `/pipeline` request.
+
+    Mirrors the subset of redis-py's `Pipeline` the store uses (queue calls, then `execute()`),
+    so both backends can share the same batching code. Also usable as a context manager,
+    which executes any queued commands on a clean exit.
+    """
+
+    def __init__(self, client: "UpstashRESTClient"):
+        self._client = client
+        self._commands: List[List[str]] = []
+        self._parsers: List[Optional[Any]] = []
+
+    def __enter__(self) -> "_RESTPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self._commands:
+            self.execute()
+
+    def _queue(self, *args: Any, parser=None) -> "_RESTPipeline":
+        self._commands.append([str(arg) for arg in args])
+        self._parsers.append(parser)
+        return self
+
+    def get(self, key: str) -> "_RESTPipeline":
+        return self._queue("GET", key)
+
+    def set(self, key: str, value: str) -> "_RESTPipeline":
+        return self._queue("SET", key, value)
+
+    def delete(self, *keys: str) -> "_RESTPipeline":
+        return self._queue("DEL", *keys)
+
+    def hset(self, key: str, mapping: Dict[str, Any]) -> "_RESTPipeline":
+        args: List[Any] = ["HSET", key]
+        for field, value in mapping.items():
+            args.extend([field, value])
+        return self._queue(*args)
+
+    def hgetall(self, key: str) -> "_RESTPipeline":
+        return self._queue("HGETALL", key, parser=_hash_reply_to_dict)
+
+    def sadd(self, key: str, *members: str) -> "_RESTPipeline":
+        return self._queue("SADD", key, *members)
+
+    def srem(self, key: str, *members: str) -> "_RESTPipeline":
+        return self._queue("SREM", key, *members)
+
+    def smembers(self, key: str) -> "_RESTPipeline":
+        return self._queue("SMEMBERS", key, parser=lambda result: result or [])
+
+    def zcard(self, key: str) -> "_RESTPipeline":
+        return self._queue("ZCARD", key, parser=lambda result: int(result or 0))
+
+    def zadd(self, key: str, mapping: Dict[str, float]) -> "_RESTPipeline":
+        args: List[Any] = ["ZADD", key]
+        for member, score in mapping.items():
+            args.extend([score, member])
+        return self._queue(*args)
+
+    def zrem(self, key: str, *members: str) -> "_RESTPipeline":
+        return self._queue("ZREM", key, *members)
+
+    def lrange(self, key: str, start: int, stop: int) -> "_RESTPipeline":
+        return self._queue("LRANGE", key, start, stop, parser=lambda result: result or [])
+
+    def llen(self, key: str) -> "_RESTPipeline":
+        return self._queue("LLEN", key, parser=lambda result: int(result or 0))
+
+    def execute(self) -> List[Any]:
+        """Send all queued commands in one request and return their results in order."""
+        commands, parsers = self._commands, self._parsers
+        self._commands, self._parsers = [], []
+        results = self._client.pipeline_exec(commands)
+        return [parser(result) if parser else result for parser, result in zip(parsers, results)]
+
+
+# Keep-alive connections held per Upstash host. FastAPI runs sync endpoints on a threadpool
+# (40 workers by default) that all share one client; requests' default pool of 10 would open
+# and then discard a fresh TLS connection for every concurrent call beyond that.
+REST_POOL_MAXSIZE = 50
+
+# Keys requested per SCAN step. Every step is a network round-trip (an HTTPS request on
+# Upstash REST), so fewer, larger steps make key sweeps like clear_* much cheaper.
+SCAN_COUNT = 1000
+
+# Items handled per pipeline by bulk deletes: keeps each Upstash request body well under
+# its size limit and avoids one huge MULTI/EXEC block on Redis.
+DELETE_BATCH_SIZE = 1000
+
+
+def _chunked(seq: List[Any], size: int) -> Iterable[List[Any]]:
+    return (seq[i:i + size] for i in range(0, len(seq), size))
+
+
+# Coding plans are written once per cluster and read on every plan/start-fix request, so
+# RedisStore keeps recently read or written plans in process. Entries expire so a plan
+# regenerated by another worker is picked up within the TTL.
+CODING_PLAN_CACHE_TTL_SECONDS = 30.0
+_CODING_PLAN_CACHE_MAX = 512
+
+
+def _build_rest_session() -> requests.Session:
+    """Create a session whose connection pool can serve the whole request threadpool."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=REST_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# One pooled session per Upstash endpoint for the whole process, so clients created per
+# store instance (or per test) reuse the same keep-alive connections.
+_REST_SESSIONS: Dict[str, requests.Session] = {}
+_REST_SESSIONS_LOCK = threading.Lock()
+
+
+def _shared_rest_session(base_url: str) -> requests.Session:
+    with _REST_SESSIONS_LOCK:
+        session = _REST_SESSIONS.get(base_url)
+        if session is None:
+            session = _REST_SESSIONS[base_url] = _build_rest_session()
+        return session
+
+
 class UpstashRESTClient:
     """Minimal Upstash REST wrapper for the commands we need."""
 
     def __init__(self, base_url: str, token: str):
         self.base_url = base_url.rstrip("/")
         self.token = token
-        self.session = requests.Session()
+        # Built once; sessions are shared across tokens, so auth can't live on session.headers
+        self._headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """The process-wide pooled session for this endpoint, created on first request."""
+        if self._session is None:
+            self._session = _shared_rest_session(self.base_url)
+        return self._session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        self._session = session
 
     def _cmd(self, *args: str):
         resp = self.session.post(
             self.base_url,
-            headers={"Authorization": f"Bearer {self.token}"},
-            json=list(args),
+            headers=self._headers,
+            data=json.dumps(list(args)).encode("utf-8"),
             timeout=10,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = json.loads(resp.content)
         return data.get("result")
 
     def pipeline_exec(self, commands: List[List[str]]) -> List[Any]:
@@ -90,15 +360,26 @@ class UpstashRESTClient:
             return []
         resp = self.session.post(
             f"{self.base_url}/pipeline",
-            headers={"Authorization": f"Bearer {self.token}"},
-            json=commands,
+            headers=self._headers,
+            data=json.dumps(commands).encode("utf-8"),
             timeout=30,  # Longer timeout for batch operations
         )
         resp.raise_for_status()
-        results = resp.json()
+        results = json.loads(resp.content)
         # Results are in format [{"result": ...}, {"result": ...}, ...]
         return [r.get("result") for r in results]
 
+    def pipeline(self, transaction: bool = True) -> _RESTPipeline:
+        """
+        Start a command batch that is sent as a single `/pipeline` request.
+
+        Queue commands on the returned object and call `execute()` (or use it as a context
+        manager) to collapse what would be one HTTPS round-trip per command into one.
+        `transaction` is accepted for redis-py compatibility; Upstash `/pipeline` is never
+        atomic.
+        """
+        return _RESTPipeline(self)
+
     def hgetall_batch(self, keys: List[str]) -> List[Dict[str, str]]:
         """
         Batch fetch multiple hashes in a single pipeline request.
@@ -111,20 +392,10 @@ class UpstashRESTClient:
         """
         if not keys:
             return []
-        commands = [["HGETALL", key] for key in keys]
-        results = self.pipeline_exec(commands)
-        parsed = []
-        for result in results:
-            if not result:
-                parsed.append({})
-            elif len(result) % 2 != 0:
-                # Invalid response: odd number of elements, skip this entry
-                logger.warning("HGETALL returned odd number of elements, skipping")
-                parsed.append({})
-            else:
-                # Convert list to dict: ["field1", "value1", ...] -> {"field1": "value1", ...}
-                parsed.append(dict(zip(result[0::2], result[1::2])))
-        return parsed
+        pipe = self.pipeline()
+        for key in keys:
+            pipe.hgetall(key)
+        return pipe.execute()
 
     def set(self, key: str, value: str):
         """
@@ -139,6 +410,31 @@ class UpstashRESTClient:
         """
         return self._cmd("SET", key, value)
 
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Fetch several string keys with one MGET.
+
+        Returns:
+            List[Optional[str]]: One value per key, in order; `None` for missing keys.
+        """
+        if not keys:
+            return []
+        return self._cmd("MGET", *keys) or []
+
+    def mset(self, mapping: Dict[str, str]):
+        """
+        Set several string keys with one MSET.
+
+        Returns:
+            The raw Redis reply ("OK"), or None if `mapping` is empty.
+        """
+        if not mapping:
+            return None
+        args = ["MSET"]
+        for key, value in mapping.items():
+            args.extend([key, value])
+        return self._cmd(*args)
+
     def set_with_opts(self, key: str, value: str, *options: str):
         """
         Execute SET with additional options (e.g., NX/EX) supported by Upstash REST.
@@ -165,12 +461,7 @@ class UpstashRESTClient:
         return self._cmd(*args)
 
     def hgetall(self, key: str) -> Dict[str, str]:
-        # Upstash REST HGETALL returns ["field1", "value1", ...]
-        result = self._cmd("HGETALL", key)
-        if not result:
-            return {}
-        # Convert list to dict
-        return dict(zip(result[0::2], result[1::2]))
+        return _hash_reply_to_dict(self._cmd("HGETALL", key))
 
     def hdel(self, key: str, *fields: str) -> int:
         if not fields:
@@ -180,6 +471,17 @@ class UpstashRESTClient:
     def zadd(self, key: str, score: float, member: str):
         return self._cmd("ZADD", key, str(score), member)
 
+    def zrem(self, key: str, *members: str) -> int:
+        """
+        Remove one or more members from the sorted set stored at `key`.
+
+        Returns:
+            int: The number of members that were removed.
+        """
+        if not members:
+            return 0
+        return int(self._cmd("ZREM", key, *members) or 0)
+
     def zrange(self, key: str, start: int, stop: int, rev: bool = False) -> List[str]:
         args = ["ZRANGE", key, str(start), str(stop)]
         if rev:
@@ -200,6 +502,12 @@ class UpstashRESTClient:
         result = self._cmd("ZCARD", key)
         return int(result or 0)
 
+    def scard(self, key: str) -> int:
+        """
+        Return the number of members of a set (0 if the key doesn't exist).
+        """
+        return int(self._cmd("SCARD", key) or 0)
+
     def rpush(self, key: str, *values: str) -> int:
         """
         Append one or more values to the end of a Redis list.
@@ -270,7 +578,7 @@ class UpstashRESTClient:
             return 0
         return self._cmd("DEL", *keys)
 
-    def scan_iter(self, pattern: str, count: int = 100) -> Iterable[str]:
+    def scan_iter(self, pattern: str, count: int = SCAN_COUNT) -> Iterable[str]:
         cursor = "0"
         while True:
             result = self._cmd("SCAN", cursor, "MATCH", pattern, "COUNT", str(count))
@@ -308,14 +616,19 @@ class InMemoryStore:
             reddit_subreddits: Mapping from project ID (str) to list of subreddit names.
             datadog_webhook_secrets: Mapping from project ID (str) to Datadog webhook secret.
             datadog_monitors: Mapping from project ID (str) to list of Datadog monitor IDs.
-            external_index: Mapping from (project_id, source, external_id) to feedback UUID for deduplication/lookup.
-            unclustered_feedback_ids: Mapping from project ID (str) to set of feedback UUIDs not assigned to any cluster.
+            external_index: Mapping from (project_id, source, external_id) to feedback key for deduplication/lookup.
+            unclustered_feedback_ids: Mapping from project ID (str) to set of feedback keys not assigned to any cluster.
+            project_feedback_keys: Mapping from project ID (str) to its feedback keys, in insertion order.
+            project_cluster_ids: Mapping from project ID (str) to its cluster IDs, in insertion order.
+            jobs_by_cluster: Mapping from cluster ID (str) to its AgentJob IDs, in insertion order.
             cluster_jobs: Mapping from cluster job ID (str) to ClusterJob.
-            cluster_job_index: Mapping from project ID (str) to list of cluster job IDs in recent order.
+            cluster_job_index: Mapping from project ID (str) to (deque of cluster job IDs, most recent
+                first; set of the same IDs for membership checks).
             cluster_locks: Mapping from project ID (str) to lock owner/job ID (str) for in-memory lock tracking.
             config: Generic key-value configuration storage.
         """
-        self.feedback_items: Dict[UUID, FeedbackItem] = {}
+        # Feedback is keyed by `UUID.int` (see `_mem_feedback_key`) rather than UUID objects.
+        self.feedback_items: Dict[int, FeedbackItem] = {}
         self.issue_clusters: Dict[str, IssueCluster] = {}
         self.coding_plans: Dict[str, CodingPlan] = {}  # cluster_id -> CodingPlan
         self.agent_jobs: Dict[UUID, AgentJob] = {}
@@ -325,12 +638,17 @@ class InMemoryStore:
         self.reddit_subreddits: Dict[str, List[str]] = {}
         self.datadog_webhook_secrets: Dict[str, str] = {}
         self.datadog_monitors: Dict[str, List[str]] = {}
-        self.external_index: Dict[Tuple[str, str, str], UUID] = {}
-        # Track unclustered feedback per project (project_id -> set(feedback_ids))
-        self.unclustered_feedback_ids: Dict[str, set[UUID]] = {}
+        self.external_index: Dict[Tuple[str, str, str], int] = {}
+        # Track unclustered feedback per project (project_id -> set(feedback keys))
+        self.unclustered_feedback_ids: Dict[str, set[int]] = {}
+        # Per-project secondary indexes (dicts used as insertion-ordered sets) so project-scoped
+        # reads and deletes touch only that project's entries instead of scanning everything.
+        self.project_feedback_keys: Dict[str, Dict[int, None]] = {}
+        self.project_cluster_ids: Dict[str, Dict[str, None]] = {}
+        self.jobs_by_cluster: Dict[str, Dict[UUID, None]] = {}
         # Cluster jobs and locks (in-memory)
         self.cluster_jobs: Dict[str, ClusterJob] = {}
-        self.cluster_job_index: Dict[str, List[str]] = {}
+        self.cluster_job_index: Dict[str, Tuple[Deque[str], Set[str]]] = {}
         self.cluster_locks: Dict[str, str] = {}
         # Generic key-value config storage
         self.config: Dict[str, str] = {}
@@ -356,18 +674,48 @@ class InMemoryStore:
             FeedbackItem: The stored feedback item; if an item with the same (project_id, source, external_id) already exists, returns that existing item.
         """
         # Allow either UUID or string identifiers; skip strict project existence check in-memory
-        project_key = str(item.project_id)
+        project_key = item.project_id
+        item_key = item.id.int
         if item.external_id:
             key = (project_key, item.source, item.external_id)
-            existing_id = self.external_index.get(key)
-            if existing_id:
-                return self.feedback_items[existing_id]
-            self.external_index[key] = item.id
-        self.feedback_items[item.id] = item
+            existing_key = self.external_index.get(key)
+            if existing_key is not None:
+                return self.feedback_items[existing_key]
+            self.external_index[key] = item_key
+        self.feedback_items[item_key] = item
+        self.project_feedback_keys.setdefault(project_key, {})[item_key] = None
         # Add to unclustered set (Phase 1: ingestion moat)
-        self.unclustered_feedback_ids.setdefault(project_key, set()).add(item.id)
+        self.unclustered_feedback_ids.setdefault(project_key, set()).add(item_key)
         return item
 
+    def add_feedback_items_batch(self, items: List[FeedbackItem]) -> List[FeedbackItem]:
+        """
+        Add many FeedbackItems at once, with the same external_id deduplication as `add_feedback_item`.
+
+        New items are collected first and written with one `dict.update`, instead of one
+        `add_feedback_item` call per item.
+
+        Returns:
+            List[FeedbackItem]: For each input, the stored item (the existing one for duplicates).
+        """
+        stored: List[FeedbackItem] = []
+        new_items: Dict[int, FeedbackItem] = {}
+        for item in items:
+            item_key = item.id.int
+            if item.external_id:
+                key = (item.project_id, item.source, item.external_id)
+                existing_key = self.external_index.get(key)
+                if existing_key is not None:
+                    stored.append(new_items.get(existing_key) or self.feedback_items[existing_key])
+                    continue
+                self.external_index[key] = item_key
+            new_items[item_key] = item
+            self.project_feedback_keys.setdefault(item.project_id, {})[item_key] = None
+            self.unclustered_feedback_ids.setdefault(item.project_id, set()).add(item_key)
+            stored.append(item)
+        self.feedback_items.update(new_items)
+        return stored
+
     def get_feedback_item(self, project_id: str, item_id: Union[UUID, str]) -> Optional[FeedbackItem]:
         """
         Retrieve a feedback item by its UUID within a project scope.
@@ -375,10 +723,8 @@ class InMemoryStore:
         Returns:
             `FeedbackItem` if an item with the given `item_id` exists and belongs to the project, `None` otherwise.
         """
-        # Convert string ID to UUID if needed for dictionary lookup
-        lookup_id = UUID(item_id) if isinstance(item_id, str) else item_id
-        item = self.feedback_items.get(lookup_id)
-        if item and str(item.project_id) == str(project_id):
+        item = self.feedback_items.get(_mem_feedback_key(item_id))
+        if item and item.project_id == str(project_id):
             return item
         return None
 
@@ -397,9 +743,8 @@ class InMemoryStore:
         """
         if not project_id:
             raise ValueError("project_id is required for get_all_feedback_items")
-        return [
-            item for item in self.feedback_items.values() if str(item.project_id) == str(project_id)
-        ]
+        feedback_items = self.feedback_items
+        return [feedback_items[key] for key in self.project_feedback_keys.get(str(project_id), ())]
 
     def get_unclustered_feedback(self, project_id: str) -> List[FeedbackItem]:
         """
@@ -408,15 +753,15 @@ class InMemoryStore:
         Returns:
             List[FeedbackItem]: FeedbackItem objects from the project's unclustered set (existing items only).
         """
-        key = str(project_id)
-        project_unclustered = self.unclustered_feedback_ids.get(key, set())
-        return [
-            self.feedback_items[item_id]
-            for item_id in project_unclustered
-            if item_id in self.feedback_items
-        ]
+        project_unclustered = self.unclustered_feedback_ids.get(str(project_id), ())
+        get = self.feedback_items.get
+        return [item for item in map(get, project_unclustered) if item is not None]
 
-    def remove_from_unclustered(self, feedback_id: UUID, project_id: str):
+    def count_unclustered_feedback(self, project_id: str) -> int:
+        """Return the size of the project's unclustered set without loading the items."""
+        return len(self.unclustered_feedback_ids.get(str(project_id), ()))
+
+    def remove_from_unclustered(self, feedback_id: Union[UUID, str, int], project_id: str):
         """
         Remove a feedback item's ID from the project's unclustered set.
         
@@ -427,37 +772,37 @@ class InMemoryStore:
         Behavior:
             Performs a no-op if the project does not exist or the feedback ID is not present in the set.
         """
-        key = str(project_id)
-        if key in self.unclustered_feedback_ids:
-            self.unclustered_feedback_ids[key].discard(feedback_id)
+        project_unclustered = self.unclustered_feedback_ids.get(str(project_id))
+        if project_unclustered is not None:
+            project_unclustered.discard(_mem_feedback_key(feedback_id))
 
     def update_feedback_item(self, project_id: str, item_id: Union[UUID, str], **updates) -> FeedbackItem:
         """
         Update mutable fields of a feedback item and return the updated object.
         """
-        # Convert string ID to UUID if needed for dictionary lookup
-        lookup_id = UUID(item_id) if isinstance(item_id, str) else item_id
-        existing = self.feedback_items.get(lookup_id)
+        lookup_key = _mem_feedback_key(item_id)
+        existing = self.feedback_items.get(lookup_key)
         if not existing:
             raise KeyError("feedback not found")
         # Verify project scoping: ensure the item belongs to the given project
-        if str(existing.project_id) != str(project_id):
+        if existing.project_id != str(project_id):
             raise KeyError(f"Feedback {item_id} not found for project {project_id}")
         updated = existing.model_copy(update=updates)
-        self.feedback_items[lookup_id] = updated
+        self.feedback_items[lookup_key] = updated
         return updated
 
     def get_feedback_by_external_id(self, project_id: str, source: str, external_id: str) -> Optional[FeedbackItem]:
         """
         Lookup a feedback item by project, source, and external_id (in-memory).
         """
-        key = (str(project_id), source, external_id)
-        feedback_id = self.external_index.get(key)
-        if feedback_id:
-            return self.feedback_items.get(feedback_id)
-        # Fallback scan
-        for item in self.feedback_items.values():
-            if str(item.project_id) == str(project_id) and item.source == source and item.external_id == external_id:
+        project_key = str(project_id)
+        feedback_key = self.external_index.get((project_key, source, external_id))
+        if feedback_key is not None:
+            return self.feedback_items.get(feedback_key)
+        # Fallback scan (project's items only)
+        for key in self.project_feedback_keys.get(project_key, ()):
+            item = self.feedback_items[key]
+            if item.source == source and item.external_id == external_id:
                 return item
         return None
 
@@ -469,17 +814,17 @@ class InMemoryStore:
         This clears feedback_items, the external_id index, and the set tracking unclustered feedback IDs.
         """
         if project_id:
-            # Drop feedback for the given project_id
-            ids_to_delete = [fid for fid, item in self.feedback_items.items() if str(item.project_id) == str(project_id)]
-            for fid in ids_to_delete:
-                self.feedback_items.pop(fid, None)
-            # Rebuild external index and unclustered sets to avoid stale entries
-            self.external_index = {
-                k: v for k, v in self.external_index.items() if str(k[0]) != str(project_id)
-            }
-            self.unclustered_feedback_ids.pop(project_id, None)
+            # Drop the project's feedback and its external_id entries via the project index,
+            # touching only this project's data rather than rebuilding the whole external index
+            project_key = str(project_id)
+            for fid in self.project_feedback_keys.pop(project_key, ()):
+                item = self.feedback_items.pop(fid, None)
+                if item is not None and item.external_id:
+                    self.external_index.pop((project_key, item.source, item.external_id), None)
+            self.unclustered_feedback_ids.pop(project_key, None)
         else:
             self.feedback_items.clear()
+            self.project_feedback_keys.clear()
             self.external_index.clear()
             self.unclustered_feedback_ids.clear()
 
@@ -494,12 +839,14 @@ class InMemoryStore:
         Returns:
             bool: True if item was deleted, False if not found.
         """
-        item = self.feedback_items.get(item_id)
-        if not item or str(item.project_id) != str(project_id):
+        item_key = _mem_feedback_key(item_id)
+        item = self.feedback_items.get(item_key)
+        if not item or item.project_id != str(project_id):
             return False
 
         # Remove from main store
-        del self.feedback_items[item_id]
+        del self.feedback_items[item_key]
+        self.project_feedback_keys.get(item.project_id, {}).pop(item_key, None)
 
         # Remove from external index
         if item.external_id:
@@ -507,7 +854,7 @@ class InMemoryStore:
             self.external_index.pop(key, None)
 
         # Remove from unclustered set
-        self.remove_from_unclustered(item_id, project_id)
+        self.remove_from_unclustered(item_key, project_id)
 
         return True
 
@@ -522,7 +869,11 @@ class InMemoryStore:
         Returns:
         	IssueCluster: The stored cluster instance.
         """
+        previous = self.issue_clusters.get(cluster.id)
+        if previous is not None and previous.project_id != cluster.project_id:
+            self.project_cluster_ids.get(previous.project_id, {}).pop(cluster.id, None)
         self.issue_clusters[cluster.id] = cluster
+        self.project_cluster_ids.setdefault(cluster.project_id, {})[cluster.id] = None
         return cluster
 
     def get_cluster(self, project_id: Optional[str], cluster_id: str) -> Optional[IssueCluster]:
@@ -535,7 +886,7 @@ class InMemoryStore:
             return None
         if project_id is None:
             return cluster
-        return cluster if str(cluster.project_id) == str(project_id) else None
+        return cluster if cluster.project_id == str(project_id) else None
 
     def get_all_clusters(self, project_id: str) -> List[IssueCluster]:
         """
@@ -552,7 +903,8 @@ class InMemoryStore:
         """
         if not project_id:
             raise ValueError("project_id is required for get_all_clusters")
-        return [c for c in self.issue_clusters.values() if str(c.project_id) == str(project_id)]
+        issue_clusters = self.issue_clusters
+        return [issue_clusters[cid] for cid in self.project_cluster_ids.get(str(project_id), ())]
 
     def update_cluster(self, project_id: Optional[str], cluster_id: str, **updates) -> IssueCluster:
         """
@@ -570,7 +922,7 @@ class InMemoryStore:
             KeyError: If no cluster exists with `cluster_id`, or if `project_id` is provided and does not match the cluster's project.
         """
         cluster = self.issue_clusters[cluster_id]
-        if project_id is not None and str(cluster.project_id) != str(project_id):
+        if project_id is not None and cluster.project_id != str(project_id):
             raise KeyError(f"Cluster {cluster_id} not found for project {project_id}")
         updated_cluster = cluster.model_copy(update=updates)
         self.issue_clusters[cluster_id] = updated_cluster
@@ -594,10 +946,12 @@ class InMemoryStore:
         cluster = self.issue_clusters.get(cluster_id)
         if not cluster:
             raise KeyError(f"Cluster {cluster_id} not found")
-        if project_id and str(cluster.project_id) != str(project_id):
+        if project_id and cluster.project_id != str(project_id):
             raise KeyError(f"Cluster {cluster_id} not found for project {project_id}")
         if feedback_id not in cluster.feedback_ids:
-            cluster.feedback_ids.append(feedback_id)
+            self.issue_clusters[cluster_id] = cluster.model_copy(
+                update={"feedback_ids": [*cluster.feedback_ids, feedback_id]}
+            )
 
     def delete_cluster(self, project_id: str, cluster_id: str) -> None:
         """
@@ -608,8 +962,9 @@ class InMemoryStore:
             cluster_id (str): Identifier of the cluster to remove.
         """
         cluster = self.issue_clusters.get(cluster_id)
-        if cluster and (not project_id or str(cluster.project_id) == str(project_id)):
+        if cluster and (not project_id or cluster.project_id == str(project_id)):
             del self.issue_clusters[cluster_id]
+            self.project_cluster_ids.get(cluster.project_id, {}).pop(cluster_id, None)
 
     def clear_clusters(self, project_id: Optional[str] = None):
         """
@@ -619,13 +974,11 @@ class InMemoryStore:
             project_id (Optional[str]): If provided, only clusters whose project_id matches this value are removed; if omitted, all clusters are removed.
         """
         if project_id:
-            ids_to_delete = [
-                cid for cid, cluster in self.issue_clusters.items() if str(cluster.project_id) == str(project_id)
-            ]
-            for cid in ids_to_delete:
+            for cid in self.project_cluster_ids.pop(str(project_id), ()):
                 self.issue_clusters.pop(cid, None)
         else:
             self.issue_clusters.clear()
+            self.project_cluster_ids.clear()
 
 
     # Coding Plans
@@ -711,9 +1064,7 @@ class InMemoryStore:
         pid_str = str(project_id)
         if not hasattr(self, "sentry_config"):
             self.sentry_config = {}
-        if pid_str not in self.sentry_config:
-            self.sentry_config[pid_str] = {}
-        self.sentry_config[pid_str][key] = value
+        self.sentry_config.setdefault(pid_str, {})[key] = value
 
     def get_sentry_config(self, project_id: ProjectId, key: str) -> Optional[Any]:
         """
@@ -744,9 +1095,7 @@ class InMemoryStore:
         pid_str = str(project_id)
         if not hasattr(self, "splunk_config"):
             self.splunk_config = {}
-        if pid_str not in self.splunk_config:
-            self.splunk_config[pid_str] = {}
-        self.splunk_config[pid_str][key] = value
+        self.splunk_config.setdefault(pid_str, {})[key] = value
 
     def get_splunk_config(self, project_id: ProjectId, key: str) -> Optional[Any]:
         """
@@ -777,9 +1126,7 @@ class InMemoryStore:
         pid_str = str(project_id)
         if not hasattr(self, "datadog_config"):
             self.datadog_config = {}
-        if pid_str not in self.datadog_config:
-            self.datadog_config[pid_str] = {}
-        self.datadog_config[pid_str][key] = value
+        self.datadog_config.setdefault(pid_str, {})[key] = value
 
     def get_datadog_config(self, project_id: ProjectId, key: str) -> Optional[Any]:
         """
@@ -810,9 +1157,7 @@ class InMemoryStore:
         pid_str = str(project_id)
         if not hasattr(self, "posthog_config"):
             self.posthog_config = {}
-        if pid_str not in self.posthog_config:
-            self.posthog_config[pid_str] = {}
-        self.posthog_config[pid_str][key] = value
+        self.posthog_config.setdefault(pid_str, {})[key] = value
 
     def get_posthog_config(self, project_id: ProjectId, key: str) -> Optional[Any]:
         """
@@ -938,7 +1283,11 @@ class InMemoryStore:
             KeyError: If the job's project_id does not exist.
         """
         # Do not enforce project existence for in-memory tests; allow ad-hoc jobs
+        previous = self.agent_jobs.get(job.id)
+        if previous is not None and previous.cluster_id != job.cluster_id:
+            self.jobs_by_cluster.get(previous.cluster_id, {}).pop(job.id, None)
         self.agent_jobs[job.id] = job
+        self.jobs_by_cluster.setdefault(job.cluster_id, {})[job.id] = None
         return job
 
     def get_job(self, job_id: Union[UUID, str]) -> Optional[AgentJob]:
@@ -946,12 +1295,27 @@ class InMemoryStore:
         lookup_id = UUID(job_id) if isinstance(job_id, str) else job_id
         return self.agent_jobs.get(lookup_id)
 
+    def get_job_for_project(self, project_id: str, job_id: Union[UUID, str]) -> Optional[AgentJob]:
+        """
+        Retrieve a job only if it belongs to the given project.
+
+        Returns:
+            AgentJob or None: The job when it exists and is scoped to `project_id`, otherwise `None`.
+        """
+        job = self.get_job(job_id)
+        if job and job.project_id == str(project_id):
+            return job
+        return None
+
     def update_job(self, job_id: Union[UUID, str], **updates) -> AgentJob:
         # Convert string ID to UUID if needed for dictionary lookup
         lookup_id = UUID(job_id) if isinstance(job_id, str) else job_id
         job = self.agent_jobs[lookup_id]
         updated_job = job.model_copy(update=updates)
         self.agent_jobs[lookup_id] = updated_job
+        if updated_job.cluster_id != job.cluster_id:
+            self.jobs_by_cluster.get(job.cluster_id, {}).pop(lookup_id, None)
+            self.jobs_by_cluster.setdefault(updated_job.cluster_id, {})[lookup_id] = None
         return updated_job
 
     def append_job_log(self, job_id: UUID, message: str) -> None:
@@ -970,9 +1334,8 @@ class InMemoryStore:
         return (chunk, next_cursor, has_more)
 
     def get_jobs_by_cluster(self, cluster_id: str) -> List[AgentJob]:
-        return [
-            job for job in self.agent_jobs.values() if job.cluster_id == cluster_id
-        ]
+        agent_jobs = self.agent_jobs
+        return [agent_jobs[jid] for jid in self.jobs_by_cluster.get(cluster_id, ())]
 
     def get_all_jobs(self) -> List[AgentJob]:
         return list(self.agent_jobs.values())
@@ -989,11 +1352,35 @@ class InMemoryStore:
         """
         jobs = [
             job for job in self.agent_jobs.values()
-            if str(job.project_id) == project_id
+            if job.project_id == project_id
         ]
         jobs.sort(key=lambda x: x.created_at, reverse=True)
         return jobs
 
+    def get_jobs_page_for_project(
+        self, project_id: str, cursor: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[AgentJob], int, bool]:
+        """
+        Return a page of a project's jobs, newest first.
+
+        Returns:
+            tuple[list[AgentJob], int, bool]: (jobs, next_cursor, has_more).
+        """
+        return _paginate(self.get_all_jobs_for_project(project_id), cursor, limit)
+
+    def get_jobs_page_by_cluster(
+        self, cluster_id: str, project_id: str, cursor: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[AgentJob], int, bool]:
+        """
+        Return a page of a cluster's jobs scoped to a project, newest first.
+
+        Returns:
+            tuple[list[AgentJob], int, bool]: (jobs, next_cursor, has_more).
+        """
+        jobs = [job for job in self.get_jobs_by_cluster(cluster_id) if job.project_id == project_id]
+        jobs.sort(key=lambda x: x.created_at, reverse=True)
+        return _paginate(jobs, cursor, limit)
+
     def clear_jobs(self):
         """
         Clear all AgentJob entries from this store.
@@ -1001,6 +1388,7 @@ class InMemoryStore:
         This removes every AgentJob from the in-memory job mapping.
         """
         self.agent_jobs.clear()
+        self.jobs_by_cluster.clear()
         self.job_logs.clear()
 
     # Cluster Jobs (clustering runner)
@@ -1017,11 +1405,16 @@ class InMemoryStore:
         job_id = str(job.id)
         pid = str(job.project_id)
         self.cluster_jobs[job_id] = job
-        self.cluster_job_index.setdefault(pid, [])
         # maintain most recent first
-        self.cluster_job_index[pid] = [job_id] + [
-            jid for jid in self.cluster_job_index[pid] if jid != job_id
-        ]
+        recent, seen = self.cluster_job_index.setdefault(pid, (deque(), set()))
+        if recent and recent[0] == job_id:
+            # Updating the newest job (the common case): order is unchanged
+            return job
+        if job_id in seen:
+            recent.remove(job_id)
+        else:
+            seen.add(job_id)
+        recent.appendleft(job_id)
         return job
 
     def get_cluster_job(self, project_id: str, job_id: str) -> Optional[ClusterJob]:
@@ -1036,7 +1429,7 @@ class InMemoryStore:
             ClusterJob or None: The matching ClusterJob when it exists and is scoped to `project_id`, otherwise `None`.
         """
         job = self.cluster_jobs.get(job_id)
-        if job and str(job.project_id) == str(project_id):
+        if job and job.project_id == str(project_id):
             return job
         return None
 
@@ -1051,8 +1444,11 @@ class InMemoryStore:
         Returns:
         	list[ClusterJob]: Up to `limit` ClusterJob objects for the project in the store's recorded order.
         """
-        ids = self.cluster_job_index.get(str(project_id), [])
-        return [self.cluster_jobs[jid] for jid in ids[:limit] if jid in self.cluster_jobs]
+        index = self.cluster_job_index.get(str(project_id))
+        if index is None:
+            return []
+        cluster_jobs = self.cluster_jobs
+        return [cluster_jobs[jid] for jid in islice(index[0], limit)]
 
     def update_cluster_job(self, project_id: str, job_id: str, **updates) -> ClusterJob:
         """
@@ -1079,7 +1475,7 @@ class InMemoryStore:
         """
         Acquire a non-expiring lock for a cluster job within a project.
         
-        Attempts to acquire a lock scoped to the given project; if no lock is held, records this job_id as the lock holder and returns success. The in-memory implementation does not enforce TTL — the `ttl_seconds` parameter is accepted for API compatibility but is ignored; the lock remains until released via `release_cluster_lock`.
+        Attempts to acquire a lock scoped to the given project; if no lock is held, records this job_id as the lock holder and returns success. The check and the claim are a single `dict.setdefault`, which is atomic under the GIL, so concurrent callers cannot both acquire. The in-memory implementation does not enforce TTL — the `ttl_seconds` parameter is accepted for API compatibility but is ignored; the lock remains until released via `release_cluster_lock`.
         
         Parameters:
             project_id (str): The project identifier to lock.
@@ -1089,12 +1485,7 @@ class InMemoryStore:
         Returns:
             bool: `true` if the lock was acquired, `false` otherwise.
         """
-        key = str(project_id)
-        holder = self.cluster_locks.get(key)
-        if holder:
-            return False
-        self.cluster_locks[key] = job_id
-        return True
+        return self.cluster_locks.setdefault(str(project_id), job_id) == job_id
 
     def release_cluster_lock(self, project_id: str, job_id: str):
         """
@@ -1130,7 +1521,7 @@ class InMemoryStore:
         Returns:
             Project: The stored project instance.
         """
-        self.projects[str(project.id)] = project
+        self.projects[project.id] = project
         return project
 
     def get_projects_for_user(self, user_id: UUID | str) -> List[Project]:
@@ -1168,8 +1559,7 @@ class InMemoryStore:
         user_projects = self.get_projects_for_user(user_id)
         count = 0
         for project in user_projects:
-            count += len([f for f in self.feedback_items.values()
-                          if str(f.project_id) == str(project.id)])
+            count += len(self.project_feedback_keys.get(project.id, ()))
         return count
 
     def count_successful_jobs_for_user(self, user_id: str) -> int:
@@ -1186,7 +1576,7 @@ class InMemoryStore:
         project_ids = {str(p.id) for p in user_projects}
 
         return sum(1 for job in self.agent_jobs.values()
-                   if str(job.project_id) in project_ids
+                   if job.project_id in project_ids
                    and job.status == "success")
 
     def get_user_id_for_project(self, project_id: str) -> str:
@@ -1244,6 +1634,9 @@ class RedisStore:
             if not rest_client:
                 raise RuntimeError("RedisStore requires REDIS_URL/UPSTASH_REDIS_URL or UPSTASH_REDIS_REST_URL/_TOKEN")
             self.client = rest_client
+        # Redis key -> (expires_at, plan), least recently used first
+        self._coding_plan_cache: "OrderedDict[str, Tuple[float, CodingPlan]]" = OrderedDict()
+        self._coding_plan_cache_lock = threading.Lock()
 
     # Key helpers - MUST match dashboard/lib/redis.ts patterns!
     @staticmethod
@@ -1381,12 +1774,29 @@ class RedisStore:
             raise ValueError("CodingPlan.project_id is required for storage")
         key = self._coding_plan_key(plan.project_id, plan.cluster_id)
         self.client.set(key, plan.model_dump_json())
+        self._cache_coding_plan(key, plan)
         return plan
 
+    def _cache_coding_plan(self, key: str, plan: CodingPlan) -> None:
+        with self._coding_plan_cache_lock:
+            cache = self._coding_plan_cache
+            cache[key] = (time.monotonic() + CODING_PLAN_CACHE_TTL_SECONDS, plan)
+            cache.move_to_end(key)
+            while len(cache) > _CODING_PLAN_CACHE_MAX:
+                cache.popitem(last=False)
+
+    def clear_coding_plan_cache(self) -> None:
+        """Drop all in-process cached coding plans."""
+        with self._coding_plan_cache_lock:
+            self._coding_plan_cache.clear()
+
     def get_coding_plan(self, project_id: str, cluster_id: str) -> Optional[CodingPlan]:
         """
         Retrieve a CodingPlan from Redis.
 
+        Plans this process read or wrote within CODING_PLAN_CACHE_TTL_SECONDS are served from
+        memory without a round-trip.
+
         Parameters:
             project_id (str): Project identifier for namespace isolation.
             cluster_id (str): Cluster identifier.
@@ -1395,6 +1805,11 @@ class RedisStore:
             Optional[CodingPlan]: The coding plan if found, None otherwise.
         """
         key = self._coding_plan_key(project_id, cluster_id)
+        with self._coding_plan_cache_lock:
+            cached = self._coding_plan_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._coding_plan_cache.move_to_end(key)
+                return cached[1]
         data = self.client.get(key)
         if not data:
             # Fallback to old key format without project_id
@@ -1402,7 +1817,9 @@ class RedisStore:
             data = self.client.get(old_key)
         if not data:
             return None
-        return CodingPlan.model_validate_json(data)
+        plan = CodingPlan.model_validate_json(data)
+        self._cache_coding_plan(key, plan)
+        return plan
 
     @staticmethod
     def _cluster_lock_key(project_id: str) -> str:
@@ -1517,32 +1934,28 @@ class RedisStore:
         Returns:
             FeedbackItem: The same feedback item that was added.
         """
-        payload = item.model_dump()
-        if isinstance(payload["created_at"], datetime):
-            payload["created_at"] = _dt_to_iso(payload["created_at"])
-        
-        # Serialize metadata if present
-        if isinstance(payload.get("metadata"), dict):
-            payload["metadata"] = json.dumps(payload["metadata"])
+        # All five writes go out as one pipeline (one HTTPS request on Upstash REST)
+        pipe = self.client.pipeline()
+        self._queue_feedback_item(pipe, item)
+        pipe.execute()
+        return item
 
+    def _queue_feedback_item(self, pipe, item: FeedbackItem) -> None:
+        """Queue the hash, created/source indexes, unclustered entry and external_id mapping for `item`."""
         # Use HSET (Hash) instead of SET (JSON)
-        # Convert all values to strings for HSET
-        hash_payload = {k: str(v) for k, v in payload.items() if v is not None}
-        
-        project_id = str(item.project_id)
-        key = self._feedback_key(project_id, item.id)
-        self._hset(key, hash_payload)
+        hash_payload = _feedback_hash_payload(item)
 
+        project_id = item.project_id
+        member = str(item.id)
         ts = item.created_at.timestamp() if isinstance(item.created_at, datetime) else time.time()
-        self._zadd(self._feedback_created_key(project_id), ts, str(item.id))
-        self._zadd(self._feedback_source_key(project_id, item.source), ts, str(item.id))
-        
+
+        pipe.hset(self._feedback_key(project_id, item.id), mapping=hash_payload)
+        pipe.zadd(self._feedback_created_key(project_id), {member: ts})
+        pipe.zadd(self._feedback_source_key(project_id, item.source), {member: ts})
         # Add to unclustered set (Phase 1: ingestion moat)
-        self._sadd(self._feedback_unclustered_key(str(item.project_id)), str(item.id))
-        
+        pipe.sadd(self._feedback_unclustered_key(project_id), member)
         if item.external_id:
-            self._set(self._feedback_external_key(str(item.project_id), item.source, item.external_id), str(item.id))
-        return item
+            pipe.set(self._feedback_external_key(project_id, item.source, item.external_id), member)
 
     def get_feedback_item(self, project_id: str, item_id: UUID) -> Optional[FeedbackItem]:
         # Try HGETALL first (new format)
@@ -1571,18 +1984,7 @@ class RedisStore:
             else:
                 return None
 
-        # Parse fields
-        if isinstance(data.get("created_at"), str):
-            data["created_at"] = _iso_to_dt(data["created_at"])
-        
-        # Parse metadata from JSON string if it's a string
-        if isinstance(data.get("metadata"), str):
-            try:
-                data["metadata"] = json.loads(data["metadata"])
-            except json.JSONDecodeError:
-                data["metadata"] = {}
-
-        return FeedbackItem(**data)
+        return _parse_feedback_row(data)
 
     def get_all_feedback_items(self, project_id: str) -> List[FeedbackItem]:
         """
@@ -1609,39 +2011,16 @@ class RedisStore:
         
         # OPTIMIZATION: Batch fetch all feedback items in one request
         keys = [self._feedback_key(project_id, item_id) for item_id in ids]
-        batch_results = self._hgetall_batch(keys)
-        
-        items: List[FeedbackItem] = []
-        for i, data in enumerate(batch_results):
-            if not data:
-                continue
-            try:
-                # Create a copy to avoid modifying the original
-                parsed = dict(data)
-                
-                # Parse fields
-                if isinstance(parsed.get("created_at"), str):
-                    parsed["created_at"] = _iso_to_dt(parsed["created_at"])
-                
-                # Parse metadata from JSON string if it's a string
-                if isinstance(parsed.get("metadata"), str):
-                    try:
-                        parsed["metadata"] = json.loads(parsed["metadata"])
-                    except json.JSONDecodeError:
-                        parsed["metadata"] = {}
-                
-                items.append(FeedbackItem(**parsed))
-            except (ValueError, TypeError) as e:
-                logger.debug("Failed to parse FeedbackItem at index %d: %s", i, e)
-                continue
-        return items
+        return _parse_feedback_rows(self._hgetall_batch(keys))
 
     def get_unclustered_feedback(self, project_id: str) -> List[FeedbackItem]:
         """
         Return all feedback items for a project that have not yet been assigned to a cluster.
         
         Uses batched fetching for better performance when using Upstash REST.
-        Invalid or missing feedback IDs encountered in the store are ignored and not included in the result.
+        Invalid feedback rows are skipped. IDs whose feedback hash no longer exists (deleted or
+        expired) are also removed from the unclustered set, so count_unclustered_feedback does
+        not keep reporting them.
         
         Returns:
         	List[FeedbackItem]: List of unclustered FeedbackItem objects for the specified project.
@@ -1653,32 +2032,20 @@ class RedisStore:
         
         # OPTIMIZATION: Batch fetch all feedback items in one request
         keys = [self._feedback_key(project_id, item_id) for item_id in unclustered_ids]
-        batch_results = self._hgetall_batch(keys)
-        
-        items: List[FeedbackItem] = []
-        for data in batch_results:
-            if not data:
-                continue
-            try:
-                # Create a copy to avoid modifying the original
-                parsed = dict(data)
-                
-                # Parse fields
-                if isinstance(parsed.get("created_at"), str):
-                    parsed["created_at"] = _iso_to_dt(parsed["created_at"])
-                
-                # Parse metadata from JSON string if it's a string
-                if isinstance(parsed.get("metadata"), str):
-                    try:
-                        parsed["metadata"] = json.loads(parsed["metadata"])
-                    except json.JSONDecodeError:
-                        parsed["metadata"] = {}
-                
-                items.append(FeedbackItem(**parsed))
-            except (ValueError, TypeError) as e:
-                logger.debug("Failed to parse unclustered FeedbackItem: %s", e)
-                continue
-        return items
+        rows = self._hgetall_batch(keys)
+        stale = [(item_id, project_id) for item_id, row in zip(unclustered_ids, rows) if not row]
+        if stale:
+            self.remove_from_unclustered_batch(stale)
+        return _parse_feedback_rows(rows)
+
+    def count_unclustered_feedback(self, project_id: str) -> int:
+        """
+        Return the size of the project's unclustered set with one SCARD.
+
+        IDs whose feedback was deleted or expired still count until the next
+        get_unclustered_feedback call prunes them, so this is an upper bound.
+        """
+        return int(self.client.scard(self._feedback_unclustered_key(project_id)) or 0)
 
     def remove_from_unclustered(self, feedback_id: UUID, project_id: str):
         """Remove item from unclustered set (called after clustering)."""
@@ -1720,20 +2087,13 @@ class RedisStore:
         if not existing:
             raise KeyError("feedback not found")
         # Verify project scoping: ensure the item belongs to the given project
-        if str(existing.project_id) != str(project_id):
+        if existing.project_id != str(project_id):
             raise KeyError(f"Feedback {item_id} not found for project {project_id}")
 
         # Merge updates
         updated = existing.model_copy(update=updates)
-        payload = updated.model_dump()
-        if isinstance(payload.get("created_at"), datetime):
-            payload["created_at"] = _dt_to_iso(payload["created_at"])
-        if isinstance(payload.get("metadata"), dict):
-            payload["metadata"] = json.dumps(payload["metadata"])
-
-        hash_payload = {k: str(v) for k, v in payload.items() if v is not None}
         key = self._feedback_key(project_id, item_id)
-        self._hset(key, hash_payload)
+        self._hset(key, _feedback_hash_payload(updated))
         return updated
 
     def delete_feedback_item(self, project_id: str, item_id: UUID) -> bool:
@@ -1751,29 +2111,15 @@ class RedisStore:
         if not existing:
             return False
 
-        # Delete main feedback hash
-        key = self._feedback_key(project_id, item_id)
-        self._delete(key)
-
-        # Remove from created sorted set
-        if self.mode == "redis":
-            self.client.zrem(self._feedback_created_key(project_id), str(item_id))
-        else:
-            self.client.zrem(self._feedback_created_key(project_id), str(item_id))
-
-        # Remove from source sorted set
-        if self.mode == "redis":
-            self.client.zrem(self._feedback_source_key(project_id, existing.source), str(item_id))
-        else:
-            self.client.zrem(self._feedback_source_key(project_id, existing.source), str(item_id))
-
-        # Remove from unclustered set
-        self.remove_from_unclustered(item_id, project_id)
-
-        # Delete external ID mapping if present
+        # Drop the hash and every index entry in one round-trip (redis-py or REST pipeline)
+        pipe = self.client.pipeline()
+        pipe.delete(self._feedback_key(project_id, item_id))
+        pipe.zrem(self._feedback_created_key(project_id), str(item_id))
+        pipe.zrem(self._feedback_source_key(project_id, existing.source), str(item_id))
+        pipe.srem(self._feedback_unclustered_key(project_id), str(item_id))
         if existing.external_id:
-            ext_key = self._feedback_external_key(project_id, existing.source, existing.external_id)
-            self._delete(ext_key)
+            pipe.delete(self._feedback_external_key(project_id, existing.source, existing.external_id))
+        pipe.execute()
 
         return True
 
@@ -1790,37 +2136,33 @@ class RedisStore:
         if not items:
             return 0
 
-        deleted = 0
-        if self.mode == "redis":
-            pipe = self.client.pipeline()
-            for project_id, item_id, item in items:
-                # Delete main hash
-                pipe.delete(self._feedback_key(project_id, item_id))
-                # Remove from sorted sets
-                pipe.zrem(self._feedback_created_key(project_id), str(item_id))
-                pipe.zrem(self._feedback_source_key(project_id, item.source), str(item_id))
-                # Remove from unclustered set
-                pipe.srem(self._feedback_unclustered_key(project_id), str(item_id))
-                # Delete external ID mapping
+        # Group index removals by key so each sorted set / set gets a single variadic
+        # ZREM/SREM, and all hashes and external-id mappings go in one DEL. Large batches
+        # are split into DELETE_BATCH_SIZE chunks, each sent as a non-transactional pipeline.
+        feedback_key, external_key = self._feedback_key, self._feedback_external_key
+        created_key, source_key = self._feedback_created_key, self._feedback_source_key
+        unclustered_key = self._feedback_unclustered_key
+        for chunk in _chunked(items, DELETE_BATCH_SIZE):
+            del_keys: List[str] = []
+            zrem_members: Dict[str, List[str]] = {}
+            srem_members: Dict[str, List[str]] = {}
+            for project_id, item_id, item in chunk:
+                member = str(item_id)
+                del_keys.append(feedback_key(project_id, member))
                 if item.external_id:
-                    pipe.delete(self._feedback_external_key(project_id, item.source, item.external_id))
-                deleted += 1
+                    del_keys.append(external_key(project_id, item.source, item.external_id))
+                zrem_members.setdefault(created_key(project_id), []).append(member)
+                zrem_members.setdefault(source_key(project_id, item.source), []).append(member)
+                srem_members.setdefault(unclustered_key(project_id), []).append(member)
+
+            pipe = self.client.pipeline(transaction=False)
+            pipe.delete(*del_keys)
+            for key, members in zrem_members.items():
+                pipe.zrem(key, *members)
+            for key, members in srem_members.items():
+                pipe.srem(key, *members)
             pipe.execute()
-        else:
-            # REST mode - build commands list
-            commands = []
-            for project_id, item_id, item in items:
-                commands.append(["DEL", self._feedback_key(project_id, item_id)])
-                commands.append(["ZREM", self._feedback_created_key(project_id), str(item_id)])
-                commands.append(["ZREM", self._feedback_source_key(project_id, item.source), str(item_id)])
-                commands.append(["SREM", self._feedback_unclustered_key(project_id), str(item_id)])
-                if item.external_id:
-                    commands.append(["DEL", self._feedback_external_key(project_id, item.source, item.external_id)])
-                deleted += 1
-            if commands:
-                self.client.pipeline_exec(commands)
-
-        return deleted
+        return len(items)
 
     def clear_feedback_items(self, project_id: Optional[str] = None):
         # Remove keys matching feedback:* and related sorted sets
@@ -1833,26 +2175,19 @@ class RedisStore:
             pattern = f"feedback:{project_id}:*"
         else:
             pattern = "feedback:*"
-        feedback_keys = list(self._scan_iter(pattern))
-        if feedback_keys:
-            self._delete(*feedback_keys)
-        # Legacy global key cleanup
-        self._delete("feedback:unclustered")
-        # Source sets
-        source_keys = list(self._scan_iter("feedback:source:*"))
-        if source_keys:
-            self._delete(*source_keys)
-        # Created sets
-        created_keys = list(self._scan_iter("feedback:created:*"))
-        if created_keys:
-            self._delete(*created_keys)
-        external_keys = list(self._scan_iter("feedback:external:*"))
-        if external_keys:
-            self._delete(*external_keys)
+        # Legacy global key, plus per-item hashes, source sets, created sets and external ids;
+        # all deletes go out together in one pipeline.
+        pipe = self.client.pipeline()
+        pipe.delete("feedback:unclustered")
+        for key_pattern in (pattern, "feedback:source:*", "feedback:created:*", "feedback:external:*"):
+            keys = list(self._scan_iter(key_pattern))
+            if keys:
+                pipe.delete(*keys)
+        pipe.execute()
 
     # Clusters
     def add_cluster(self, cluster: IssueCluster) -> IssueCluster:
-        project_id = str(cluster.project_id)
+        project_id = cluster.project_id
         payload = cluster.model_dump()
         for field in ("created_at", "updated_at"):
             if isinstance(payload.get(field), datetime):
@@ -2457,11 +2792,20 @@ class RedisStore:
         if not data:
             return None
 
-        for field in ("created_at", "updated_at"):
-            if isinstance(data.get(field), str):
-                data[field] = _iso_to_dt(data[field])
+        return _parse_job_row(data)
 
-        return AgentJob(**data)
+    def get_job_for_project(self, project_id: str, job_id: UUID) -> Optional[AgentJob]:
+        """
+        Retrieve a job only if its stored project_id matches the given project.
+
+        Returns:
+            AgentJob or None: The job when it exists and is scoped to `project_id`, otherwise `None`.
+        """
+        data = self._hgetall(self._job_key(job_id))
+        if not data or data.get("project_id") != str(project_id):
+            return None
+
+        return _parse_job_row(data)
 
     def update_job(self, job_id: UUID, **updates) -> AgentJob:
         key = self._job_key(job_id)
@@ -2513,9 +2857,12 @@ class RedisStore:
             cursor = 0
         limit = max(1, min(int(limit), 1000))
         stop = cursor + limit - 1
-        items = self.client.lrange(key, cursor, stop)
+        # Page and length in one round-trip
+        pipe = self.client.pipeline()
+        pipe.lrange(key, cursor, stop)
+        pipe.llen(key)
+        items, total = pipe.execute()
         next_cursor = cursor + len(items)
-        total = self.client.llen(key)
         has_more = next_cursor < total
         return (items, next_cursor, has_more)
 
@@ -2530,8 +2877,8 @@ class RedisStore:
         """
         from blob_storage import upload_job_logs_to_blob
 
-        # Fetch all log chunks from Redis
-        chunks, _, _ = self.get_job_logs(job_id, cursor=0, limit=100000)
+        # Fetch all log chunks from Redis in one LRANGE (get_job_logs pages at 1000 lines)
+        chunks = self.client.lrange(self._job_logs_key(job_id), 0, -1)
         if not chunks:
             logger.warning(f"No logs found for job {job_id}")
             return None
@@ -2573,29 +2920,38 @@ class RedisStore:
         """
         key = self._cluster_jobs_key(cluster_id)
         ids = self._zrange(key, 0, -1, rev=True)  # Newest first
-        jobs: List[AgentJob] = []
-        for jid in ids:
+        return self._load_jobs(ids)
+
+    def _load_jobs(self, job_ids: Iterable[str], project_id: Optional[str] = None) -> List[AgentJob]:
+        """
+        Load jobs by ID with one batched HGETALL, preserving order.
+
+        IDs that are not valid UUIDs, missing or malformed hashes and (when `project_id` is
+        given) jobs belonging to other projects are skipped.
+        """
+        keys = []
+        for jid in job_ids:
             try:
-                job = self.get_job(UUID(jid))
-                if job:
-                    jobs.append(job)
+                keys.append(self._job_key(UUID(jid)))
             except ValueError:
                 continue
+        jobs: List[AgentJob] = []
+        for data in self._hgetall_batch(keys):
+            if not data or (project_id is not None and data.get("project_id") != project_id):
+                continue
+            try:
+                jobs.append(_parse_job_row(data))
+            except (ValueError, TypeError) as e:
+                logger.debug("Failed to parse AgentJob: %s", e)
         return jobs
 
+    def _scan_job_ids(self) -> List[str]:
+        # key format is job:uuid; job:uuid:logs lists fail the UUID check in _load_jobs
+        return [key.split(":")[-1] for key in self._scan_iter("job:*")]
+
     def get_all_jobs(self) -> List[AgentJob]:
-        # Scan for all job keys
-        job_keys = list(self._scan_iter("job:*"))
-        jobs: List[AgentJob] = []
-        for key in job_keys:
-            try:
-                # key format is job:uuid
-                jid = key.split(":")[-1]
-                job = self.get_job(UUID(jid))
-                if job:
-                    jobs.append(job)
-            except ValueError:
-                continue
+        # Scan for all job keys, then fetch the hashes in one batch
+        jobs = self._load_jobs(self._scan_job_ids())
         # Sort by created_at desc
         jobs.sort(key=lambda x: x.created_at, reverse=True)
         return jobs
@@ -2613,22 +2969,48 @@ class RedisStore:
         Returns:
             List[AgentJob]: Jobs belonging to the project, sorted by created_at desc.
         """
-        # Scan for all job keys and filter by project
-        job_keys = list(self._scan_iter("job:*"))
-        jobs: List[AgentJob] = []
-        for key in job_keys:
-            try:
-                # key format is job:uuid
-                jid = key.split(":")[-1]
-                job = self.get_job(UUID(jid))
-                if job and str(job.project_id) == project_id:
-                    jobs.append(job)
-            except ValueError:
-                continue
+        # Scan for all job keys, fetch them in one batch and filter by project
+        jobs = self._load_jobs(self._scan_job_ids(), project_id=project_id)
         # Sort by created_at desc
         jobs.sort(key=lambda x: x.created_at, reverse=True)
         return jobs
 
+    def get_jobs_page_for_project(
+        self, project_id: str, cursor: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[AgentJob], int, bool]:
+        """
+        Return a page of a project's jobs, newest first.
+
+        Jobs are not indexed by project, so this still scans `job:*`; paging only
+        bounds what is returned to the caller.
+
+        Returns:
+            tuple[list[AgentJob], int, bool]: (jobs, next_cursor, has_more).
+        """
+        return _paginate(self.get_all_jobs_for_project(project_id), cursor, limit)
+
+    def get_jobs_page_by_cluster(
+        self, cluster_id: str, project_id: str, cursor: int = 0, limit: Optional[int] = None
+    ) -> tuple[list[AgentJob], int, bool]:
+        """
+        Return a page of a cluster's jobs scoped to a project, newest first.
+
+        The page is sliced with ZRANGE on the cluster index so only the requested
+        job hashes are loaded.
+
+        Returns:
+            tuple[list[AgentJob], int, bool]: (jobs, next_cursor, has_more).
+        """
+        if cursor < 0:
+            cursor = 0
+        key = self._cluster_jobs_key(cluster_id)
+        stop = -1 if limit is None else cursor + limit - 1
+        ids = self._zrange(key, cursor, stop, rev=True)  # Newest first
+        jobs = self._load_jobs(ids, project_id=project_id)
+        next_cursor = cursor + len(ids)
+        has_more = limit is not None and next_cursor < self._zcard(key)
+        return (jobs, next_cursor, has_more)
+
     def clear_jobs(self):
         """
         Remove all stored AgentJob entries and their cluster indexes from the backend.
@@ -2817,7 +3199,7 @@ class RedisStore:
         """
         Batch resolve feedback items by their external identifiers within a project.
 
-        Uses pipelined GET + HGETALL to minimize network requests (critical for Upstash REST).
+        Uses MGET + pipelined HGETALL to minimize network requests (critical for Upstash REST).
         Returns a mapping of external_id -> FeedbackItem for all found items.
         """
         if not external_ids:
@@ -2835,14 +3217,7 @@ class RedisStore:
         ]
 
         existing_ids: Dict[str, str] = {}
-        if self.mode == "redis":
-            pipe = self.client.pipeline()
-            for _, key in ext_key_pairs:
-                pipe.get(key)
-            results = pipe.execute()
-        else:
-            commands = [["GET", key] for _, key in ext_key_pairs]
-            results = self.client.pipeline_exec(commands)
+        results = self._mget([key for _, key in ext_key_pairs])
 
         for (ext_id, _), value in zip(ext_key_pairs, results):
             if value:
@@ -2870,16 +3245,8 @@ class RedisStore:
         for (ext_id, _), data in zip(fetch_pairs, batch_results):
             if not data:
                 continue
-            parsed = dict(data)
-            if isinstance(parsed.get("created_at"), str):
-                parsed["created_at"] = _iso_to_dt(parsed["created_at"])
-            if isinstance(parsed.get("metadata"), str):
-                try:
-                    parsed["metadata"] = json.loads(parsed["metadata"])
-                except json.JSONDecodeError:
-                    parsed["metadata"] = {}
             try:
-                resolved[ext_id] = FeedbackItem(**parsed)
+                resolved[ext_id] = _parse_feedback_row(data)
             except (ValueError, TypeError):
                 continue
 
@@ -2922,7 +3289,7 @@ class RedisStore:
 
         hash_payload = {k: str(v) for k, v in payload.items() if v is not None}
         self._hset(self._project_key(project.id), hash_payload)
-        self._sadd(self._user_projects_key(project.user_id), str(project.id))
+        self._sadd(self._user_projects_key(project.user_id), project.id)
         return project
 
     def get_projects_for_user(self, user_id: UUID) -> List[Project]:
@@ -2976,11 +3343,13 @@ class RedisStore:
             int: Total number of feedback items across all user's projects.
         """
         project_ids = self._smembers(self._user_projects_key(user_id))
-        total = 0
+        if not project_ids:
+            return 0
+        # One ZCARD per project, sent together in one round-trip
+        pipe = self.client.pipeline()
         for pid in project_ids:
-            count_key = self._feedback_created_key(str(pid))
-            total += self._zcard(count_key)
-        return total
+            pipe.zcard(self._feedback_created_key(str(pid)))
+        return sum(int(count or 0) for count in pipe.execute())
 
     def count_successful_jobs_for_user(self, user_id: UUID) -> int:
         """
@@ -3043,6 +3412,12 @@ class RedisStore:
     def _get(self, key: str) -> Optional[str]:
         return self.client.get(key)
 
+    def _mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Fetch several string keys in one MGET; `None` for missing keys."""
+        if not keys:
+            return []
+        return self.client.mget(keys)
+
     def _zadd(self, key: str, score: float, member: str):
         if self.mode == "redis":
             self.client.zadd(key, {member: score})
@@ -3120,10 +3495,7 @@ class RedisStore:
             self.client.delete(*keys)
 
     def _scan_iter(self, pattern: str) -> Iterable[str]:
-        if self.mode == "redis":
-            yield from self.client.scan_iter(pattern)
-        else:
-            yield from self.client.scan_iter(pattern)
+        yield from self.client.scan_iter(pattern, count=SCAN_COUNT)
 
     def _hset(self, key: str, mapping: Dict[str, Any]):
         if self.mode == "redis":
@@ -3174,59 +3546,10 @@ class RedisStore:
         if not items:
             return []
 
-        if self.mode == "redis":
-            pipe = self.client.pipeline()
-            for item in items:
-                payload = item.model_dump()
-                if isinstance(payload.get("created_at"), datetime):
-                    payload["created_at"] = _dt_to_iso(payload["created_at"])
-                if isinstance(payload.get("metadata"), dict):
-                    payload["metadata"] = json.dumps(payload["metadata"])
-
-                hash_payload = {k: str(v) for k, v in payload.items() if v is not None}
-                project_id = str(item.project_id)
-                key = self._feedback_key(project_id, item.id)
-                ts = item.created_at.timestamp() if isinstance(item.created_at, datetime) else time.time()
-
-                pipe.hset(key, mapping=hash_payload)
-                pipe.zadd(self._feedback_created_key(project_id), {str(item.id): ts})
-                pipe.zadd(self._feedback_source_key(project_id, item.source), {str(item.id): ts})
-                pipe.sadd(self._feedback_unclustered_key(project_id), str(item.id))
-                if item.external_id:
-                    pipe.set(
-                        self._feedback_external_key(project_id, item.source, item.external_id),
-                        str(item.id),
-                    )
-            pipe.execute()
-        else:
-            commands: List[List[str]] = []
-            for item in items:
-                payload = item.model_dump()
-                if isinstance(payload.get("created_at"), datetime):
-                    payload["created_at"] = _dt_to_iso(payload["created_at"])
-                if isinstance(payload.get("metadata"), dict):
-                    payload["metadata"] = json.dumps(payload["metadata"])
-
-                hash_payload = {k: str(v) for k, v in payload.items() if v is not None}
-                project_id = str(item.project_id)
-                key = self._feedback_key(project_id, item.id)
-                ts = item.created_at.timestamp() if isinstance(item.created_at, datetime) else time.time()
-
-                hset_cmd = ["HSET", key]
-                for field, value in hash_payload.items():
-                    hset_cmd.extend([field, value])
-                commands.append(hset_cmd)
-
-                commands.append(["ZADD", self._feedback_created_key(project_id), str(ts), str(item.id)])
-                commands.append(["ZADD", self._feedback_source_key(project_id, item.source), str(ts), str(item.id)])
-                commands.append(["SADD", self._feedback_unclustered_key(project_id), str(item.id)])
-                if item.external_id:
-                    commands.append(
-                        ["SET", self._feedback_external_key(project_id, item.source, item.external_id), str(item.id)]
-                    )
-
-            self.client.pipeline_exec(commands)
-
+        pipe = self.client.pipeline()
+        for item in items:
+            self._queue_feedback_item(pipe, item)
+        pipe.execute()
         return items
 
 
@@ -3433,7 +3756,7 @@ def add_feedback_to_cluster(cluster_id: str, feedback_id: str, project_id: Optio
         # Try to find the cluster's project_id
         cluster = get_cluster_by_id(cluster_id)
         if cluster:
-            project_id = str(cluster.project_id)
+            project_id = cluster.project_id
         else:
             raise KeyError(f"Cluster {cluster_id} not found")
     _STORE.add_feedback_to_cluster(project_id, cluster_id, feedback_id)
@@ -3481,6 +3804,16 @@ def get_job(job_id: UUID) -> Optional[AgentJob]:
     return _STORE.get_job(job_id)
 
 
+def get_job_for_project(project_id: str, job_id: UUID) -> Optional[AgentJob]:
+    """
+    Retrieve a job scoped to a project.
+
+    Returns:
+        AgentJob or None: The job if it exists and belongs to `project_id`, otherwise `None`.
+    """
+    return _STORE.get_job_for_project(project_id, job_id)
+
+
 def update_job(job_id: UUID, **updates) -> AgentJob:
     return _STORE.update_job(job_id, **updates)
 
@@ -3506,6 +3839,45 @@ def get_all_jobs_for_project(project_id: str) -> List[AgentJob]:
     return _STORE.get_all_jobs_for_project(project_id)
 
 
+def get_jobs_page_for_project(
+    project_id: str, cursor: int = 0, limit: Optional[int] = None
+) -> tuple[list[AgentJob], int, bool]:
+    """
+    Retrieve a page of AgentJob records for a project, newest first.
+
+    Parameters:
+        project_id (str): Project identifier to filter jobs by.
+        cursor (int): Zero-based offset to start from; use the returned cursor to continue.
+        limit (Optional[int]): Maximum number of jobs to return, or None for all remaining jobs.
+
+    Returns:
+        jobs (list[AgentJob]): Jobs for this page.
+        next_cursor (int): Cursor to use for the next page.
+        has_more (bool): `true` if more jobs are available after this page.
+    """
+    return _STORE.get_jobs_page_for_project(project_id, cursor=cursor, limit=limit)
+
+
+def get_jobs_page_by_cluster(
+    cluster_id: str, project_id: str, cursor: int = 0, limit: Optional[int] = None
+) -> tuple[list[AgentJob], int, bool]:
+    """
+    Retrieve a page of AgentJob records for a cluster within a project, newest first.
+
+    Parameters:
+        cluster_id (str): Cluster whose jobs are listed.
+        project_id (str): Project scope; jobs from other projects are never returned.
+        cursor (int): Zero-based offset to start from; use the returned cursor to continue.
+        limit (Optional[int]): Maximum number of jobs to return, or None for all remaining jobs.
+
+    Returns:
+        jobs (list[AgentJob]): Jobs for this page.
+        next_cursor (int): Cursor to use for the next page.
+        has_more (bool): `true` if more jobs are available after this page.
+    """
+    return _STORE.get_jobs_page_by_cluster(cluster_id, project_id, cursor=cursor, limit=limit)
+
+
 def append_job_log(job_id: UUID, message: str) -> None:
     if hasattr(_STORE, "append_job_log"):
         _STORE.append_job_log(job_id, message)
@@ -3652,6 +4024,17 @@ def get_unclustered_feedback(project_id: str) -> List[FeedbackItem]:
     return [item for item in get_all_feedback_items(project_id) if item.status != "closed"]
 
 
+def count_unclustered_feedback(project_id: str) -> int:
+    """
+    Return how many feedback items are waiting to be clustered for the given project.
+
+    Reads only the size of the project's unclustered set; use get_unclustered_feedback
+    when the items themselves are needed. With Redis this is an upper bound: ids whose
+    feedback expired are only pruned from the set when get_unclustered_feedback runs.
+    """
+    return _STORE.count_unclustered_feedback(project_id)
+
+
 def remove_from_unclustered(feedback_id: UUID, project_id: str):
     """
     Remove a feedback item from the project's unclustered set.
@@ -4035,4 +4418,5 @@ def clear_coding_plans():
     elif isinstance(_STORE, RedisStore):
         keys = list(_STORE._scan_iter("coding_plan:*"))
         if keys:
-            _STORE._delete(*keys)
\ No newline at end of file
+            _STORE._delete(*keys)
+        _STORE.clear_coding_plan_cache()
\ No newline at end of file
@@ -35,13 +35,199 @@ def clear_data(mock_store):
     """
     Clear test data at project scope so each test starts with a clean in-memory store.
     
-    Removes all jobs, clusters, and feedback items.
+    Removes all jobs, clusters, feedback items, coding plans, cached blob logs, plans, PostHog event types and Splunk config caches.
     """
     clear_jobs()
     clear_clusters()
     clear_feedback_items()
     from store import clear_coding_plans
     clear_coding_plans()
+    from blob_storage import fetch_job_logs_cached
+    fetch_job_logs_cached.cache_clear()
+    from planner import clear_plan_cache
+    clear_plan_cache()
+    from posthog_client import clear_posthog_event_types_cache
+    clear_posthog_event_types_cache()
+    from splunk_client import clear_splunk_config_caches
+    clear_splunk_config_caches()
+
+
+class _FakeRedisPipeline:
+    """
+    Fake pipeline for _FakeRedis to support batched operations in tests.
+    """
+
+    def __init__(self, fake_redis):
+        self._fake = fake_redis
+        self._commands = []
+
+    def hgetall(self, key):
+        self._commands.append(("hgetall", key))
+        return self
+
+    def hset(self, key, mapping=None, **kwargs):
+        self._commands.append(("hset", key, mapping or kwargs))
+        return self
+
+    def zadd(self, key, mapping):
+        self._commands.append(("zadd", key, mapping))
+        return self
+
+    def sadd(self, key, member):
+        self._commands.append(("sadd", key, member))
+        return self
+
+    def srem(self, key, *members):
+        self._commands.append(("srem", key, *members))
+        return self
+
+    def zrem(self, key, *members):
+        self._commands.append(("zrem", key, *members))
+        return self
+
+    def delete(self, *keys):
+        self._commands.append(("delete", *keys))
+        return self
+
+    def set(self, key, value):
+        self._commands.append(("set", key, value))
+        return self
+
+    def get(self, key):
+        self._commands.append(("get", key))
+        return self
+
+    def execute(self):
+        results = []
+        for cmd, *args in self._commands:
+            if cmd == "hgetall":
+                results.append(self._fake.hgetall(args[0]))
+            elif cmd == "hset":
+                self._fake.hset(args[0], mapping=args[1])
+                results.append(True)
+            elif cmd == "zadd":
+                self._fake.zadd(args[0], args[1])
+                results.append(True)
+            elif cmd == "sadd":
+                self._fake.sadd(args[0], args[1])
+                results.append(True)
+            elif cmd == "srem":
+                self._fake.srem(*args)
+                results.append(True)
+            elif cmd == "zrem":
+                self._fake.zrem(*args)
+                results.append(True)
+            elif cmd == "delete":
+                self._fake.delete(*args)
+                results.append(True)
+            elif cmd == "set":
+                self._fake.set(args[0], args[1])
+                results.append(True)
+            elif cmd == "get":
+                results.append(self._fake.get(args[0]))
+            else:
+                raise NotImplementedError(f"_FakeRedisPipeline does not support command: {cmd}")
+        return results
+
+
+class _FakeRedis:
+    """
+    Minimal Redis-compatible stub for RedisStore tests (no external services).
+    """
+
+    def __init__(self):
+        self._hashes = {}
+        self._strings = {}
+        self._sets = {}
+        self._zsets = {}
+
+    def pipeline(self, transaction=True):
+        return _FakeRedisPipeline(self)
+
+    # String ops
+    def set(self, key, value):
+        self._strings[key] = value
+
+    def get(self, key):
+        return self._strings.get(key)
+
+    def mget(self, keys):
+        return [self._strings.get(key) for key in keys]
+
+    # Hash ops
+    def hset(self, key, mapping=None, **kwargs):
+        mapping = mapping or kwargs
+        self._hashes.setdefault(key, {}).update(mapping)
+
+    def hgetall(self, key):
+        # Like redis-py, hand back a fresh dict the caller may mutate.
+        return dict(self._hashes.get(key, {}))
+
+    # Set ops
+    def sadd(self, key, member):
+        self._sets.setdefault(key, set()).add(member)
+
+    def smembers(self, key):
+        return set(self._sets.get(key, set()))
+
+    def srem(self, key, *members):
+        if key in self._sets:
+            self._sets[key].difference_update(members)
+
+    def scard(self, key):
+        return len(self._sets.get(key, ()))
+
+    # Sorted set ops
+    def zadd(self, key, mapping):
+        self._zsets.setdefault(key, [])
+        for member, score in mapping.items():
+            self._zsets[key] = [(s, m) for (s, m) in self._zsets[key] if m != member]
+            self._zsets[key].append((score, member))
+        self._zsets[key].sort(key=lambda x: x[0])
+
+    def zcard(self, key):
+        return len(self._zsets.get(key, []))
+
+    def zrem(self, key, *members):
+        if key in self._zsets:
+            self._zsets[key] = [(s, m) for (s, m) in self._zsets[key] if m not in members]
+
+    def zrange(self, key, start, stop, desc=False):
+        items = self._zsets.get(key, [])
+        if desc:
+            items = list(reversed(items))
+        members = [m for _, m in items]
+        if stop == -1:
+            return members[start:]
+        return members[start : stop + 1]
+
+    # Delete/scan helpers (minimal)
+    def delete(self, *keys):
+        for key in keys:
+            self._strings.pop(key, None)
+            self._hashes.pop(key, None)
+            self._sets.pop(key, None)
+            self._zsets.pop(key, None)
+
+    def scan_iter(self, pattern, count=None):
+        prefix = pattern.rstrip("*")
+        for key in list(self._strings) + list(self._hashes) + list(self._sets) + list(self._zsets):
+            if key.startswith(prefix):
+                yield key
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """
+    Back RedisStore with an in-process _FakeRedis instead of a Redis/Upstash connection.
+
+    Returns:
+        _FakeRedis: The fake client that `RedisStore()` will use for the rest of the test.
+    """
+    fake = _FakeRedis()
+    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
+    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+    return fake
 
 
 @pytest.fixture
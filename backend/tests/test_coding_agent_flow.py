@@ -141,3 +141,90 @@ def test_manual_plan_generation(mock_gen, sample_data):
     assert resp.status_code == 200
     assert resp.json()["title"] == "Gen"
     mock_gen.assert_called_once()
+
+async def test_concurrent_start_fix_requests_share_one_job(sample_data):
+    import asyncio
+    import time
+    from main import start_cluster_fix
+    from models import CodingPlan
+    from store import get_all_jobs_for_project
+
+    cid = sample_data["cluster"].id
+    pid = str(sample_data["pid"])
+    calls = []
+
+    def slow_plan(cluster, items):
+        calls.append(cluster.id)
+        time.sleep(0.1)
+        now = datetime.now(timezone.utc)
+        return CodingPlan(
+            id="p-slow", project_id=pid, cluster_id=cid, title="Slow", description="D",
+            created_at=now, updated_at=now,
+        )
+
+    with patch("main.generate_plan", side_effect=slow_plan):
+        first, second = await asyncio.gather(
+            start_cluster_fix(cid, project_id=pid, background_tasks=None, x_github_token=None),
+            start_cluster_fix(cid, project_id=pid, background_tasks=None, x_github_token=None),
+        )
+
+    assert calls == [cid]
+    assert first["job_id"] == second["job_id"]
+    assert len(get_all_jobs_for_project(pid)) == 1
+
+async def test_start_fix_waiter_retries_when_first_request_is_cancelled(sample_data):
+    import asyncio
+    import time
+    from main import start_cluster_fix
+    from models import CodingPlan
+
+    cid = sample_data["cluster"].id
+    pid = str(sample_data["pid"])
+    calls = []
+
+    def slow_plan(cluster, items):
+        calls.append(cluster.id)
+        time.sleep(0.1)
+        now = datetime.now(timezone.utc)
+        return CodingPlan(
+            id="p-slow", project_id=pid, cluster_id=cid, title="Slow", description="D",
+            created_at=now, updated_at=now,
+        )
+
+    with patch("main.generate_plan", side_effect=slow_plan):
+        first = asyncio.create_task(
+            start_cluster_fix(cid, project_id=pid, background_tasks=None, x_github_token=None)
+        )
+        await asyncio.sleep(0.02)
+        second = asyncio.create_task(
+            start_cluster_fix(cid, project_id=pid, background_tasks=None, x_github_token=None)
+        )
+        await asyncio.sleep(0.02)
+        first.cancel()
+        result = await second
+
+    assert first.cancelled()
+    assert result["job_id"]
+    assert calls == [cid, cid]
+
+async def test_lifespan_cancels_background_runners_on_shutdown():
+    import asyncio
+    import main
+
+    started = asyncio.Event()
+    cancelled = []
+
+    async def long_runner():
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async with main.lifespan(main.app):
+        main._spawn_background(long_runner(), "test-runner")
+        await started.wait()
+
+    assert cancelled == [True]
+    assert main._TASK_GROUP is None
@@ -323,164 +323,7 @@ def test_sync_update_does_not_readd_to_unclustered(project_context, monkeypatch)
     assert items[0].title == "Updated title"
 
 
-class _FakeRedisPipeline:
-    """
-    Fake pipeline for _FakeRedis to support batched operations in tests.
-    """
-
-    def __init__(self, fake_redis):
-        self._fake = fake_redis
-        self._commands = []
-
-    def hgetall(self, key):
-        self._commands.append(("hgetall", key))
-        return self
-
-    def hset(self, key, mapping=None, **kwargs):
-        self._commands.append(("hset", key, mapping or kwargs))
-        return self
-
-    def zadd(self, key, mapping):
-        self._commands.append(("zadd", key, mapping))
-        return self
-
-    def sadd(self, key, member):
-        self._commands.append(("sadd", key, member))
-        return self
-
-    def srem(self, key, member):
-        self._commands.append(("srem", key, member))
-        return self
-
-    def zrem(self, key, member):
-        self._commands.append(("zrem", key, member))
-        return self
-
-    def delete(self, key):
-        self._commands.append(("delete", key))
-        return self
-
-    def set(self, key, value):
-        self._commands.append(("set", key, value))
-        return self
-
-    def get(self, key):
-        self._commands.append(("get", key))
-        return self
-
-    def execute(self):
-        results = []
-        for cmd, *args in self._commands:
-            if cmd == "hgetall":
-                results.append(self._fake.hgetall(args[0]))
-            elif cmd == "hset":
-                self._fake.hset(args[0], mapping=args[1])
-                results.append(True)
-            elif cmd == "zadd":
-                self._fake.zadd(args[0], args[1])
-                results.append(True)
-            elif cmd == "sadd":
-                self._fake.sadd(args[0], args[1])
-                results.append(True)
-            elif cmd == "srem":
-                self._fake.srem(args[0], args[1])
-                results.append(True)
-            elif cmd == "zrem":
-                self._fake.zrem(args[0], args[1])
-                results.append(True)
-            elif cmd == "delete":
-                self._fake.delete(args[0])
-                results.append(True)
-            elif cmd == "set":
-                self._fake.set(args[0], args[1])
-                results.append(True)
-            elif cmd == "get":
-                results.append(self._fake.get(args[0]))
-            else:
-                raise NotImplementedError(f"_FakeRedisPipeline does not support command: {cmd}")
-        return results
-
-
-class _FakeRedis:
-    """
-    Minimal Redis-compatible stub for RedisStore tests (no external services).
-    """
-
-    def __init__(self):
-        self._hashes = {}
-        self._strings = {}
-        self._sets = {}
-        self._zsets = {}
-
-    def pipeline(self):
-        return _FakeRedisPipeline(self)
-
-    # String ops
-    def set(self, key, value):
-        self._strings[key] = value
-
-    def get(self, key):
-        return self._strings.get(key)
-
-    # Hash ops
-    def hset(self, key, mapping=None, **kwargs):
-        mapping = mapping or kwargs
-        self._hashes.setdefault(key, {}).update(mapping)
-
-    def hgetall(self, key):
-        return self._hashes.get(key, {})
-
-    # Set ops
-    def sadd(self, key, member):
-        self._sets.setdefault(key, set()).add(member)
-
-    def smembers(self, key):
-        return set(self._sets.get(key, set()))
-
-    def srem(self, key, member):
-        if key in self._sets:
-            self._sets[key].discard(member)
-
-    # Sorted set ops
-    def zadd(self, key, mapping):
-        self._zsets.setdefault(key, [])
-        for member, score in mapping.items():
-            self._zsets[key] = [(s, m) for (s, m) in self._zsets[key] if m != member]
-            self._zsets[key].append((score, member))
-        self._zsets[key].sort(key=lambda x: x[0])
-
-    def zrem(self, key, member):
-        if key in self._zsets:
-            self._zsets[key] = [(s, m) for (s, m) in self._zsets[key] if m != member]
-
-    def zrange(self, key, start, stop, desc=False):
-        items = self._zsets.get(key, [])
-        if desc:
-            items = list(reversed(items))
-        members = [m for _, m in items]
-        if stop == -1:
-            return members[start:]
-        return members[start : stop + 1]
-
-    # Delete/scan helpers (minimal)
-    def delete(self, *keys):
-        for key in keys:
-            self._strings.pop(key, None)
-            self._hashes.pop(key, None)
-            self._sets.pop(key, None)
-            self._zsets.pop(key, None)
-
-    def scan_iter(self, pattern):
-        prefix = pattern.rstrip("*")
-        for key in list(self._strings) + list(self._hashes) + list(self._sets) + list(self._zsets):
-            if key.startswith(prefix):
-                yield key
-
-
-def test_redis_store_get_feedback_by_external_id(monkeypatch):
-    fake = _FakeRedis()
-    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
-    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+def test_redis_store_get_feedback_by_external_id(fake_redis):
     redis_store = RedisStore()
 
     project_id = uuid4()
@@ -503,10 +346,7 @@ def test_redis_store_get_feedback_by_external_id(monkeypatch):
     assert found.external_id == "ext-123"
 
 
-def test_redis_store_get_unclustered_feedback(monkeypatch):
-    fake = _FakeRedis()
-    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
-    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+def test_redis_store_get_unclustered_feedback(fake_redis):
     redis_store = RedisStore()
 
     project_id = uuid4()
@@ -545,10 +385,7 @@ def test_auto_cluster_feedback_github_titles(project_context):
     assert cluster.title == "GitHub: org/repo"
 
 
-def test_add_feedback_items_batch(monkeypatch):
-    fake = _FakeRedis()
-    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
-    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+def test_add_feedback_items_batch(fake_redis):
     redis_store = RedisStore()
 
     project_id = uuid4()
@@ -580,10 +417,7 @@ def test_add_feedback_items_batch(monkeypatch):
     assert len(unclustered) == 2
 
 
-def test_get_feedback_by_external_ids_batch(monkeypatch):
-    fake = _FakeRedis()
-    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
-    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+def test_get_feedback_by_external_ids_batch(fake_redis):
     redis_store = RedisStore()
 
     project_id = uuid4()
@@ -605,10 +439,7 @@ def test_get_feedback_by_external_ids_batch(monkeypatch):
     assert "missing" not in found
 
 
-def test_remove_from_unclustered_batch(monkeypatch):
-    fake = _FakeRedis()
-    monkeypatch.setattr("store._redis_client_from_env", lambda: fake)
-    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: None)
+def test_remove_from_unclustered_batch(fake_redis):
     redis_store = RedisStore()
 
     project_id = uuid4()
@@ -5,7 +5,7 @@ from uuid import uuid4
 
 import pytest
 
-from job_logs_manager import append_log, get_logs, clear_logs, get_all_active_jobs
+from job_logs_manager import append_log, get_logs, get_logs_since, clear_logs, get_all_active_jobs
 
 
 class TestJobLogsManager:
@@ -46,6 +46,24 @@ class TestJobLogsManager:
         # Cleanup
         clear_logs(job_id)
 
+    def test_get_logs_since_returns_only_new_lines(self):
+        """Test incremental reads return lines after the offset plus the next offset."""
+        job_id = uuid4()
+        assert get_logs_since(job_id) == ([], 0)
+
+        append_log(job_id, "Line 1\n")
+        append_log(job_id, "Line 2\n")
+        lines, offset = get_logs_since(job_id)
+        assert lines == ["Line 1\n", "Line 2\n"]
+        assert offset == 2
+
+        append_log(job_id, "Line 3\n")
+        assert get_logs_since(job_id, offset) == (["Line 3\n"], 3)
+        assert get_logs_since(job_id, 3) == ([], 3)
+
+        # Cleanup
+        clear_logs(job_id)
+
     def test_clear_logs(self):
         """Test clearing logs from memory."""
         job_id = uuid4()
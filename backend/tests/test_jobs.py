@@ -163,6 +163,29 @@ def test_get_job_details(project_context):
     assert data["logs"] == "Initial logs"
 
 
+def test_job_endpoints_are_project_scoped(project_context):
+    """A job is invisible (404) to every job endpoint when queried with another project's id."""
+    pid = project_context["project_id"]
+    cluster = _seed_cluster(pid)
+    now = datetime.now(timezone.utc)
+    job = AgentJob(
+        id=uuid4(),
+        project_id=pid,
+        cluster_id=cluster.id,
+        status="running",
+        created_at=now,
+        updated_at=now,
+    )
+    add_job(job)
+    other_pid = uuid4()
+
+    assert client.get(f"/jobs/{job.id}?project_id={other_pid}").status_code == 404
+    assert client.get(f"/jobs/{job.id}/logs?project_id={other_pid}").status_code == 404
+    patch_resp = client.patch(f"/jobs/{job.id}?project_id={other_pid}", json={"status": "failed"})
+    assert patch_resp.status_code == 404
+    assert get_job(job.id).status == "running"
+
+
 def test_get_cluster_jobs(project_context):
     """
     Verify that the cluster jobs endpoint returns all jobs for a given cluster and project.
@@ -207,6 +230,43 @@ def test_get_cluster_jobs(project_context):
     assert str(job2.id) in ids
 
 
+def test_list_jobs_paginates_and_omits_logs(project_context):
+    """
+    Verify GET /jobs pages newest-first via limit/cursor and never returns the `logs` field.
+    """
+    pid = project_context["project_id"]
+    cluster = _seed_cluster(pid)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    jobs = []
+    for i in range(3):
+        job = AgentJob(
+            id=uuid4(),
+            project_id=pid,
+            cluster_id=cluster.id,
+            status="success",
+            logs="x" * 1000,
+            created_at=base.replace(minute=i),
+            updated_at=base.replace(minute=i),
+        )
+        add_job(job)
+        jobs.append(job)
+
+    first = client.get(f"/jobs?project_id={pid}&limit=2")
+    assert first.status_code == 200
+    assert [j["id"] for j in first.json()] == [str(jobs[2].id), str(jobs[1].id)]
+    assert all("logs" not in j for j in first.json())
+    assert first.headers["X-Next-Cursor"] == "2"
+
+    second = client.get(f"/jobs?project_id={pid}&limit=2&cursor=2")
+    assert [j["id"] for j in second.json()] == [str(jobs[0].id)]
+    assert "X-Next-Cursor" not in second.headers
+
+    cluster_page = client.get(f"/clusters/{cluster.id}/jobs?project_id={pid}&limit=1")
+    assert [j["id"] for j in cluster_page.json()] == [str(jobs[2].id)]
+    assert cluster_page.headers["X-Next-Cursor"] == "1"
+
+
 # ----- Job Logs Endpoint Tests -----
 
 def test_get_job_logs_from_memory(project_context):
@@ -236,8 +296,14 @@ def test_get_job_logs_from_memory(project_context):
         assert response.status_code == 200
         data = response.json()
         assert data["source"] == "memory"
-        assert "Line 1" in data["chunks"][0]
-        assert "Line 2" in data["chunks"][0]
+        assert data["chunks"] == ["Line 1\n", "Line 2\n"]
+        assert data["next_offset"] == 2
+
+        job_logs_manager.append_log(job.id, "Line 3\n")
+        response = client.get(f"/jobs/{job.id}/logs?project_id={pid}&since=2")
+        data = response.json()
+        assert data["chunks"] == ["Line 3\n"]
+        assert data["next_offset"] == 3
     finally:
         # Cleanup
         job_logs_manager.clear_logs(job.id)
@@ -274,6 +340,36 @@ def test_get_job_logs_from_blob(project_context):
         mock_fetch.assert_called_once_with(blob_url)
 
 
+def test_get_job_logs_from_blob_is_cached_and_tailable(project_context):
+    """Completed-job blob logs are downloaded once per URL and can be tailed."""
+    from unittest.mock import patch
+
+    pid = project_context["project_id"]
+    cluster = _seed_cluster(pid)
+    now = datetime.now(timezone.utc)
+    blob_url = "https://blob.vercel-storage.com/logs/cached.txt"
+    job = AgentJob(
+        id=uuid4(),
+        project_id=pid,
+        cluster_id=cluster.id,
+        status="failed",
+        blob_url=blob_url,
+        created_at=now,
+        updated_at=now,
+    )
+    add_job(job)
+
+    with patch("blob_storage.fetch_job_logs_from_blob") as mock_fetch:
+        mock_fetch.return_value = "head\ntail\n"
+
+        first = client.get(f"/jobs/{job.id}/logs?project_id={pid}")
+        second = client.get(f"/jobs/{job.id}/logs?project_id={pid}&tail_bytes=5")
+
+        assert first.json()["chunks"] == ["head\ntail\n"]
+        assert second.json()["chunks"] == ["tail\n"]
+        mock_fetch.assert_called_once_with(blob_url)
+
+
 def test_get_job_logs_empty_for_pending_job(project_context):
     """Test that pending jobs with no logs return empty chunks."""
     pid = project_context["project_id"]
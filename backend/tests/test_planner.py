@@ -24,8 +24,7 @@ def test_generate_plan_success():
         
         # Mock LLM response
         mock_response = MagicMock()
-        mock_response.parsed.title = "Technical Fix Plan"
-        mock_response.parsed.description = "Fix steps"
+        mock_response.parsed = {"title": "Technical Fix Plan", "description": "Fix steps"}
         
         mock_client.models.generate_content.return_value = mock_response
         
@@ -38,6 +37,16 @@ def test_generate_plan_success():
         assert plan.description == "Fix steps"
         assert plan.cluster_id == "c1"
 
+        # Static instructions go in the system instruction, not the per-call prompt.
+        _, kwargs = mock_client.models.generate_content.call_args
+        assert "Do NOT invent" in kwargs["config"].system_instruction
+        assert "Do NOT invent" not in kwargs["contents"]
+        assert "It crashes" in kwargs["contents"]
+
+        # The config is built once and reused across calls.
+        import planner
+        assert kwargs["config"] is planner._generation_config()
+
 def test_generate_plan_no_api_key():
     cluster = IssueCluster(
         id="c1", project_id="p1", title="Fix Bug", summary="Bad bug",
@@ -66,3 +75,120 @@ def test_generate_plan_exception_handling():
         plan = generate_plan(cluster, [])
         assert plan.title.startswith("Error planning fix")
         assert "API Broken" in plan.description
+
+def test_get_client_is_reused_per_api_key(monkeypatch):
+    import planner
+
+    planner._client_for_key.cache_clear()
+    fake_genai = MagicMock()
+    fake_genai.Client.side_effect = lambda api_key: MagicMock(api_key=api_key)
+    monkeypatch.setattr(planner, "_genai", fake_genai)
+
+    monkeypatch.setenv("GEMINI_API_KEY", "key-1")
+    first = planner._get_client()
+    assert planner._get_client() is first
+    assert fake_genai.Client.call_count == 1
+
+    monkeypatch.setenv("GEMINI_API_KEY", "key-2")
+    assert planner._get_client().api_key == "key-2"
+
+    monkeypatch.delenv("GEMINI_API_KEY")
+    assert planner._get_client() is None
+    planner._client_for_key.cache_clear()
+
+def test_compress_feedback_strips_filler_and_keeps_tracebacks():
+    from planner import _compress_feedback
+
+    text = (
+        "Hi team,  I think the   checkout page is broken. Could you please fix it?\n"
+        "\n"
+        "Traceback (most recent call last):\n"
+        '  File "app.py", line 3, in <module>\n'
+        "ValueError: bad  value"
+    )
+    compressed = _compress_feedback(text)
+
+    assert compressed.startswith("team, the checkout page is broken. fix it?")
+    assert '  File "app.py", line 3, in <module>' in compressed
+    assert "ValueError: bad  value" in compressed
+    assert _compress_feedback("") == ""
+    assert _compress_feedback("\x1b[2m2024-01-15T10:30:00Z \x1b[1mcheckout  broken\x1b[0m") == "checkout broken"
+
+def test_serialize_feedback_tiers_by_recency_and_caps_budget(monkeypatch):
+    import planner
+    from datetime import timedelta
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = [
+        FeedbackItem(
+            id=UUID(int=i + 1), project_id="p1", source="manual",
+            title=f"Report {i}", body="x" * 1000,
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(10)
+    ]
+
+    text = planner._serialize_feedback(items)
+    sections = text.split("\n\n")
+    # Newest first; the newest 30% keep their full body, the rest are excerpts.
+    assert sections[0].startswith("--- Feedback 1 ---\nTitle: Report 9")
+    assert sections[2].endswith("x" * 1000)
+    assert sections[3].endswith("Body: " + "x" * planner._COMPACT_CONTENT_MAX)
+
+    monkeypatch.setattr(planner, "_SERIALIZATION_BUDGET", 2500)
+    capped = planner._serialize_feedback(items)
+    assert len(capped) <= 2500
+    assert "Report 9" in capped
+    assert "Report 0" not in capped
+
+def test_serialize_feedback_orders_naive_and_aware_timestamps():
+    import planner
+
+    aware = FeedbackItem(
+        id=UUID(int=1), project_id="p1", source="manual", title="Aware", body="a",
+        created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+    )
+    naive = FeedbackItem(
+        id=UUID(int=2), project_id="p1", source="manual", title="Naive", body="b",
+        created_at=datetime(2024, 1, 2),
+    )
+
+    text = planner._serialize_feedback([aware, naive])
+    assert text.index("Title: Naive") < text.index("Title: Aware")
+
+def test_generate_plan_reuses_cached_plan_for_unchanged_inputs():
+    cluster = IssueCluster(
+        id="c1", project_id="p1", title="Fix Bug", summary="Bad bug",
+        feedback_ids=["f1"], status="new", created_at=datetime.now(timezone.utc),
+        updated_at=datetime.now(timezone.utc)
+    )
+    feedback = FeedbackItem(
+        id=UUID("00000000-0000-0000-0000-000000000001"), project_id="p1",
+        source="manual", title="Report", body="It crashes",
+        created_at=datetime.now(timezone.utc)
+    )
+
+    with patch("planner._get_client") as mock_get_client:
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_response = MagicMock()
+        mock_response.parsed = {"title": "Cached", "description": "Once"}
+        mock_client.models.generate_content.return_value = mock_response
+
+        first = generate_plan(cluster, [feedback])
+        second = generate_plan(cluster, [feedback])
+        assert (second.title, second.description) == (first.title, first.description)
+        assert second.id != first.id
+        assert mock_client.models.generate_content.call_count == 1
+
+        regenerated = generate_plan(cluster, [feedback], use_cache=False)
+        assert regenerated.id != first.id
+        assert mock_client.models.generate_content.call_count == 2
+
+        changed = cluster.model_copy(update={"summary": "Different bug"})
+        generate_plan(changed, [feedback])
+        assert mock_client.models.generate_content.call_count == 3
+
+        retitled = cluster.model_copy(update={"title": "Fix Other Bug"})
+        generate_plan(retitled, [feedback])
+        assert mock_client.models.generate_content.call_count == 4
@@ -240,3 +240,58 @@ def test_posthog_webhook_missing_project_id():
 
     response = client.post("/ingest/posthog/webhook", json=payload)
     assert response.status_code == 400
+
+
+def test_posthog_event_types_cached_until_version_changes(project_context):
+    """Unchanged config is served from cache after reading only its version token."""
+    from unittest.mock import patch
+    import posthog_client
+    from posthog_client import get_posthog_event_types, set_posthog_event_types
+
+    pid = str(project_context["project_id"])
+    key = f"config:posthog:{pid}:event_types"
+    set_posthog_event_types(pid, ["$exception"])
+
+    with patch.object(posthog_client._STORE, "get", wraps=posthog_client._STORE.get) as store_get:
+        assert get_posthog_event_types(pid) == ["$exception"]
+        store_get.reset_mock()
+
+        types = get_posthog_event_types(pid)
+        assert types == ["$exception"]
+        assert [c.args[0] for c in store_get.call_args_list] == [f"{key}:v"]
+
+        types.append("mutated")
+        assert get_posthog_event_types(pid) == ["$exception"]
+
+        set_posthog_event_types(pid, ["$exception", "$error"])
+        assert get_posthog_event_types(pid) == ["$exception", "$error"]
+
+def test_posthog_event_body_strips_log_noise_but_keeps_stack_frames():
+    """ANSI codes, timestamp prefixes and padding are removed; stack frames stay verbatim."""
+    from posthog_client import posthog_event_to_feedback_item
+
+    event = {
+        "event": "$exception",
+        "uuid": "event-noise",
+        "properties": {
+            "$exception_message": "\x1b[31m2024-01-15T10:30:00Z   TypeError:    x is undefined\x1b[0m",
+            "$exception_stack_trace_raw": "    at render (/app/src/View.tsx:10:7)",
+        },
+        "timestamp": "2024-01-15T10:30:00Z",
+    }
+
+    item = posthog_event_to_feedback_item(event, "project-1")
+
+    assert item.title == "TypeError: x is undefined"
+    assert item.body == "TypeError: x is undefined\n\n    at render (/app/src/View.tsx:10:7)"
+
+
+def test_posthog_event_timestamp_parsing():
+    """Zulu timestamps parse to aware UTC datetimes; missing ones fall back to now."""
+    from posthog_client import posthog_event_to_feedback_item
+
+    item = posthog_event_to_feedback_item({"timestamp": "2024-01-15T10:30:00.123Z"}, "project-1")
+    assert item.created_at == datetime(2024, 1, 15, 10, 30, 0, 123000, tzinfo=timezone.utc)
+
+    for event in ({}, {"timestamp": None}, {"timestamp": "not-a-date"}):
+        assert posthog_event_to_feedback_item(event, "project-1").created_at.tzinfo is not None
@@ -14,7 +14,7 @@ optional project_id and uses it if provided.
 """
 
 from datetime import datetime, timezone
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from fastapi.testclient import TestClient
@@ -320,3 +320,47 @@ def test_project_id_mismatch_regression():
         json={"text": "Test"},
     )
     assert response.status_code == 200  # Not 404!
+
+
+def test_model_ids_are_normalized_to_str():
+    """UUID project/user ids are stored as str so scoping checks compare plain strings."""
+    from models import AgentJob, FeedbackItem, IssueCluster
+
+    pid = uuid4()
+    now = datetime.now(timezone.utc)
+
+    job = AgentJob(
+        id=uuid4(), project_id=pid, cluster_id="c1", status="pending",
+        created_at=now, updated_at=now,
+    )
+    item = FeedbackItem(
+        id=uuid4(), project_id=pid, source="manual", title="t", body="b", created_at=now,
+    )
+    cluster = IssueCluster(
+        id="c1", project_id=pid, title="t", summary="s", feedback_ids=[],
+        status="new", created_at=now, updated_at=now,
+    )
+    user = User(id=pid, created_at=now)
+    project = Project(id=pid, user_id=pid, name="p", created_at=now)
+
+    for value in (job.project_id, item.project_id, cluster.project_id, user.id, project.id):
+        assert value == str(pid)
+        assert isinstance(value, str)
+
+    # project_id strings are interned, so every model for a project shares one object
+    assert job.project_id is item.project_id is cluster.project_id
+
+
+def test_model_ids_reject_none():
+    """Only UUIDs are coerced to str; None and other non-str ids still fail validation."""
+    from pydantic import ValidationError
+
+    from models import FeedbackItem
+
+    with pytest.raises(ValidationError):
+        FeedbackItem(
+            id=uuid4(), project_id=None, source="manual", title="t", body="b",
+            created_at=datetime.now(timezone.utc),
+        )
+    with pytest.raises(ValidationError):
+        User(id=123, created_at=datetime.now(timezone.utc))
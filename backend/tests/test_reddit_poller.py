@@ -72,9 +72,9 @@ class TestRedditPoller(unittest.TestCase):
         assert session.get.call_count == 2  # retried after 429
         assert sleep.call_count >= 1
 
-    @patch("reddit_poller.requests.post")
-    def test_poll_once_posts_sent_to_backend(self, mock_post):
+    def test_poll_once_posts_sent_to_backend(self):
         session = MagicMock()
+        mock_post = session.post
         payload = {
             "data": {
                 "children": [
@@ -109,6 +109,66 @@ class TestRedditPoller(unittest.TestCase):
         assert body["external_id"] == "abc123"
         assert body["metadata"]["subreddit"] == "feedback"
 
+    def test_poll_once_posts_every_item_concurrently(self):
+        session = MagicMock()
+        children = [
+            {"data": {"id": f"p{i}", "title": f"Post {i}", "created_utc": 1698400800.0}}
+            for i in range(20)
+        ]
+        session.get.return_value = make_response({"data": {"children": children}})
+        session.post.return_value = make_response({}, status=200)
+
+        poller = RedditPoller(session=session, sleep_fn=lambda _: None)
+        poller.poll_once(["feedback"], backend_url="http://localhost:8000")
+
+        assert session.post.call_count == 20
+        posted = {call.kwargs["json"]["external_id"] for call in session.post.call_args_list}
+        assert posted == {f"p{i}" for i in range(20)}
+
+    def test_fetch_reddit_posts_across_subreddits_keeps_subreddit_order(self):
+        session = MagicMock()
+
+        def get(url, **_kwargs):
+            sub = url.split("/r/")[1].split("/")[0]
+            return make_response({"data": {"children": [{"data": {"id": f"{sub}-1", "subreddit": sub}}]}})
+
+        session.get.side_effect = get
+        poller = RedditPoller(session=session, sleep_fn=lambda _: None, sorts=["new"])
+
+        posts = poller.fetch_reddit_posts(["a", "b", "c", "d"])
+
+        assert [post["id"] for post in posts] == ["a-1", "b-1", "c-1", "d-1"]
+        assert session.get.call_count == 4
+
+    @patch("reddit_poller.time.monotonic_ns")
+    def test_throttle_sleeps_remaining_interval_per_subreddit(self, mock_now):
+        sleep = MagicMock()
+        poller = RedditPoller(session=MagicMock(), sleep_fn=sleep, throttle_seconds=1.0)
+
+        mock_now.return_value = 10_000_000_000
+        poller._throttle("a")
+        sleep.assert_not_called()
+
+        mock_now.return_value = 10_250_000_000
+        poller._throttle("a")
+        sleep.assert_called_once_with(0.75)
+        assert poller.last_request_at["a"] == 11_000_000_000
+
+        poller._throttle("b")  # other subreddits are not throttled by "a"
+        assert sleep.call_count == 1
+
+    @patch("reddit_poller.MAX_SEEN_POST_IDS", 2)
+    def test_seen_post_ids_evicts_oldest_when_full(self):
+        poller = RedditPoller(session=MagicMock(), sleep_fn=lambda _: None)
+        listing = lambda *ids: {"data": {"children": [{"data": {"id": i}} for i in ids]}}
+
+        poller._normalize_posts(listing("a", "b", "c"), "testsub")
+        assert list(poller.seen_post_ids) == ["b", "c"]
+
+        # "a" fell out of the dedup window, so it is treated as new again.
+        posts = poller._normalize_posts(listing("a", "c"), "testsub")
+        assert [post["id"] for post in posts] == ["a"]
+
 
 class TestModuleHelpers(unittest.TestCase):
     @patch("reddit_poller.requests.Session.get")
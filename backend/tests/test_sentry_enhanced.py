@@ -140,6 +140,20 @@ def test_sentry_signature_verification_invalid(project_context, disable_auto_clu
     assert len(items) == 0
 
 
+def test_sentry_signature_cached_key_state_is_not_mutated():
+    """Repeated verifications with the same secret keep matching fresh HMACs."""
+    from sentry_client import verify_sentry_signature
+
+    for secret in ("secret-a", "secret-b", "secret-a"):
+        for body in (b'{"a": 1}', b'{"b": 2}', b'{"a": 1}'):
+            expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            assert verify_sentry_signature(body, expected, secret)
+            assert not verify_sentry_signature(body + b" ", expected, secret)
+
+    assert verify_sentry_signature(b"{}", hmac.new(b"s", b"{}", hashlib.sha256).hexdigest().upper(), "s")
+    assert not verify_sentry_signature(b"{}", "not-hex", "s")
+
+
 def test_sentry_uses_issue_short_id_for_dedup(project_context, disable_auto_clustering):
     """Multiple events for same issue create only one FeedbackItem."""
     pid = project_context["project_id"]
@@ -235,3 +249,40 @@ def test_sentry_level_filter(project_context, disable_auto_clustering):
     assert len(items) == 1
     # Check that it's the error-level one
     assert items[0].metadata.get("level") == "error"
+
+
+def test_sentry_extractors_accept_unpacked_payload():
+    """Extractors give the same answers for a raw payload and its unpacked form."""
+    from sentry_client import (
+        extract_event_id,
+        extract_issue_short_id,
+        extract_sentry_metadata,
+        extract_sentry_stacktrace,
+        unpack_sentry_payload,
+    )
+
+    payloads = [
+        {
+            "data": {
+                "issue": {"id": "1", "short_id": "PROJ-1"},
+                "event": {
+                    "event_id": "evt-1",
+                    "level": "error",
+                    "environment": "production",
+                    "exception": {"values": [{"stacktrace": {"frames": [
+                        {"filename": "app.py", "lineno": 3, "function": "run"},
+                    ]}}]},
+                },
+            },
+        },
+        {"event_id": "evt-2", "level": "warning", "issue": {"short_id": "PROJ-2"}, "data": None},
+        {},
+    ]
+    for payload in payloads:
+        unpacked = unpack_sentry_payload(payload)
+        assert unpack_sentry_payload(unpacked) is unpacked
+        for extract in (extract_event_id, extract_issue_short_id, extract_sentry_metadata, extract_sentry_stacktrace):
+            assert extract(unpacked) == extract(payload)
+
+    assert extract_sentry_stacktrace(payloads[0]) == "  app.py:3 in run"
+    assert extract_issue_short_id(payloads[1]) == "PROJ-2"
@@ -319,3 +319,58 @@ def test_splunk_deduplication_by_sid(project_context):
     # Should only have one item
     items = get_all_feedback_items(str(pid))
     assert len(items) == 1
+
+
+def test_splunk_allowed_searches_cached_until_updated(project_context):
+    """The allowlist set is reused while its version is unchanged and refreshed on update."""
+    from unittest.mock import patch
+    import splunk_client
+    from splunk_client import is_search_allowed
+
+    pid = str(project_context["project_id"])
+    assert is_search_allowed("Anything", pid)
+
+    set_splunk_allowed_searches(pid, ["Critical Errors"])
+    assert is_search_allowed("Critical Errors", pid)
+
+    with patch.object(splunk_client, "get_splunk_allowed_searches") as get_searches:
+        assert is_search_allowed("Critical Errors", pid)
+        assert not is_search_allowed("Info Messages", pid)
+        get_searches.assert_not_called()
+
+    set_splunk_allowed_searches(pid, ["Info Messages"])
+    assert is_search_allowed("Info Messages", pid)
+    assert not is_search_allowed("Critical Errors", pid)
+
+
+def test_splunk_webhook_token_cached_and_invalidated_on_update(project_context):
+    """Token checks reuse the cached token; setting a new token takes effect immediately."""
+    from unittest.mock import patch
+    import splunk_client
+    from splunk_client import verify_token
+
+    pid = str(project_context["project_id"])
+    set_splunk_webhook_token(pid, "old_token")
+    assert verify_token("old_token", pid)
+
+    with patch.object(splunk_client, "get_splunk_webhook_token") as get_token:
+        assert verify_token("old_token", pid)
+        assert not verify_token("jeton-é", pid)
+        get_token.assert_not_called()
+
+    set_splunk_webhook_token(pid, "new_token")
+    assert verify_token("new_token", pid)
+    assert not verify_token("old_token", pid)
+
+
+def test_splunk_time_parsing():
+    """Integer and fractional epoch strings parse; bad values fall back to now."""
+    from splunk_client import splunk_alert_to_feedback_item
+
+    def created(time_value):
+        return splunk_alert_to_feedback_item({"result": {"_time": time_value}, "sid": "s"}, "p").created_at
+
+    assert created("1705315800") == datetime(2024, 1, 15, 10, 50, tzinfo=timezone.utc)
+    assert created("1705315800.5") == datetime(2024, 1, 15, 10, 50, 0, 500000, tzinfo=timezone.utc)
+    for bad in ("not-a-time", "inf", None):
+        assert created(bad).tzinfo is not None
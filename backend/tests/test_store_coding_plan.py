@@ -2,7 +2,7 @@ import pytest
 from uuid import UUID
 from datetime import datetime, timezone
 from models import CodingPlan
-from store import InMemoryStore
+from store import InMemoryStore, RedisStore
 
 
 def test_coding_plan_storage():
@@ -90,3 +90,30 @@ def test_coding_plan_requires_project_id():
 
     with pytest.raises(ValueError, match="project_id is required"):
         store.add_coding_plan(plan)
+
+
+def test_redis_store_caches_coding_plans(monkeypatch, fake_redis):
+    redis_store = RedisStore()
+
+    now = datetime.now(timezone.utc)
+    plan = CodingPlan(
+        id="plan-1", project_id="proj-1", cluster_id="c1", title="Fix", description="",
+        created_at=now, updated_at=now,
+    )
+    redis_store.add_coding_plan(plan)
+    fake_redis.delete(redis_store._coding_plan_key("proj-1", "c1"))
+    assert redis_store.get_coding_plan("proj-1", "c1") is plan
+
+    redis_store.clear_coding_plan_cache()
+    assert redis_store.get_coding_plan("proj-1", "c1") is None
+
+    redis_store.add_coding_plan(plan)
+    redis_store.clear_coding_plan_cache()
+    loaded = redis_store.get_coding_plan("proj-1", "c1")
+    assert loaded == plan
+    assert redis_store.get_coding_plan("proj-1", "c1") is loaded
+
+    monkeypatch.setattr("store.CODING_PLAN_CACHE_TTL_SECONDS", -1.0)
+    redis_store.add_coding_plan(plan.model_copy(update={"title": "Stale"}))
+    fake_redis.set(redis_store._coding_plan_key("proj-1", "c1"), plan.model_dump_json())
+    assert redis_store.get_coding_plan("proj-1", "c1").title == "Fix"
@@ -0,0 +1,287 @@
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from models import FeedbackItem, IssueCluster
+from store import InMemoryStore, RedisStore
+
+
+def _item(project_id="proj-1", external_id=None):
+    return FeedbackItem(
+        id=uuid4(),
+        project_id=project_id,
+        source="manual",
+        external_id=external_id,
+        title="Title",
+        body="Body",
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_feedback_lookup_accepts_uuid_or_str_ids():
+    store = InMemoryStore()
+    item = store.add_feedback_item(_item(external_id="ext-1"))
+
+    assert store.get_feedback_item("proj-1", item.id) is item
+    assert store.get_feedback_item("proj-1", str(item.id)) is item
+    assert store.get_feedback_item("proj-2", item.id) is None
+    assert store.get_feedback_by_external_id("proj-1", "manual", "ext-1") is item
+    assert store.get_unclustered_feedback("proj-1") == [item]
+
+    updated = store.update_feedback_item("proj-1", str(item.id), title="New")
+    assert store.get_feedback_item("proj-1", item.id) is updated
+
+    store.remove_from_unclustered(item.id, "proj-1")
+    assert store.get_unclustered_feedback("proj-1") == []
+
+    assert store.delete_feedback_item("proj-1", str(item.id))
+    assert store.get_feedback_item("proj-1", item.id) is None
+    assert store.get_feedback_by_external_id("proj-1", "manual", "ext-1") is None
+
+
+def test_add_feedback_items_batch_dedupes_by_external_id():
+    store = InMemoryStore()
+    first = store.add_feedback_item(_item(external_id="ext-1"))
+    dup_existing = _item(external_id="ext-1")
+    fresh = _item(external_id="ext-2")
+    dup_fresh = _item(external_id="ext-2")
+    plain = _item()
+
+    stored = store.add_feedback_items_batch([dup_existing, fresh, dup_fresh, plain])
+
+    assert stored == [first, fresh, fresh, plain]
+    assert {item.id for item in store.get_all_feedback_items("proj-1")} == {first.id, fresh.id, plain.id}
+    assert {item.id for item in store.get_unclustered_feedback("proj-1")} == {first.id, fresh.id, plain.id}
+
+
+def test_project_indexes_scope_reads_and_clears():
+    from models import IssueCluster
+
+    store = InMemoryStore()
+    a1, b1, a2 = _item("proj-a"), _item("proj-b"), _item("proj-a")
+    for item in (a1, b1, a2):
+        store.add_feedback_item(item)
+    now = datetime.now(timezone.utc)
+    for cid, pid in (("c1", "proj-a"), ("c2", "proj-b")):
+        store.add_cluster(IssueCluster(
+            id=cid, project_id=pid, title="T", summary="S", feedback_ids=[],
+            status="new", created_at=now, updated_at=now,
+        ))
+
+    assert store.get_all_feedback_items("proj-a") == [a1, a2]
+    assert [c.id for c in store.get_all_clusters("proj-b")] == ["c2"]
+
+    store.delete_feedback_item("proj-a", a1.id)
+    assert store.get_all_feedback_items("proj-a") == [a2]
+
+    ext_a, ext_b = _item("proj-a", external_id="e"), _item("proj-b", external_id="e")
+    store.add_feedback_item(ext_a)
+    store.add_feedback_item(ext_b)
+
+    store.clear_feedback_items("proj-a")
+    store.clear_clusters("proj-a")
+    assert store.get_feedback_by_external_id("proj-a", "manual", "e") is None
+    assert store.get_feedback_by_external_id("proj-b", "manual", "e") is ext_b
+    assert store.get_unclustered_feedback("proj-a") == []
+    assert store.get_all_feedback_items("proj-a") == []
+    assert store.get_all_clusters("proj-a") == []
+    assert store.get_all_feedback_items("proj-b") == [b1, ext_b]
+    assert [c.id for c in store.get_all_clusters("proj-b")] == ["c2"]
+
+
+def test_jobs_by_cluster_index_follows_adds_and_updates():
+    from models import AgentJob
+
+    store = InMemoryStore()
+    now = datetime.now(timezone.utc)
+
+    def _job(cluster_id):
+        return AgentJob(
+            id=uuid4(), project_id="proj-1", cluster_id=cluster_id,
+            status="pending", created_at=now, updated_at=now,
+        )
+
+    a, b, c = store.add_job(_job("c1")), store.add_job(_job("c1")), store.add_job(_job("c2"))
+    assert store.get_jobs_by_cluster("c1") == [a, b]
+    assert store.get_jobs_by_cluster("missing") == []
+
+    moved = store.update_job(b.id, cluster_id="c2")
+    assert store.get_jobs_by_cluster("c1") == [a]
+    assert store.get_jobs_by_cluster("c2") == [c, moved]
+    page, _, has_more = store.get_jobs_page_by_cluster("c2", "proj-1", 0, 10)
+    assert {j.id for j in page} == {c.id, b.id} and not has_more
+    assert store.get_jobs_page_by_cluster("c2", "proj-2", 0, 10)[0] == []
+
+    store.add_job(a.model_copy(update={"cluster_id": "c3"}))
+    assert store.get_jobs_by_cluster("c1") == []
+    assert [j.id for j in store.get_jobs_by_cluster("c3")] == [a.id]
+
+    store.clear_jobs()
+    assert store.get_jobs_by_cluster("c2") == []
+
+
+def test_cluster_jobs_listed_most_recent_first():
+    from models import ClusterJob
+
+    store = InMemoryStore()
+    now = datetime.now(timezone.utc)
+    for job_id in ("j1", "j2", "j3"):
+        store.add_cluster_job(ClusterJob(id=job_id, project_id="proj-1", status="pending", created_at=now))
+
+    assert [j.id for j in store.list_cluster_jobs("proj-1")] == ["j3", "j2", "j1"]
+    assert [j.id for j in store.list_cluster_jobs("proj-1", limit=2)] == ["j3", "j2"]
+    assert store.list_cluster_jobs("proj-2") == []
+
+    store.update_cluster_job("proj-1", "j1", status="running")
+    assert [j.id for j in store.list_cluster_jobs("proj-1")] == ["j1", "j3", "j2"]
+    assert store.list_cluster_jobs("proj-1", limit=1)[0].status == "running"
+
+
+def test_in_memory_cluster_lock_is_exclusive_per_project():
+    store = InMemoryStore()
+
+    assert store.acquire_cluster_lock("proj-1", "job-a")
+    assert not store.acquire_cluster_lock("proj-1", "job-b")
+    assert store.acquire_cluster_lock("proj-2", "job-b")
+
+    store.release_cluster_lock("proj-1", "job-b")
+    assert not store.acquire_cluster_lock("proj-1", "job-b")
+    store.release_cluster_lock("proj-1", "job-a")
+    assert store.acquire_cluster_lock("proj-1", "job-b")
+
+
+def test_count_unclustered_feedback_reads_set_size():
+    store = InMemoryStore()
+    first = store.add_feedback_item(_item())
+    store.add_feedback_item(_item())
+    store.add_feedback_item(_item(project_id="proj-2"))
+
+    assert store.count_unclustered_feedback("proj-1") == 2
+    store.remove_from_unclustered(first.id, "proj-1")
+    assert store.count_unclustered_feedback("proj-1") == 1
+    assert store.count_unclustered_feedback("missing") == 0
+
+
+def test_add_feedback_to_cluster_replaces_frozen_cluster():
+    store = InMemoryStore()
+    now = datetime.now(timezone.utc)
+    cluster = store.add_cluster(
+        IssueCluster(
+            id=str(uuid4()),
+            project_id="proj-1",
+            title="Export issues",
+            summary="Crashes during export",
+            feedback_ids=["a"],
+            status="new",
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    store.add_feedback_to_cluster("proj-1", cluster.id, "b")
+    store.add_feedback_to_cluster("proj-1", cluster.id, "b")
+
+    assert cluster.feedback_ids == ["a"]
+    assert store.get_cluster("proj-1", cluster.id).feedback_ids == ["a", "b"]
+
+
+def test_redis_store_delete_feedback_items_batch(monkeypatch, fake_redis):
+    redis_store = RedisStore()
+
+    items = [
+        FeedbackItem(
+            id=uuid4(), project_id=pid, source="github", external_id=f"ext-{i}",
+            title="T", body="", created_at=datetime.now(timezone.utc),
+        )
+        for i, pid in enumerate(["proj-1", "proj-1", "proj-2"])
+    ]
+    redis_store.add_feedback_items_batch(items)
+
+    monkeypatch.setattr("store.DELETE_BATCH_SIZE", 1)
+    assert redis_store.delete_feedback_items_batch([(i.project_id, i.id, i) for i in items[:2]]) == 2
+    assert redis_store.get_all_feedback_items("proj-1") == []
+    assert redis_store.get_unclustered_feedback("proj-1") == []
+    assert redis_store.get_feedback_by_external_id("proj-1", "github", "ext-0") is None
+    assert redis_store.get_all_feedback_items("proj-2") == [items[2]]
+
+
+def test_redis_store_loads_jobs_in_one_batch(monkeypatch, fake_redis):
+    from datetime import timedelta
+    from models import AgentJob
+
+    redis_store = RedisStore()
+
+    now = datetime.now(timezone.utc)
+    jobs = [
+        redis_store.add_job(AgentJob(
+            id=uuid4(), project_id=pid, cluster_id="c1", status="pending",
+            created_at=now + timedelta(seconds=i), updated_at=now,
+        ))
+        for i, pid in enumerate(["proj-1", "proj-2", "proj-1"])
+    ]
+    fake_redis.set(f"job:{jobs[0].id}:logs", "not a hash")
+    fetched = []
+    monkeypatch.setattr(redis_store, "_hgetall_batch", lambda keys: fetched.append(keys) or RedisStore._hgetall_batch(redis_store, keys))
+
+    assert redis_store.get_all_jobs_for_project("proj-1") == [jobs[2], jobs[0]]
+    assert redis_store.get_jobs_by_cluster("c1") == jobs[::-1]
+    assert redis_store.get_jobs_page_by_cluster("c1", "proj-2", 0, 2) == ([jobs[1]], 2, True)
+    assert len(fetched) == 3
+
+    fake_redis._hashes[redis_store._job_key(jobs[0].id)]["created_at"] = "garbage"
+    assert redis_store.get_all_jobs_for_project("proj-1") == [jobs[2]]
+    assert redis_store.get_jobs_by_cluster("c1") == [jobs[2], jobs[1]]
+    assert redis_store.get_all_jobs() == [jobs[2], jobs[1]]
+
+
+def test_redis_store_feedback_hash_is_string_encoded(fake_redis):
+    redis_store = RedisStore()
+
+    created = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    item = FeedbackItem(
+        id=uuid4(), project_id="proj-1", source="github", external_id="ext-1", title="T", body="B",
+        metadata={"labels": ["bug"]}, created_at=created, github_issue_number=7,
+    )
+    redis_store.add_feedback_item(item)
+
+    stored = fake_redis._hashes[redis_store._feedback_key("proj-1", item.id)]
+    assert stored == {
+        "id": str(item.id), "project_id": "proj-1", "source": "github", "external_id": "ext-1",
+        "title": "T", "body": "B", "metadata": stored["metadata"],
+        "created_at": created.isoformat(), "github_issue_number": "7",
+    }
+    assert json.loads(stored["metadata"]) == {"labels": ["bug"]}
+    assert redis_store.get_feedback_item("proj-1", item.id) == item
+
+
+def test_redis_store_get_all_feedback_skips_invalid_rows(fake_redis):
+    redis_store = RedisStore()
+
+    project_id = "proj-1"
+    items = [
+        FeedbackItem(
+            id=uuid4(), project_id=project_id, source="github", external_id=f"ext-{i}",
+            title=f"Item {i}", body="", metadata={"n": i}, created_at=datetime.now(timezone.utc),
+        )
+        for i in range(3)
+    ]
+    redis_store.add_feedback_items_batch(items)
+    assert [i.id for i in redis_store.get_all_feedback_items(project_id)] == [i.id for i in items]
+
+    fake_redis._hashes[redis_store._feedback_key(project_id, items[1].id)]["source"] = "not-a-source"
+    loaded = redis_store.get_all_feedback_items(project_id)
+    assert [i.id for i in loaded] == [items[0].id, items[2].id]
+    assert loaded[1].metadata == {"n": 2}
+
+
+def test_redis_store_get_unclustered_feedback_prunes_missing_hashes(fake_redis):
+    redis_store = RedisStore()
+
+    project_id = "proj-1"
+    items = [_item(project_id=project_id) for _ in range(2)]
+    redis_store.add_feedback_items_batch(items)
+    fake_redis.delete(redis_store._feedback_key(project_id, items[0].id))
+    assert redis_store.count_unclustered_feedback(project_id) == 2
+
+    assert [i.id for i in redis_store.get_unclustered_feedback(project_id)] == [items[1].id]
+    assert redis_store.count_unclustered_feedback(project_id) == 1
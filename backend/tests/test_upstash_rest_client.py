@@ -0,0 +1,157 @@
+"""Tests for the Upstash REST client batching helpers (no network)."""
+
+from unittest.mock import MagicMock
+
+from store import UpstashRESTClient
+
+
+def _client_with_pipeline_results(results):
+    client = UpstashRESTClient("http://fake-url", "fake-token")
+    client.pipeline_exec = MagicMock(return_value=results)
+    return client
+
+
+def test_pipeline_sends_queued_commands_in_one_request():
+    client = _client_with_pipeline_results([1, ["f", "v"], None, ["m"]])
+
+    pipe = client.pipeline()
+    pipe.hset("h", mapping={"f": 1})
+    pipe.hgetall("h")
+    pipe.get("missing")
+    pipe.smembers("s")
+    results = pipe.execute()
+
+    client.pipeline_exec.assert_called_once_with(
+        [["HSET", "h", "f", "1"], ["HGETALL", "h"], ["GET", "missing"], ["SMEMBERS", "s"]]
+    )
+    assert results == [1, {"f": "v"}, None, ["m"]]
+
+
+def test_pipeline_context_manager_flushes_on_exit():
+    client = _client_with_pipeline_results([1, 1])
+
+    with client.pipeline() as pipe:
+        pipe.zadd("z", {"member": 1.5})
+        pipe.zrem("z", "old")
+        client.pipeline_exec.assert_not_called()
+
+    client.pipeline_exec.assert_called_once_with([["ZADD", "z", "1.5", "member"], ["ZREM", "z", "old"]])
+
+
+def test_hgetall_batch_parses_hashes_and_skips_bad_replies():
+    client = _client_with_pipeline_results([["a", "1", "b", "2"], [], ["odd"]])
+
+    assert client.hgetall_batch(["k1", "k2", "k3"]) == [{"a": "1", "b": "2"}, {}, {}]
+
+
+def test_rest_session_pool_sized_for_request_threadpool():
+    from store import REST_POOL_MAXSIZE
+
+    client = UpstashRESTClient("https://fake-url", "fake-token")
+
+    assert client.session.get_adapter("https://fake-url")._pool_maxsize == REST_POOL_MAXSIZE
+
+
+def test_mget_and_mset_use_single_commands():
+    from unittest.mock import patch
+
+    client = UpstashRESTClient("http://fake-url", "fake-token")
+    with patch.object(UpstashRESTClient, "_cmd", return_value=["1", None]) as cmd:
+        assert client.mget(["a", "b"]) == ["1", None]
+        cmd.assert_called_once_with("MGET", "a", "b")
+
+        cmd.reset_mock()
+        client.mset({"a": "1", "b": "2"})
+        cmd.assert_called_once_with("MSET", "a", "1", "b", "2")
+
+        cmd.reset_mock()
+        assert client.mget([]) == []
+        cmd.assert_not_called()
+
+
+def test_cmd_and_pipeline_exec_round_trip_json_bytes():
+    import json
+
+    client = UpstashRESTClient("http://fake-url", "fake-token")
+    client.session = MagicMock()
+    client.session.post.return_value.content = b'{"result": "caf\\u00e9"}'
+
+    assert client._cmd("GET", "k") == "café"
+    kwargs = client.session.post.call_args.kwargs
+    assert json.loads(kwargs["data"]) == ["GET", "k"]
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    client.session.post.return_value.content = b'[{"result": "OK"}, {"result": null}]'
+    assert client.pipeline_exec([["SET", "k", "v"], ["GET", "x"]]) == ["OK", None]
+    assert client.session.post.call_args.args[0] == "http://fake-url/pipeline"
+
+
+def test_rest_session_is_lazy_and_shared_per_endpoint():
+    first = UpstashRESTClient("https://shared-url", "token-a")
+    second = UpstashRESTClient("https://shared-url/", "token-b")
+    other = UpstashRESTClient("https://other-url", "token-a")
+
+    assert first._session is None
+    assert first.session is second.session
+    assert first.session is not other.session
+
+
+def test_rest_store_writes_feedback_in_one_pipeline(monkeypatch):
+    from datetime import datetime, timezone
+    from uuid import uuid4
+
+    from models import FeedbackItem
+    from store import RedisStore
+
+    client = _client_with_pipeline_results([1, 1, 1, 1, "OK"])
+    monkeypatch.setattr("store._redis_client_from_env", lambda: None)
+    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: client)
+    rest_store = RedisStore()
+
+    item = FeedbackItem(
+        id=uuid4(), project_id="p1", source="sentry", external_id="ext-1",
+        title="t", body="b", created_at=datetime.now(timezone.utc),
+    )
+    rest_store.add_feedback_item(item)
+
+    (commands,), _ = client.pipeline_exec.call_args
+    assert client.pipeline_exec.call_count == 1
+    assert [c[0] for c in commands] == ["HSET", "ZADD", "ZADD", "SADD", "SET"]
+    assert commands[-1] == ["SET", "feedback:external:p1:sentry:ext-1", str(item.id)]
+
+
+def test_rest_store_job_log_page_and_archive_reads(monkeypatch):
+    from uuid import uuid4
+
+    from store import RedisStore
+
+    client = _client_with_pipeline_results([["a\n", "b\n"], 5])
+    monkeypatch.setattr("store._redis_client_from_env", lambda: None)
+    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: client)
+    rest_store = RedisStore()
+
+    job_id = uuid4()
+    key = rest_store._job_logs_key(job_id)
+    assert rest_store.get_job_logs(job_id, cursor=1, limit=2) == (["a\n", "b\n"], 3, True)
+    client.pipeline_exec.assert_called_once_with([["LRANGE", key, "1", "2"], ["LLEN", key]])
+
+    client.lrange = MagicMock(return_value=[])
+    assert rest_store.archive_job_logs_to_blob(job_id) is None
+    client.lrange.assert_called_once_with(key, 0, -1)
+
+
+def test_rest_store_counts_user_feedback_in_one_pipeline(monkeypatch):
+    from store import RedisStore
+
+    client = _client_with_pipeline_results([3, 4])
+    client.smembers = MagicMock(return_value=["p1", "p2"])
+    client.scard = MagicMock(return_value=5)
+    monkeypatch.setattr("store._redis_client_from_env", lambda: None)
+    monkeypatch.setattr("store._upstash_rest_client_from_env", lambda: client)
+    rest_store = RedisStore()
+
+    assert rest_store.count_feedback_items_for_user("u1") == 7
+    client.pipeline_exec.assert_called_once_with([["ZCARD", "feedback:created:p1"], ["ZCARD", "feedback:created:p2"]])
+
+    assert rest_store.count_unclustered_feedback("p1") == 5
+    client.scard.assert_called_once_with("feedback:unclustered:p1")
@@ -0,0 +1,12 @@
+"""Shared helpers for stripping terminal and log noise from feedback text."""
+
+import re
+
+# Terminal color codes and per-line ISO timestamps carry no meaning for triage or the model.
+LOG_NOISE_PATTERN = r"^(?:\x1b\[[0-9;]*m)*\d{4}-\d{2}-\d{2}T\S+\s+|\x1b\[[0-9;]*m"
+_LOG_NOISE_RE = re.compile(LOG_NOISE_PATTERN)
+
+
+def strip_log_noise(line: str) -> str:
+    """Remove ANSI color codes and a leading ISO timestamp from a single line of text."""
+    return _LOG_NOISE_RE.sub("", line)